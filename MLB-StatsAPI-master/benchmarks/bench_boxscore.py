@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""Benchmark building boxscore_data() results.
+
+Compares, per boxscore, building every table eagerly (as boxscore_data() used
+to) with the lazy BoxscoreData when the caller reads only the raw sections
+(battingOrder, pitchers and playerInfo, like pages/game_view.py) or a single
+derived table.
+
+Pass recorded game responses as JSON files, or cassettes recorded with
+statsapi.use_cassette(). Without arguments a synthetic game is used.
+
+    python benchmarks/bench_boxscore.py [--number N] [GAME_OR_CASSETTE ...]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from statsapi import boxdata, cassette  # noqa: E402
+
+
+def synthetic_game(batters=14, pitchers=7):
+    """Return a game endpoint response with the fields boxscore_data() requests."""
+    game = {
+        "gameData": {
+            "game": {"id": "2025/04/01/nyamlb-bosmlb-1"},
+            "teams": {"away": {"teamName": "Yankees"}, "home": {"teamName": "Red Sox"}},
+            "players": {},
+        },
+        "liveData": {
+            "boxscore": {"teams": {}, "info": [{"label": "T", "value": "2:51."}]}
+        },
+    }
+    person_id = 100000
+    for side in boxdata.SIDES:
+        players = {}
+        batter_ids = []
+        pitcher_ids = []
+        for i in range(batters + pitchers):
+            person_id += 1
+            key = "ID{}".format(person_id)
+            game["gameData"]["players"][key] = {"boxscoreName": "Player {}".format(i)}
+            player = {
+                "person": {"id": person_id},
+                "position": {"abbreviation": "P" if i >= batters else "SS"},
+                "stats": {"batting": {}, "pitching": {}},
+                "seasonStats": {
+                    "batting": {
+                        "avg": ".250",
+                        "ops": ".700",
+                        "obp": ".320",
+                        "slg": ".380",
+                    },
+                    "pitching": {"era": "3.50"},
+                },
+            }
+            if i < batters:
+                player["battingOrder"] = str((i % 9 + 1) * 100 + i // 9)
+                player["stats"]["batting"] = {
+                    stat: 1 for _, stat in boxdata._BATTER_STATS
+                }
+                batter_ids.append(person_id)
+            else:
+                player["stats"]["pitching"] = dict(
+                    {stat: 1 for _, stat in boxdata._PITCHER_STATS},
+                    strikes=10,
+                    pitchesThrown=15,
+                )
+                pitcher_ids.append(person_id)
+            players[key] = player
+        game["liveData"]["boxscore"]["teams"][side] = {
+            "team": {"id": 1},
+            "teamStats": {
+                "batting": {stat: 5 for _, stat in boxdata._BATTER_STATS},
+                "pitching": {stat: 5 for _, stat in boxdata._PITCHER_STATS},
+            },
+            "players": players,
+            "batters": batter_ids,
+            "pitchers": pitcher_ids,
+            "battingOrder": batter_ids[:9],
+            "note": [{"label": "a", "value": "Singled for X in the 7th."}],
+        }
+    return game
+
+
+def load_games(paths):
+    games = []
+    for path in paths:
+        if ".cassette" in os.path.basename(path):
+            c = cassette.Cassette(path)
+            for key, recorded in c.interactions.items():
+                if "/feed/live" in key:
+                    games.extend(
+                        (key, json.loads(r["body"]))
+                        for r in recorded
+                        if r["encoding"] == "utf-8" and r["status"] == 200
+                    )
+        else:
+            with open(path) as f:
+                games.append((path, json.load(f)))
+    return games
+
+
+def read_raw(box):
+    box["home"]["battingOrder"], box["away"]["pitchers"], box["playerInfo"]
+
+
+SCENARIOS = [
+    ("eager (all tables)", lambda r: boxdata.BoxscoreData(r).to_dict()),
+    ("lazy, raw sections", lambda r: read_raw(boxdata.BoxscoreData(r))),
+    ("lazy, homeBatters", lambda r: boxdata.BoxscoreData(r)["homeBatters"]),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="game responses or cassette files")
+    parser.add_argument("--number", type=int, default=2000, help="builds per game")
+    args = parser.parse_args()
+
+    games = load_games(args.paths) if args.paths else []
+    if not games:
+        games = [("synthetic game", synthetic_game())]
+
+    for name, r in games:
+        print(name)
+        for label, fn in SCENARIOS:
+            seconds = timeit.timeit(lambda: fn(r), number=args.number)
+            print("  {:<22} {:>8.2f} us".format(label, seconds / args.number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+"""Microbenchmark for building request URLs.
+
+Compares the per-call cost of the original URL builder, which scanned params
+against the raw ENDPOINTS dicts and formatted debug messages unconditionally,
+with the compiled endpoints in statsapi.urls.
+
+    python benchmarks/bench_build_url.py [--number N]
+"""
+import argparse
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from statsapi import endpoints, urls  # noqa: E402
+
+logger = logging.getLogger("statsapi")
+
+CASES = [
+    (
+        "schedule",
+        {
+            "date": "2025-04-01",
+            "sportId": "1",
+            "teamId": "143",
+            "hydrate": "decisions,probablePitcher(note),linescore,broadcasts,game(content(media(epg))),seriesStatus",
+        },
+    ),
+    (
+        "game",
+        {
+            "gamePk": 778440,
+            "fields": "gameData,game,teams,teamName,shortName,liveData,boxscore,players,id,fullName",
+        },
+    ),
+    (
+        "person",
+        {
+            "personId": 592450,
+            "hydrate": "stats(group=[hitting,pitching,fielding],type=season,sportId=1),currentTeam",
+        },
+    ),
+    ("team_roster", {"teamId": 143, "rosterType": "active", "season": 2025}),
+    ("meta", {"type": "pitchTypes"}),
+]
+
+
+def legacy_build_url(endpoint, params={}, force=False):
+    """The URL building code from statsapi.get() before endpoints were compiled."""
+    # Lookup endpoint from input parameter
+    ep = endpoints.ENDPOINTS.get(endpoint)
+    if not ep:
+        raise ValueError("Invalid endpoint (" + str(endpoint) + ").")
+
+    url = ep["url"]
+    logger.debug("URL: {}".format(url))
+
+    path_params = {}
+    query_params = {}
+
+    # Parse parameters into path and query parameters, and discard invalid parameters
+    for p, pv in params.items():
+        if ep["path_params"].get(p):
+            logger.debug("Found path param: {}".format(p))
+            if ep["path_params"][p].get("type") == "bool":
+                if str(pv).lower() == "false":
+                    path_params.update({p: ep["path_params"][p].get("False", "")})
+                elif str(pv).lower() == "true":
+                    path_params.update({p: ep["path_params"][p].get("True", "")})
+            else:
+                path_params.update({p: str(pv)})
+        elif p in ep["query_params"]:
+            logger.debug("Found query param: {}".format(p))
+            query_params.update({p: str(pv)})
+        else:
+            if force:
+                logger.debug(
+                    "Found invalid param, forcing into query parameters per force flag: {}".format(
+                        p
+                    )
+                )
+                query_params.update({p: str(pv)})
+            else:
+                logger.debug("Found invalid param, ignoring: {}".format(p))
+
+    logger.debug("path_params: {}".format(path_params))
+    logger.debug("query_params: {}".format(query_params))
+
+    # Replace path parameters with their values
+    for k, v in path_params.items():
+        logger.debug("Replacing {%s}" % k)
+        url = url.replace(
+            "{" + k + "}",
+            ("/" if ep["path_params"][k]["leading_slash"] else "")
+            + v
+            + ("/" if ep["path_params"][k]["trailing_slash"] else ""),
+        )
+        logger.debug("URL: {}".format(url))
+
+    while url.find("{") != -1 and url.find("}") > url.find("{"):
+        param = url[url.find("{") + 1 : url.find("}")]
+        if ep.get("path_params", {}).get(param, {}).get("required"):
+            if (
+                ep["path_params"][param]["default"]
+                and ep["path_params"][param]["default"] != ""
+            ):
+                logger.debug(
+                    "Replacing {%s} with default: %s."
+                    % (param, ep["path_params"][param]["default"])
+                )
+                url = url.replace(
+                    "{" + param + "}",
+                    ("/" if ep["path_params"][param]["leading_slash"] else "")
+                    + ep["path_params"][param]["default"]
+                    + ("/" if ep["path_params"][param]["trailing_slash"] else ""),
+                )
+            else:
+                if force:
+                    logger.warning(
+                        "Missing required path parameter {%s}, proceeding anyway per force flag..."
+                        % param
+                    )
+                else:
+                    raise ValueError("Missing required path parameter {%s}" % param)
+        else:
+            logger.debug("Removing optional param {%s}" % param)
+            url = url.replace("{" + param + "}", "")
+
+        logger.debug("URL: {}".format(url))
+    # Add query parameters to the URL
+    if len(query_params) > 0:
+        for k, v in query_params.items():
+            logger.debug("Adding query parameter {}={}".format(k, v))
+            sep = "?" if url.find("?") == -1 else "&"
+            url += sep + k + "=" + v
+            logger.debug("URL: {}".format(url))
+
+    # Make sure required parameters are present
+    satisfied = False
+    missing_params = []
+    for x in ep.get("required_params", []):
+        if len(x) == 0:
+            satisfied = True
+        else:
+            missing_params.extend([a for a in x if a not in query_params])
+            if len(missing_params) == 0:
+                satisfied = True
+                break
+
+    if not satisfied and not force:
+        if ep.get("note"):
+            note = "\n--Endpoint note: " + ep.get("note")
+        else:
+            note = ""
+
+        raise ValueError(
+            "Missing required parameter(s): "
+            + ", ".join(missing_params)
+            + ".\n--Required parameters for the "
+            + endpoint
+            + " endpoint: "
+            + str(ep.get("required_params", []))
+            + ". \n--Note: If there are multiple sets in the required parameter list, you can choose any of the sets."
+            + note
+        )
+
+    return url
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    for name, build in [("legacy", legacy_build_url), ("compiled", urls.build_url)]:
+        elapsed = timeit.timeit(
+            lambda: [build(e, p) for e, p in CASES], number=args.number
+        )
+        per_call = elapsed / (args.number * len(CASES)) * 1e6
+        print("{:<10} {:8.2f} us per URL".format(name, per_call))
+
+
+if __name__ == "__main__":
+    main()
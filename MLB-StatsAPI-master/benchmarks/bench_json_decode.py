@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+"""Benchmark JSON decoders on full game feeds.
+
+Reports the time to decode each feed and the peak memory allocated while
+decoding (measured with tracemalloc) for every decoder in
+statsapi.decoder.DECODERS, and for extracting only the boxscore pitcher lists
+with statsapi.stream (with ijson when installed, and the built-in scanner).
+
+Pass recorded feeds as JSON files, or cassettes recorded with
+statsapi.use_cassette() (every game feed response in them is used). Without
+arguments a synthetic feed with a nine inning game of plays is used.
+
+    python benchmarks/bench_json_decode.py [--number N] [FEED_OR_CASSETTE ...]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from statsapi import cassette, decoder, stream  # noqa: E402
+
+NARROW_PATHS = [
+    "liveData.boxscore.teams.away.pitchers",
+    "liveData.boxscore.teams.home.pitchers",
+]
+
+
+def synthetic_feed(plays=320, pitches_per_play=4, players=60, seed=1):
+    """Return the body of a feed/live-shaped payload of roughly 1 MB."""
+    rng = random.Random(seed)
+
+    def pitch(i):
+        return {
+            "details": {
+                "call": {"code": "B", "description": "Ball"},
+                "description": "Ball",
+                "code": "B",
+                "ballColor": "rgba(39, 161, 39, 1.0)",
+                "isInPlay": False,
+                "isStrike": False,
+                "isBall": True,
+                "type": {"code": "FF", "description": "Four-Seam Fastball"},
+            },
+            "count": {"balls": i % 4, "strikes": i % 3, "outs": i % 3},
+            "pitchData": {
+                "startSpeed": round(rng.uniform(78, 101), 1),
+                "endSpeed": round(rng.uniform(70, 92), 1),
+                "strikeZoneTop": 3.49,
+                "strikeZoneBottom": 1.6,
+                "coordinates": {
+                    k: round(rng.uniform(-50, 200), 2)
+                    for k in ("aY", "aZ", "pfxX", "pfxZ", "pX", "pZ", "vX0", "vY0")
+                },
+                "breaks": {"spinRate": rng.randint(1800, 2600), "spinDirection": 205},
+            },
+            "index": i,
+            "playId": "%032x" % rng.getrandbits(128),
+            "pitchNumber": i + 1,
+            "startTime": "2025-04-01T23:10:33.519Z",
+            "isPitch": True,
+            "type": "pitch",
+        }
+
+    all_plays = []
+    for p in range(plays):
+        all_plays.append(
+            {
+                "result": {
+                    "type": "atBat",
+                    "event": "Groundout",
+                    "description": "Player {} grounds out, shortstop to first.".format(
+                        p
+                    ),
+                    "rbi": 0,
+                    "awayScore": p // 40,
+                    "homeScore": p // 50,
+                },
+                "about": {"atBatIndex": p, "halfInning": "top", "inning": p // 36 + 1},
+                "matchup": {
+                    "batter": {"id": 600000 + p % players, "fullName": "Batter"},
+                    "pitcher": {"id": 500000 + p % 8, "fullName": "Pitcher"},
+                },
+                "playEvents": [pitch(i) for i in range(pitches_per_play)],
+            }
+        )
+
+    boxscore_players = {
+        "ID{}".format(600000 + i): {
+            "person": {"id": 600000 + i, "fullName": "Player {}".format(i)},
+            "stats": {
+                "batting": {k: rng.randint(0, 5) for k in "abcdefghijklmnop"},
+                "pitching": {},
+                "fielding": {k: rng.randint(0, 5) for k in "abcdefgh"},
+            },
+            "seasonStats": {
+                "batting": {k: str(rng.random())[:5] for k in "abcdefghijklmnop"}
+            },
+        }
+        for i in range(players)
+    }
+
+    feed = {
+        "gamePk": 778440,
+        "gameData": {"status": {"abstractGameState": "Final"}},
+        "liveData": {
+            "plays": {"allPlays": all_plays},
+            "boxscore": {
+                "teams": {
+                    "away": {"players": boxscore_players, "pitchers": [500000, 500001]},
+                    "home": {"players": boxscore_players, "pitchers": [500002]},
+                }
+            },
+        },
+    }
+    return json.dumps(feed).encode("utf-8")
+
+
+def load_feeds(paths):
+    feeds = []
+    for path in paths:
+        if ".cassette" in os.path.basename(path):
+            c = cassette.Cassette(path)
+            for key, recorded in c.interactions.items():
+                if "/feed/live" in key or "/game/" in key:
+                    feeds.extend(
+                        (key, r["body"].encode("utf-8"))
+                        for r in recorded
+                        if r["encoding"] == "utf-8"
+                    )
+        else:
+            with open(path, "rb") as f:
+                feeds.append((path, f.read()))
+    return feeds
+
+
+def measure(loads, body, number):
+    times = []
+    for _ in range(number):
+        start = time.perf_counter()
+        loads(body)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    loads(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="JSON feeds or cassette files")
+    parser.add_argument("--number", type=int, default=20, help="decodes per feed")
+    args = parser.parse_args()
+
+    feeds = load_feeds(args.paths) if args.paths else []
+    if not feeds:
+        feeds = [("synthetic feed", synthetic_feed())]
+
+    print("{:<10} {:>10} {:>12} {:>14}".format("decoder", "MB", "median ms", "peak MB"))
+    for name, body in feeds:
+        print(name)
+        parsers = list(decoder.DECODERS.items())
+        parsers.append(
+            ("scan", lambda b: stream.extract_paths(b, NARROW_PATHS, use_ijson=False))
+        )
+        if stream.ijson is not None:
+            parsers.append(
+                ("ijson", lambda b: stream.extract_paths(b, NARROW_PATHS, True))
+            )
+        for parser_name, loads in parsers:
+            median, peak = measure(loads, body, args.number)
+            print(
+                "{:<10} {:>10.2f} {:>12.2f} {:>14.2f}".format(
+                    parser_name, len(body) / 1e6, median * 1000, peak / 1e6
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,7 @@ setuptools.setup(
     url="https://github.com/toddrob99/MLB-StatsAPI",
     packages=setuptools.find_packages(),
     install_requires=["requests"],
+    extras_require={"async": ["aiohttp"], "fast": ["orjson"], "stream": ["ijson"]},
     classifiers=[
         "Programming Language :: Python",
         "Programming Language :: Python :: 3",
@@ -13,13 +13,60 @@ Wiki/Documentation: https://github.com/toddrob99/MLB-StatsAPI/wiki
 """
 import sys
 
-import copy
 import logging
 import requests
-from datetime import datetime
+import time
+from collections import deque, namedtuple
+from datetime import date as date_type, datetime, timedelta, timezone
+from urllib.parse import urlsplit
 
 from . import version
 from . import endpoints
+from . import urls
+from . import ratelimit
+from . import breaker
+from . import metrics
+from . import decoder
+from . import stream
+from . import projection as projections
+from .boxdata import BoxscoreData
+from .live import LiveGameTracker, PatchError
+from .players import PlayerIndex, get_player_index, configure_player_index
+from .metacache import get_meta_cache, configure_meta_cache, meta_name
+from .client import (
+    Client,
+    get_client,
+    set_client,
+    configure_client,
+    get_flight,
+    get_executor,
+)
+from .ratelimit import (
+    get_rate_limiter,
+    configure_rate_limit,
+    get_retry_policy,
+    configure_retries,
+)
+from .breaker import (
+    CircuitOpenError,
+    get_breaker,
+    configure_breakers,
+    is_stale,
+)
+from .decoder import get_decoder, set_decoder
+from .cassette import use_cassette, CassetteMissError
+from .metrics import get_metrics, reset_metrics, enable_metrics
+from .cache import (
+    NOT_FOUND,
+    NO_DATA,
+    get_cache,
+    configure_cache,
+    clear_cache,
+    endpoint_ttl,
+    set_endpoint_ttl,
+    get_negative_cache,
+    configure_negative_cache,
+)
 
 __version__ = version.VERSION
 """Installed version of MLB-StatsAPI"""
@@ -51,8 +98,46 @@ def schedule(
     leagueId=None,
     season=None,
     include_series_status=True,
+    projection=None,
 ):
-    """Get list of games for a given date/range and/or team/opponent."""
+    """Get list of games for a given date/range and/or team/opponent.
+
+    projection is an optional collection of the keys to return for each game
+    (see statsapi.projection.SCHEDULE). Only the fields and hydrations those
+    keys need are requested.
+    """
+    params = _schedule_params(
+        date,
+        start_date,
+        end_date,
+        team,
+        opponent,
+        sportId,
+        game_id,
+        leagueId,
+        season,
+        include_series_status,
+        projection,
+    )
+    r = get("schedule", params)
+
+    return _schedule_games(r, projection)
+
+
+def _schedule_params(
+    date=None,
+    start_date=None,
+    end_date=None,
+    team="",
+    opponent="",
+    sportId=1,
+    game_id=None,
+    leagueId=None,
+    season=None,
+    include_series_status=True,
+    projection=None,
+):
+    """Build the schedule endpoint parameters used by schedule()."""
     if end_date and not start_date:
         date = end_date
         end_date = None
@@ -83,9 +168,13 @@ def schedule(
     if season:
         params.update({"season": season})
 
-    hydrate = (
-        "decisions,probablePitcher(note),linescore,broadcasts,game(content(media(epg)))"
-    )
+    hydrate = [
+        "decisions",
+        "probablePitcher(note)",
+        "linescore",
+        "broadcasts",
+        "game(content(media(epg)))",
+    ]
     if include_series_status:
         if date == "2014-03-11" or (str(start_date) <= "2014-03-11" <= str(end_date)):
             # For some reason the seriesStatus hydration throws a server error on 2014-03-11 only (checked back to 2000)
@@ -93,16 +182,20 @@ def schedule(
                 "Excluding seriesStatus hydration because the MLB API throws an error for 2014-03-11 which is included in the requested date range."
             )
         else:
-            hydrate += ",seriesStatus"
-    params.update(
-        {
-            "sportId": str(sportId),
-            "hydrate": hydrate,
-        }
-    )
+            hydrate.append("seriesStatus")
+    params.update({"sportId": str(sportId)})
 
-    r = get("schedule", params)
+    if projection is not None:
+        hydrate = projections.SCHEDULE.hydrate(projection, hydrate)
+        params.update({"fields": projections.SCHEDULE.fields(projection)})
+    if hydrate:
+        params.update({"hydrate": ",".join(hydrate)})
 
+    return params
+
+
+def _schedule_games(r, projection=None):
+    """Parse a schedule endpoint response into the list returned by schedule()."""
     games = []
     if r.get("totalItems") == 0:
         return games  # TODO: ValueError('No games to parse from schedule object.') instead?
@@ -150,7 +243,7 @@ def schedule(
                     ),
                     "series_status": game.get("seriesStatus", {}).get("result"),
                 }
-                if game["content"].get("media", {}).get("freeGame", False):
+                if game.get("content", {}).get("media", {}).get("freeGame", False):
                     game_info["national_broadcasts"].append("MLB.tv Free Game")
                 if game_info["status"] in ["Final", "Game Over"]:
                     if game.get("isTie"):
@@ -211,9 +304,9 @@ def schedule(
                             + " ("
                             + str(game["teams"]["home"].get("score", "0"))
                             + ") ("
-                            + game["linescore"]["inningState"]
+                            + game.get("linescore", {}).get("inningState", "")
                             + " of the "
-                            + game["linescore"]["currentInningOrdinal"]
+                            + game.get("linescore", {}).get("currentInningOrdinal", "")
                             + ")"
                         }
                     )
@@ -230,11 +323,192 @@ def schedule(
                     )
                     game_info.update({"summary": summary})
 
+                if projection is not None:
+                    game_info = projections.SCHEDULE.apply(game_info, projection)
                 games.append(game_info)
 
         return games
 
 
+def iter_schedule(
+    start_date,
+    end_date,
+    team="",
+    opponent="",
+    sportId=1,
+    leagueId=None,
+    include_series_status=True,
+    projection=None,
+    max_workers=None,
+):
+    """Yield the games schedule() returns for a date range, one month at a time.
+
+    The range is split into calendar months, which are fetched concurrently
+    (up to max_workers at once, DEFAULT_MAX_WORKERS by default). Games are
+    yielded in date order as soon as their month has arrived, so at most
+    max_workers months of games are held in memory at a time. Dates may be
+    given as YYYY-MM-DD, MM/DD/YYYY or date objects.
+
+    For example, to walk a full regular season:
+    for game in statsapi.iter_schedule('2025-03-27', '2025-09-28'): ...
+    """
+    for r in _schedule_chunks(
+        start_date,
+        end_date,
+        max_workers,
+        team=team,
+        opponent=opponent,
+        sportId=sportId,
+        leagueId=leagueId,
+        include_series_status=include_series_status,
+        projection=projection,
+    ):
+        for game in _schedule_games(r, projection):
+            yield game
+
+
+def schedule_table(
+    start_date,
+    end_date,
+    team="",
+    opponent="",
+    sportId=1,
+    leagueId=None,
+    columns=None,
+    max_workers=None,
+):
+    """Get the schedule for a date range as a compact columnar table.
+
+    Returns a dict of column name -> list, with one entry per game in date
+    order, instead of a dict per game. columns is an optional collection of
+    column names (default: every column in SCHEDULE_COLUMNS); only the fields
+    and hydrations they need are requested. game_date is a datetime.date,
+    game_datetime a timezone-aware datetime.datetime, scores are int (None
+    before a game starts).
+
+    The range is fetched in concurrent month chunks, as in iter_schedule().
+    """
+    columns = list(SCHEDULE_COLUMNS if columns is None else columns)
+    unknown = [c for c in columns if c not in SCHEDULE_COLUMNS]
+    if unknown:
+        raise ValueError(
+            "Invalid schedule column(s): {}. Valid columns: {}".format(
+                ", ".join(unknown), ", ".join(SCHEDULE_COLUMNS)
+            )
+        )
+
+    table = {column: [] for column in columns}
+    extractors = [(table[column], SCHEDULE_COLUMNS[column]) for column in columns]
+    for r in _schedule_chunks(
+        start_date,
+        end_date,
+        max_workers,
+        team=team,
+        opponent=opponent,
+        sportId=sportId,
+        leagueId=leagueId,
+        include_series_status=False,
+        projection=columns,
+    ):
+        for date in r.get("dates", []):
+            for game in date.get("games", []):
+                for values, extract in extractors:
+                    values.append(extract(date, game))
+
+    return table
+
+
+def _parse_game_datetime(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(
+            tzinfo=timezone.utc
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def _score(game, side):
+    score = game["teams"][side].get("score")
+    return None if score is None else int(score)
+
+
+SCHEDULE_COLUMNS = {
+    "game_id": lambda d, g: g["gamePk"],
+    "game_datetime": lambda d, g: _parse_game_datetime(g.get("gameDate")),
+    "game_date": lambda d, g: datetime.strptime(d["date"], "%Y-%m-%d").date(),
+    "game_type": lambda d, g: g["gameType"],
+    "status": lambda d, g: g["status"]["detailedState"],
+    "away_id": lambda d, g: g["teams"]["away"]["team"]["id"],
+    "home_id": lambda d, g: g["teams"]["home"]["team"]["id"],
+    "away_name": lambda d, g: g["teams"]["away"]["team"].get("name", "???"),
+    "home_name": lambda d, g: g["teams"]["home"]["team"].get("name", "???"),
+    "away_score": lambda d, g: _score(g, "away"),
+    "home_score": lambda d, g: _score(g, "home"),
+    "doubleheader": lambda d, g: g["doubleHeader"],
+    "game_num": lambda d, g: g["gameNumber"],
+    "venue_id": lambda d, g: g.get("venue", {}).get("id"),
+    "venue_name": lambda d, g: g.get("venue", {}).get("name"),
+    "away_probable_pitcher": lambda d, g: g["teams"]["away"]
+    .get("probablePitcher", {})
+    .get("fullName", ""),
+    "home_probable_pitcher": lambda d, g: g["teams"]["home"]
+    .get("probablePitcher", {})
+    .get("fullName", ""),
+}
+"""Columns available from schedule_table(), and how each is read from a game"""
+
+
+def _parse_date(value):
+    """Return a datetime.date for a date object or a YYYY-MM-DD or MM/DD/YYYY string."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date_type):
+        return value
+    for fmt in ("%Y-%m-%d", "%m/%d/%Y"):
+        try:
+            return datetime.strptime(str(value), fmt).date()
+        except ValueError:
+            pass
+    raise ValueError("Invalid date: {}. Use YYYY-MM-DD or MM/DD/YYYY.".format(value))
+
+
+def _month_ranges(start_date, end_date):
+    """Split start_date..end_date (inclusive) into (start, end) date strings per calendar month."""
+    start, end = _parse_date(start_date), _parse_date(end_date)
+    if start > end:
+        raise ValueError("start_date {} is after end_date {}".format(start, end))
+    ranges = []
+    while start <= end:
+        if start.month == 12:
+            next_month = start.replace(year=start.year + 1, month=1, day=1)
+        else:
+            next_month = start.replace(month=start.month + 1, day=1)
+        chunk_end = min(end, next_month - timedelta(days=1))
+        ranges.append((start.isoformat(), chunk_end.isoformat()))
+        start = next_month
+    return ranges
+
+
+def _schedule_chunks(start_date, end_date, max_workers=None, **kwargs):
+    """Yield schedule endpoint responses for each month of the range, in order.
+
+    Up to max_workers months are requested at once on the shared executor; a
+    response is yielded as soon as it and every earlier month have arrived.
+    Responses bypass the response cache, so yielded months are not kept in
+    memory. Requests not yet started are cancelled if the caller stops
+    iterating.
+    """
+    params_list = [
+        _schedule_params(start_date=start, end_date=end, **kwargs)
+        for start, end in _month_ranges(start_date, end_date)
+    ]
+    return _imap(
+        lambda params: get("schedule", params, cache_ttl=0),
+        params_list,
+        DEFAULT_MAX_WORKERS if max_workers is None else max_workers,
+    )
+
+
 def boxscore(
     gamePk,
     battingBox=True,
@@ -473,11 +747,18 @@ def boxscore(
 
 
 def boxscore_data(gamePk, timecode=None):
-    """Returns a python dict containing boxscore data for a given game."""
+    """Returns a dict-like BoxscoreData containing boxscore data for a given game.
 
-    boxData = {}
-    """boxData holds the dict to be returned"""
+    Derived tables such as awayBatters and homePitchers are built the first
+    time they are read (see statsapi.boxdata). Use .to_dict() for a plain dict.
+    """
+    r = get("game", _boxscore_params(gamePk, timecode))
+
+    return _boxscore_data(r)
 
+
+def _boxscore_params(gamePk, timecode=None):
+    """Build the game endpoint parameters used by boxscore_data()."""
     params = {
         "gamePk": gamePk,
         "fields": "gameData,game,teams,teamName,shortName,teamStats,batting,atBats,runs,hits,doubles,triples,homeRuns,rbi,stolenBases,strikeOuts,baseOnBalls,leftOnBase,pitching,inningsPitched,earnedRuns,homeRuns,players,boxscoreName,liveData,boxscore,teams,players,id,fullName,allPositions,abbreviation,seasonStats,batting,avg,ops,obp,slg,era,pitchesThrown,numberOfPitches,strikes,battingOrder,info,title,fieldList,note,label,value,wins,losses,holds,blownSaves",
@@ -485,366 +766,12 @@ def boxscore_data(gamePk, timecode=None):
     if timecode:
         params.update({"timecode": timecode})
 
-    r = get("game", params)
+    return params
 
-    boxData.update({"gameId": r["gameData"]["game"]["id"]})
-    boxData.update({"teamInfo": r["gameData"]["teams"]})
-    boxData.update({"playerInfo": r["gameData"]["players"]})
-    boxData.update({"away": r["liveData"]["boxscore"]["teams"]["away"]})
-    boxData.update({"home": r["liveData"]["boxscore"]["teams"]["home"]})
 
-    batterColumns = [
-        {
-            "namefield": boxData["teamInfo"]["away"]["teamName"] + " Batters",
-            "ab": "AB",
-            "r": "R",
-            "h": "H",
-            "doubles": "2B",
-            "triples": "3B",
-            "hr": "HR",
-            "rbi": "RBI",
-            "sb": "SB",
-            "bb": "BB",
-            "k": "K",
-            "lob": "LOB",
-            "avg": "AVG",
-            "ops": "OPS",
-            "personId": 0,
-            "substitution": False,
-            "note": "",
-            "name": boxData["teamInfo"]["away"]["teamName"] + " Batters",
-            "position": "",
-            "obp": "OBP",
-            "slg": "SLG",
-            "battingOrder": "",
-        }
-    ]
-    # Add away and home column headers
-    sides = ["away", "home"]
-    awayBatters = copy.deepcopy(batterColumns)
-    homeBatters = copy.deepcopy(batterColumns)
-    homeBatters[0]["namefield"] = boxData["teamInfo"]["home"]["teamName"] + " Batters"
-    homeBatters[0]["name"] = boxData["teamInfo"]["home"]["teamName"] + " Batters"
-    batters = [awayBatters, homeBatters]
-
-    for i in range(0, len(sides)):
-        side = sides[i]
-        for batterId_int in [
-            x
-            for x in boxData[side]["batters"]
-            if boxData[side]["players"].get("ID" + str(x), {}).get("battingOrder")
-        ]:
-            batterId = str(batterId_int)
-            namefield = (
-                str(boxData[side]["players"]["ID" + batterId]["battingOrder"])[0]
-                if str(boxData[side]["players"]["ID" + batterId]["battingOrder"])[-1]
-                == "0"
-                else "   "
-            )
-            namefield += " " + boxData[side]["players"]["ID" + batterId]["stats"][
-                "batting"
-            ].get("note", "")
-            namefield += (
-                boxData["playerInfo"]["ID" + batterId]["boxscoreName"]
-                + "  "
-                + boxData[side]["players"]["ID" + batterId]["position"]["abbreviation"]
-            )
-            if not len(
-                boxData[side]["players"]["ID" + batterId]
-                .get("stats", {})
-                .get("batting", {})
-            ):
-                # Protect against player with no batting data in the box score (#37)
-                continue
-
-            batter = {
-                "namefield": namefield,
-                "ab": str(
-                    boxData[side]["players"]["ID" + batterId]["stats"]["batting"][
-                        "atBats"
-                    ]
-                ),
-                "r": str(
-                    boxData[side]["players"]["ID" + batterId]["stats"]["batting"][
-                        "runs"
-                    ]
-                ),
-                "h": str(
-                    boxData[side]["players"]["ID" + batterId]["stats"]["batting"][
-                        "hits"
-                    ]
-                ),
-                "doubles": str(
-                    boxData[side]["players"]["ID" + batterId]["stats"]["batting"][
-                        "doubles"
-                    ]
-                ),
-                "triples": str(
-                    boxData[side]["players"]["ID" + batterId]["stats"]["batting"][
-                        "triples"
-                    ]
-                ),
-                "hr": str(
-                    boxData[side]["players"]["ID" + batterId]["stats"]["batting"][
-                        "homeRuns"
-                    ]
-                ),
-                "rbi": str(
-                    boxData[side]["players"]["ID" + batterId]["stats"]["batting"]["rbi"]
-                ),
-                "sb": str(
-                    boxData[side]["players"]["ID" + batterId]["stats"]["batting"][
-                        "stolenBases"
-                    ]
-                ),
-                "bb": str(
-                    boxData[side]["players"]["ID" + batterId]["stats"]["batting"][
-                        "baseOnBalls"
-                    ]
-                ),
-                "k": str(
-                    boxData[side]["players"]["ID" + batterId]["stats"]["batting"][
-                        "strikeOuts"
-                    ]
-                ),
-                "lob": str(
-                    boxData[side]["players"]["ID" + batterId]["stats"]["batting"][
-                        "leftOnBase"
-                    ]
-                ),
-                "avg": str(
-                    boxData[side]["players"]["ID" + batterId]["seasonStats"]["batting"][
-                        "avg"
-                    ]
-                ),
-                "ops": str(
-                    boxData[side]["players"]["ID" + batterId]["seasonStats"]["batting"][
-                        "ops"
-                    ]
-                ),
-                "personId": batterId_int,
-                "battingOrder": str(
-                    boxData[side]["players"]["ID" + batterId]["battingOrder"]
-                ),
-                "substitution": (
-                    False
-                    if str(boxData[side]["players"]["ID" + batterId]["battingOrder"])[
-                        -1
-                    ]
-                    == "0"
-                    else True
-                ),
-                "note": boxData[side]["players"]["ID" + batterId]["stats"][
-                    "batting"
-                ].get("note", ""),
-                "name": boxData["playerInfo"]["ID" + batterId]["boxscoreName"],
-                "position": boxData[side]["players"]["ID" + batterId]["position"][
-                    "abbreviation"
-                ],
-                "obp": str(
-                    boxData[side]["players"]["ID" + batterId]["seasonStats"]["batting"][
-                        "obp"
-                    ]
-                ),
-                "slg": str(
-                    boxData[side]["players"]["ID" + batterId]["seasonStats"]["batting"][
-                        "slg"
-                    ]
-                ),
-            }
-            batters[i].append(batter)
-
-    boxData.update({"awayBatters": awayBatters})
-    boxData.update({"homeBatters": homeBatters})
-
-    # Add team totals
-    sidesBattingTotals = ["awayBattingTotals", "homeBattingTotals"]
-    for i in range(0, len(sides)):
-        side = sides[i]
-        boxData.update(
-            {
-                sidesBattingTotals[i]: {
-                    "namefield": "Totals",
-                    "ab": str(boxData[side]["teamStats"]["batting"]["atBats"]),
-                    "r": str(boxData[side]["teamStats"]["batting"]["runs"]),
-                    "h": str(boxData[side]["teamStats"]["batting"]["hits"]),
-                    "hr": str(boxData[side]["teamStats"]["batting"]["homeRuns"]),
-                    "rbi": str(boxData[side]["teamStats"]["batting"]["rbi"]),
-                    "bb": str(boxData[side]["teamStats"]["batting"]["baseOnBalls"]),
-                    "k": str(boxData[side]["teamStats"]["batting"]["strikeOuts"]),
-                    "lob": str(boxData[side]["teamStats"]["batting"]["leftOnBase"]),
-                    "avg": "",
-                    "ops": "",
-                    "obp": "",
-                    "slg": "",
-                    "name": "Totals",
-                    "position": "",
-                    "note": "",
-                    "substitution": False,
-                    "battingOrder": "",
-                    "personId": 0,
-                }
-            }
-        )
-
-    # Get batting notes
-    awayBattingNotes = {}
-    homeBattingNotes = {}
-    battingNotes = [awayBattingNotes, homeBattingNotes]
-    for i in range(0, len(sides)):
-        for n in boxData[sides[i]]["note"]:
-            battingNotes[i].update(
-                {len(battingNotes[i]): n["label"] + "-" + n["value"]}
-            )
-
-    boxData.update({"awayBattingNotes": awayBattingNotes})
-    boxData.update({"homeBattingNotes": homeBattingNotes})
-
-    # Get pitching box
-    # Add column headers
-    pitcherColumns = [
-        {
-            "namefield": boxData["teamInfo"]["away"]["teamName"] + " Pitchers",
-            "ip": "IP",
-            "h": "H",
-            "r": "R",
-            "er": "ER",
-            "bb": "BB",
-            "k": "K",
-            "hr": "HR",
-            "era": "ERA",
-            "p": "P",
-            "s": "S",
-            "name": boxData["teamInfo"]["away"]["teamName"] + " Pitchers",
-            "personId": 0,
-            "note": "",
-        }
-    ]
-    awayPitchers = copy.deepcopy(pitcherColumns)
-    homePitchers = copy.deepcopy(pitcherColumns)
-    homePitchers[0]["namefield"] = boxData["teamInfo"]["home"]["teamName"] + " Pitchers"
-    homePitchers[0]["name"] = boxData["teamInfo"]["away"]["teamName"] + " Pitchers"
-    pitchers = [awayPitchers, homePitchers]
-
-    for i in range(0, len(sides)):
-        side = sides[i]
-        for pitcherId_int in boxData[side]["pitchers"]:
-            pitcherId = str(pitcherId_int)
-            if not boxData[side]["players"].get("ID" + pitcherId) or not len(
-                boxData[side]["players"]["ID" + pitcherId]
-                .get("stats", {})
-                .get("pitching", {})
-            ):
-                # Skip pitcher with no pitching data in the box score (#37)
-                # Or skip pitcher listed under the wrong team (from comments on #37)
-                continue
-
-            namefield = boxData["playerInfo"]["ID" + pitcherId]["boxscoreName"]
-            namefield += (
-                "  "
-                + boxData[side]["players"]["ID" + pitcherId]["stats"]["pitching"].get(
-                    "note", ""
-                )
-                if boxData[side]["players"]["ID" + pitcherId]["stats"]["pitching"].get(
-                    "note"
-                )
-                else ""
-            )
-            pitcher = {
-                "namefield": namefield,
-                "ip": str(
-                    boxData[side]["players"]["ID" + pitcherId]["stats"]["pitching"][
-                        "inningsPitched"
-                    ]
-                ),
-                "h": str(
-                    boxData[side]["players"]["ID" + pitcherId]["stats"]["pitching"][
-                        "hits"
-                    ]
-                ),
-                "r": str(
-                    boxData[side]["players"]["ID" + pitcherId]["stats"]["pitching"][
-                        "runs"
-                    ]
-                ),
-                "er": str(
-                    boxData[side]["players"]["ID" + pitcherId]["stats"]["pitching"][
-                        "earnedRuns"
-                    ]
-                ),
-                "bb": str(
-                    boxData[side]["players"]["ID" + pitcherId]["stats"]["pitching"][
-                        "baseOnBalls"
-                    ]
-                ),
-                "k": str(
-                    boxData[side]["players"]["ID" + pitcherId]["stats"]["pitching"][
-                        "strikeOuts"
-                    ]
-                ),
-                "hr": str(
-                    boxData[side]["players"]["ID" + pitcherId]["stats"]["pitching"][
-                        "homeRuns"
-                    ]
-                ),
-                "p": str(
-                    boxData[side]["players"]["ID" + pitcherId]["stats"]["pitching"].get(
-                        "pitchesThrown",
-                        boxData[side]["players"]["ID" + pitcherId]["stats"][
-                            "pitching"
-                        ].get("numberOfPitches", 0),
-                    )
-                ),
-                "s": str(
-                    boxData[side]["players"]["ID" + pitcherId]["stats"]["pitching"][
-                        "strikes"
-                    ]
-                ),
-                "era": str(
-                    boxData[side]["players"]["ID" + pitcherId]["seasonStats"][
-                        "pitching"
-                    ]["era"]
-                ),
-                "name": boxData["playerInfo"]["ID" + pitcherId]["boxscoreName"],
-                "personId": pitcherId_int,
-                "note": boxData[side]["players"]["ID" + pitcherId]["stats"][
-                    "pitching"
-                ].get("note", ""),
-            }
-            pitchers[i].append(pitcher)
-
-    boxData.update({"awayPitchers": awayPitchers})
-    boxData.update({"homePitchers": homePitchers})
-
-    # Get team totals
-    pitchingTotals = ["awayPitchingTotals", "homePitchingTotals"]
-    for i in range(0, len(sides)):
-        side = sides[i]
-        boxData.update(
-            {
-                pitchingTotals[i]: {
-                    "namefield": "Totals",
-                    "ip": str(boxData[side]["teamStats"]["pitching"]["inningsPitched"]),
-                    "h": str(boxData[side]["teamStats"]["pitching"]["hits"]),
-                    "r": str(boxData[side]["teamStats"]["pitching"]["runs"]),
-                    "er": str(boxData[side]["teamStats"]["pitching"]["earnedRuns"]),
-                    "bb": str(boxData[side]["teamStats"]["pitching"]["baseOnBalls"]),
-                    "k": str(boxData[side]["teamStats"]["pitching"]["strikeOuts"]),
-                    "hr": str(boxData[side]["teamStats"]["pitching"]["homeRuns"]),
-                    "p": "",
-                    "s": "",
-                    "era": "",
-                    "name": "Totals",
-                    "personId": 0,
-                    "note": "",
-                }
-            }
-        )
-
-    # Get game info
-    boxData.update({"gameBoxInfo": r["liveData"]["boxscore"].get("info", [])})
-
-    return boxData
+def _boxscore_data(r):
+    """Build the BoxscoreData returned by boxscore_data() from a game endpoint response."""
+    return BoxscoreData(r)
 
 
 def linescore(gamePk, timecode=None):
@@ -910,6 +837,153 @@ def linescore(gamePk, timecode=None):
     return linescore
 
 
+class LinescoreState(
+    namedtuple(
+        "LinescoreState",
+        [
+            "gamePk",
+            "status",
+            "inning",
+            "inning_ordinal",
+            "half",
+            "inning_state",
+            "balls",
+            "strikes",
+            "outs",
+            "away_runs",
+            "away_hits",
+            "away_errors",
+            "home_runs",
+            "home_hits",
+            "home_errors",
+        ],
+    )
+):
+    """Compact live state of a game, as returned by linescore_state().
+
+    status is a detailedState such as "Scheduled", "In Progress" or "Final".
+    inning is 0 and half is "" before the game starts.
+    """
+
+    __slots__ = ()
+
+    @property
+    def count(self):
+        return "{}-{}".format(self.balls, self.strikes)
+
+    @property
+    def is_final(self):
+        return self.status in FINAL_STATES
+
+
+FINAL_STATES = ("Final", "Game Over", "Completed Early")
+"""detailedState values of games that have ended"""
+
+
+def linescore_state(gamePk, timecode=None):
+    """Get the live state of a game (status, inning, count, outs, runs, hits, errors).
+
+    Uses the game endpoint with fields narrowed to the game's status and
+    linescore, so the response is a small fraction of the full feed and cheap
+    enough to poll. Returns a LinescoreState.
+    """
+    params = {"gamePk": gamePk, "fields": LINESCORE_STATE_GAME_FIELDS}
+    if timecode:
+        params.update({"timecode": timecode})
+
+    r = get("game", params)
+
+    return _linescore_state(
+        gamePk,
+        r.get("liveData", {}).get("linescore", {}),
+        r.get("gameData", {}).get("status", {}).get("detailedState", ""),
+    )
+
+
+LINESCORE_STATE_FIELDS = "currentInning,currentInningOrdinal,inningHalf,inningState,scheduledInnings,balls,strikes,outs,teams,home,away,runs,hits,errors"
+
+LINESCORE_STATE_GAME_FIELDS = (
+    "gameData,status,abstractGameState,detailedState,liveData,linescore,"
+    + LINESCORE_STATE_FIELDS
+)
+
+
+def _linescore_state(gamePk, linescore, status):
+    """Build a LinescoreState from a linescore object and the game's detailedState."""
+    teams = linescore.get("teams", {})
+    away = teams.get("away", {})
+    home = teams.get("home", {})
+    return LinescoreState(
+        gamePk=gamePk,
+        status=status,
+        inning=linescore.get("currentInning", 0),
+        inning_ordinal=linescore.get("currentInningOrdinal", ""),
+        half=linescore.get("inningHalf", ""),
+        inning_state=linescore.get("inningState", ""),
+        balls=linescore.get("balls", 0),
+        strikes=linescore.get("strikes", 0),
+        outs=linescore.get("outs", 0),
+        away_runs=away.get("runs", 0),
+        away_hits=away.get("hits", 0),
+        away_errors=away.get("errors", 0),
+        home_runs=home.get("runs", 0),
+        home_hits=home.get("hits", 0),
+        home_errors=home.get("errors", 0),
+    )
+
+
+def slate_state(date=None, sportId=1, team=""):
+    """Get the live state of every game on a date (default: today) in one request.
+
+    Uses the schedule endpoint with the linescore hydration, so polling a
+    whole slate costs one request no matter how many games it has. The
+    response is cached for the game_linescore TTL, so callers polling more
+    often share it. Returns a list with a dict per game:
+    game_id, game_datetime, away_name, home_name, away_id, home_id and
+    state, a LinescoreState with the game's status from the schedule.
+    """
+    params = {
+        "sportId": str(sportId),
+        "hydrate": "linescore",
+        "fields": SLATE_STATE_FIELDS,
+    }
+    if date:
+        params.update({"date": date})
+    if team != "":
+        params.update({"teamId": str(team)})
+
+    r = get("schedule", params, cache_ttl=endpoint_ttl("game_linescore"))
+
+    games = []
+    for d in r.get("dates", []):
+        for game in d.get("games", []):
+            away = game["teams"]["away"]["team"]
+            home = game["teams"]["home"]["team"]
+            games.append(
+                {
+                    "game_id": game["gamePk"],
+                    "game_datetime": game.get("gameDate"),
+                    "away_name": away.get("name", "???"),
+                    "home_name": home.get("name", "???"),
+                    "away_id": away["id"],
+                    "home_id": home["id"],
+                    "state": _linescore_state(
+                        game["gamePk"],
+                        game.get("linescore", {}),
+                        game["status"]["detailedState"],
+                    ),
+                }
+            )
+
+    return games
+
+
+SLATE_STATE_FIELDS = (
+    "dates,games,gamePk,gameDate,status,detailedState,teams,away,home,team,id,name,linescore,"
+    + LINESCORE_STATE_FIELDS
+)
+
+
 def last_game(teamId):
     """Get the gamePk for the given team's most recent completed game."""
     previousSchedule = get(
@@ -919,15 +993,9 @@ def last_game(teamId):
             "hydrate": "previousSchedule",
             "fields": "teams,team,id,previousGameSchedule,dates,date,games,gamePk,gameDate,status,abstractGameCode",
         },
+        cache_ttl=endpoint_ttl("schedule"),
     )
-    games = []
-    for d in previousSchedule["teams"][0]["previousGameSchedule"]["dates"]:
-        games.extend([x for x in d["games"] if x["status"]["abstractGameCode"] == "F"])
-
-    if not len(games):
-        return None
-
-    return games[-1]["gamePk"]
+    return _last_final_game(previousSchedule["teams"][0]["previousGameSchedule"])
 
 
 def next_game(teamId):
@@ -939,9 +1007,27 @@ def next_game(teamId):
             "hydrate": "nextSchedule",
             "fields": "teams,team,id,nextGameSchedule,dates,date,games,gamePk,gameDate,status,abstractGameCode",
         },
+        cache_ttl=endpoint_ttl("schedule"),
     )
+    return _next_unstarted_game(nextSchedule["teams"][0]["nextGameSchedule"])
+
+
+def _last_final_game(schedule):
+    """Return the gamePk of the last completed game in a previousGameSchedule."""
+    games = []
+    for d in schedule["dates"]:
+        games.extend([x for x in d["games"] if x["status"]["abstractGameCode"] == "F"])
+
+    if not len(games):
+        return None
+
+    return games[-1]["gamePk"]
+
+
+def _next_unstarted_game(schedule):
+    """Return the gamePk of the first unstarted game in a nextGameSchedule."""
     games = []
-    for d in nextSchedule["teams"][0]["nextGameSchedule"]["dates"]:
+    for d in schedule["dates"]:
         games.extend([x for x in d["games"] if x["status"]["abstractGameCode"] == "P"])
 
     if not len(games):
@@ -950,6 +1036,102 @@ def next_game(teamId):
     return games[0]["gamePk"]
 
 
+def last_games(teamIds=None, sportId=1):
+    """Get the gamePk of each team's most recent completed game in one request.
+
+    teamIds is a list of team ids (default: every team in sportId). Returns
+    {teamId: gamePk}, with None for teams without a completed game.
+    """
+    return {
+        team_id: _last_final_game(team.get("previousGameSchedule", {"dates": []}))
+        for team_id, team in _teams_schedules(
+            teamIds, sportId, "previousSchedule"
+        ).items()
+    }
+
+
+def next_games(teamIds=None, sportId=1):
+    """Get the gamePk of each team's next unstarted game in one request.
+
+    teamIds is a list of team ids (default: every team in sportId). Returns
+    {teamId: gamePk}, with None for teams without a scheduled game.
+    """
+    return {
+        team_id: _next_unstarted_game(team.get("nextGameSchedule", {"dates": []}))
+        for team_id, team in _teams_schedules(teamIds, sportId, "nextSchedule").items()
+    }
+
+
+def _teams_schedules(teamIds, sportId, hydrate):
+    """Return {teamId: team} from one teams request with a schedule hydration.
+
+    The teams endpoint cannot filter by id, so every team in sportId is
+    requested and the rest are dropped here. The response is cached for the
+    schedule TTL rather than the (daily) teams TTL, since it changes with
+    every completed game.
+    """
+    schedule = (
+        "previousGameSchedule" if hydrate == "previousSchedule" else "nextGameSchedule"
+    )
+    r = get(
+        "teams",
+        {
+            "sportId": sportId,
+            "hydrate": hydrate,
+            "fields": "teams,id,{},dates,date,games,gamePk,gameDate,status,abstractGameCode".format(
+                schedule
+            ),
+        },
+        cache_ttl=endpoint_ttl("schedule"),
+    )
+    teams = {team["id"]: team for team in r.get("teams", [])}
+    if teamIds is None:
+        return teams
+    return {int(t): teams[int(t)] for t in teamIds if int(t) in teams}
+
+
+def batting_orders(games, max_workers=None):
+    """Get batting orders for many teams' games, concurrently.
+
+    games maps teamId to gamePk, as returned by last_games() or next_games().
+    The boxscores are requested concurrently (up to max_workers,
+    DEFAULT_MAX_WORKERS by default), one per distinct game. Returns
+    {teamId: [personId, ...]}, with an empty list when the game has no
+    batting order (yet) or could not be fetched.
+
+    For example, to get every team's lineup from their last game:
+    statsapi.batting_orders(statsapi.last_games())
+    """
+    game_ids = list(dict.fromkeys(g for g in games.values() if g))
+    results = get_many(
+        "game_boxscore",
+        [
+            {"gamePk": g, "fields": "teams,away,home,team,id,battingOrder"}
+            for g in game_ids
+        ],
+        max_workers=DEFAULT_MAX_WORKERS if max_workers is None else max_workers,
+    )
+
+    orders = {}
+    for game_id, result in zip(game_ids, results):
+        if not result.ok:
+            logger.warning(
+                "Unable to get batting orders for game {}: {}".format(
+                    game_id, result.error
+                )
+            )
+            continue
+        for side in result.data.get("teams", {}).values():
+            orders[(game_id, side.get("team", {}).get("id"))] = list(
+                side.get("battingOrder", [])
+            )
+
+    return {
+        team_id: orders.get((game_id, team_id), [])
+        for team_id, game_id in games.items()
+    }
+
+
 def game_scoring_plays(gamePk):
     """Get a text-formatted list of scoring plays for a given game."""
     sortedPlays = game_scoring_play_data(gamePk)
@@ -1162,45 +1344,153 @@ def player_stats(
 
 
 def player_stat_data(
-    personId, group="[hitting,pitching,fielding]", type="season", sportId=1, season=None
+    personId,
+    group="[hitting,pitching,fielding]",
+    type="season",
+    sportId=1,
+    season=None,
+    projection=None,
 ):
-    """Returns a list of current season or career stat data for a given player."""
+    """Returns a list of current season or career stat data for a given player.
+
+    projection is an optional collection of the keys to return (see
+    statsapi.projection.PLAYER_STATS). Only the fields and hydrations those
+    keys need are requested.
+    """
+    r = get(
+        "person",
+        _player_stat_params(personId, group, type, sportId, season, projection),
+        cache_ttl=endpoint_ttl("person_stats"),
+    )
+
+    return _player_stat_data(r, projection)
 
+
+def _player_stat_params(
+    personId,
+    group="[hitting,pitching,fielding]",
+    type="season",
+    sportId=1,
+    season=None,
+    projection=None,
+):
+    """Build the person endpoint parameters used by player_stat_data()."""
     if season is not None and "season" not in type:
         raise ValueError(
             "The 'season' parameter is only valid when using the 'season' type."
         )
 
-    params = {
-        "personId": personId,
-        "hydrate": "stats(group="
-        + group
-        + ",type="
-        + type
-        + (",season=" + str(season) if season else "")
-        + ",sportId="
-        + str(sportId)
-        + "),currentTeam",
+    hydrate = ["stats", "currentTeam"]
+    params = {"personId": personId}
+    if projection is not None:
+        hydrate = projections.PLAYER_STATS.hydrate(projection)
+        fields = projections.PLAYER_STATS.fields(projection)
+        if fields is not None:
+            params.update({"fields": fields})
+
+    hydrate = [
+        (
+            "stats(group="
+            + group
+            + ",type="
+            + type
+            + (",season=" + str(season) if season else "")
+            + ",sportId="
+            + str(sportId)
+            + ")"
+        )
+        if h == "stats"
+        else h
+        for h in hydrate
+    ]
+    if hydrate:
+        params.update({"hydrate": ",".join(hydrate)})
+
+    return params
+
+
+def player_stat_data_many(
+    personIds,
+    group="[hitting,pitching,fielding]",
+    type="season",
+    sportId=1,
+    season=None,
+    projection=None,
+    max_workers=None,
+):
+    """Returns player_stat_data() results for many players, keyed by player id.
+
+    The players are requested from the people endpoint, with as many ids per
+    request as fit in MAX_URL_LENGTH; when more than one request is needed
+    they are sent concurrently (up to max_workers, DEFAULT_MAX_WORKERS by
+    default). The result follows the order of personIds; players the API does
+    not return are left out.
+
+    For example, for a lineup card:
+    statsapi.player_stat_data_many([660271, 665742, 608070], group="hitting")
+    """
+    ids = list(dict.fromkeys(str(i) for i in personIds))
+    params = _player_stat_params(None, group, type, sportId, season, projection)
+    del params["personId"]
+
+    chunks = []
+    for person_id in ids:
+        if chunks:
+            candidate = chunks[-1] + [person_id]
+            url = _build_url("people", dict(params, personIds=",".join(candidate)))
+            if len(url) <= MAX_URL_LENGTH:
+                chunks[-1] = candidate
+                continue
+        chunks.append([person_id])
+
+    results = get_many(
+        "people",
+        [dict(params, personIds=",".join(chunk)) for chunk in chunks],
+        max_workers=DEFAULT_MAX_WORKERS if max_workers is None else max_workers,
+        cache_ttl=endpoint_ttl("person_stats"),
+    )
+    players = {}
+    for result in results:
+        if not result.ok:
+            raise result.error
+        for person in result.data.get("people", []):
+            players[person["id"]] = _player_stat_record(person, projection)
+
+    return {
+        int(person_id): players[int(person_id)]
+        for person_id in ids
+        if int(person_id) in players
     }
-    r = get("person", params)
 
+
+MAX_URL_LENGTH = 2000
+"""Longest URL player_stat_data_many() builds before starting another request"""
+
+
+def _player_stat_data(r, projection=None):
+    """Build the dict returned by player_stat_data() from a person endpoint response."""
+    return _player_stat_record(r["people"][0], projection)
+
+
+def _player_stat_record(person, projection=None):
+    """Build the player_stat_data() dict for one person from a person or people response."""
     stat_groups = []
 
     player = {
-        "id": r["people"][0]["id"],
-        "first_name": r["people"][0]["useName"],
-        "last_name": r["people"][0]["lastName"],
-        "active": r["people"][0]["active"],
-        "current_team": r["people"][0]["currentTeam"]["name"],
-        "position": r["people"][0]["primaryPosition"]["abbreviation"],
-        "nickname": r["people"][0].get("nickName"),
-        "last_played": r["people"][0].get("lastPlayedDate"),
-        "mlb_debut": r["people"][0].get("mlbDebutDate"),
-        "bat_side": r["people"][0]["batSide"]["description"],
-        "pitch_hand": r["people"][0]["pitchHand"]["description"],
+        "id": person["id"],
+        "first_name": person["useName"],
+        "last_name": person["lastName"],
+        "active": person["active"],
+        "current_team": person.get("currentTeam", {}).get("name"),
+        "position": person["primaryPosition"]["abbreviation"],
+        "nickname": person.get("nickName"),
+        "last_played": person.get("lastPlayedDate"),
+        "mlb_debut": person.get("mlbDebutDate"),
+        "bat_side": person["batSide"]["description"],
+        "pitch_hand": person["pitchHand"]["description"],
     }
 
-    for s in r["people"][0].get("stats", []):
+    for s in person.get("stats", []):
         for i in range(0, len(s["splits"])):
             stat_group = {
                 "type": s["type"]["displayName"],
@@ -1212,6 +1502,8 @@ def player_stat_data(
 
     player.update({"stats": stat_groups})
 
+    if projection is not None:
+        player = projections.PLAYER_STATS.apply(player, projection)
     return player
 
 
@@ -1233,40 +1525,13 @@ def latest_season(sportId=1):
 
 
 def lookup_player(lookup_value, gameType=None, season=None, sportId=1):
-    """Get data about players based on first, last, or full name."""
-    params = {
-        "sportId": sportId,
-        "fields": "people,id,fullName,firstName,lastName,primaryNumber,currentTeam,id,primaryPosition,code,abbreviation,useName,boxscoreName,nickName,mlbDebutDate,nameFirstLast,firstLastName,lastFirstName,lastInitName,initLastName,fullFMLName,fullLFMName,nameSlug",
-    }
-    if gameType:
-        params.update(
-            {
-                "gameType": gameType,
-            }
-        )
-    if not season:
-        season_data = latest_season(sportId=sportId)
-        season = season_data.get("seasonId", datetime.now().year)
-    params.update(
-        {
-            "season": season,
-        }
-    )
-    r = get("sports_players", params)
+    """Get data about players based on first, last, or full name.
 
-    players = []
-    lookup_values = str(lookup_value).lower().split()
-    for player in r["people"]:
-        for l in lookup_values:
-            for v in player.values():
-                if l in str(v).lower():
-                    break
-            else:
-                break
-        else:
-            players.append(player)
-
-    return players
+    Players are matched against the season's PlayerIndex (see
+    statsapi.get_player_index()), which is fetched once and then searched in
+    memory.
+    """
+    return get_player_index(season, sportId, gameType).search(lookup_value)
 
 
 def lookup_team(lookup_value, activeStatus="Y", season=None, sportIds=1):
@@ -1378,6 +1643,95 @@ def league_leader_data(
     statType=None,
 ):
     """Returns a python list of stat leaders overall or for a given league (103=AL, 104=NL)."""
+    params = _league_leader_params(
+        leaderCategories,
+        season,
+        limit,
+        statGroup,
+        leagueId,
+        gameTypes,
+        playerPool,
+        sportId,
+        statType,
+    )
+
+    r = get("stats_leaders", params)
+
+    return _leader_rows(r["leagueLeaders"][0])
+
+
+def league_leaders_many(
+    leaderCategories,
+    season=None,
+    limit=10,
+    statGroup=None,
+    leagueId=None,
+    gameTypes=None,
+    playerPool=None,
+    sportId=1,
+    statType=None,
+):
+    """Returns stat leaders for several categories from a single request.
+
+    leaderCategories is a list or comma-separated string of categories. The
+    result maps each category to the same rows league_leader_data() returns
+    ([rank, name, team, value]), in the order the API returns them. When a
+    category is returned for more than one stat group (e.g. strikeouts for
+    hitting and pitching), its keys are "category:statGroup" instead.
+
+    The response is cached until the end of the day.
+    """
+    if not isinstance(leaderCategories, str):
+        leaderCategories = ",".join(leaderCategories)
+    params = _league_leader_params(
+        leaderCategories,
+        season,
+        limit,
+        statGroup,
+        leagueId,
+        gameTypes,
+        playerPool,
+        sportId,
+        statType,
+    )
+    params.update({"fields": params["fields"] + ",leaderCategory,statGroup"})
+
+    now = datetime.now()
+    end_of_day = datetime(now.year, now.month, now.day) + timedelta(days=1)
+    r = get(
+        "stats_leaders",
+        params,
+        cache_ttl=max(60, int((end_of_day - now).total_seconds())),
+    )
+
+    blocks = r.get("leagueLeaders", [])
+    counts = {}
+    for block in blocks:
+        category = block.get("leaderCategory")
+        counts[category] = counts.get(category, 0) + 1
+
+    leaders = {}
+    for block in blocks:
+        category = block.get("leaderCategory")
+        if counts[category] > 1:
+            category = "{}:{}".format(category, block.get("statGroup"))
+        leaders[category] = _leader_rows(block)
+
+    return leaders
+
+
+def _league_leader_params(
+    leaderCategories,
+    season=None,
+    limit=10,
+    statGroup=None,
+    leagueId=None,
+    gameTypes=None,
+    playerPool=None,
+    sportId=1,
+    statType=None,
+):
+    """Build the stats_leaders endpoint parameters used by league_leader_data()."""
     params = {"leaderCategories": leaderCategories, "sportId": sportId, "limit": limit}
     if season:
         params.update({"season": season})
@@ -1411,10 +1765,13 @@ def league_leader_data(
         }
     )
 
-    r = get("stats_leaders", params)
+    return params
+
 
+def _leader_rows(block):
+    """Parse one leagueLeaders block into [rank, name, team, value] rows."""
     lines = []
-    for player in [x for x in r["leagueLeaders"][0]["leaders"]]:
+    for player in [x for x in block.get("leaders", [])]:
         lines.append(
             [
                 player["rank"],
@@ -1484,8 +1841,14 @@ def standings_data(
     season=None,
     standingsTypes=None,
     date=None,
+    projection=None,
 ):
-    """Returns a dict of standings data for a given league/division and season."""
+    """Returns a dict of standings data for a given league/division and season.
+
+    projection is an optional collection of the keys to return for each team
+    (see statsapi.projection.STANDINGS). Only the fields those keys need are
+    requested.
+    """
     params = {"leagueId": leagueId}
     if date:
         params.update({"date": date})
@@ -1507,6 +1870,9 @@ def standings_data(
         }
     )
 
+    if projection is not None:
+        params.update({"fields": projections.STANDINGS.fields(projection)})
+
     r = get("standings", params)
 
     divisions = {}
@@ -1531,10 +1897,10 @@ def standings_data(
 
             team = {
                 "name": x["team"]["name"],
-                "div_rank": x["divisionRank"],
-                "w": x["wins"],
-                "l": x["losses"],
-                "gb": x["gamesBack"],
+                "div_rank": x.get("divisionRank"),
+                "w": x.get("wins"),
+                "l": x.get("losses"),
+                "gb": x.get("gamesBack"),
                 "wc_rank": x.get("wildCardRank", "-"),
                 "wc_gb": x.get("wildCardGamesBack", "-"),
                 "wc_elim_num": x.get("wildCardEliminationNumber", "-"),
@@ -1543,31 +1909,61 @@ def standings_data(
                 "league_rank": x.get("leagueRank", "-"),
                 "sport_rank": x.get("sportRank", "-"),
             }
+            if projection is not None:
+                team = projections.STANDINGS.apply(team, projection)
             divisions[x["team"]["division"]["id"]]["teams"].append(team)
 
     return divisions
 
 
-def roster(teamId, rosterType=None, season=datetime.now().year, date=None):
-    """Get the roster for a given team."""
+def roster(
+    teamId, rosterType=None, season=datetime.now().year, date=None, projection=None
+):
+    """Get the roster for a given team.
+
+    projection is an optional collection of the columns to include (see
+    statsapi.projection.ROSTER). Only the fields those columns need are
+    requested.
+    """
+    r = get("team_roster", _roster_params(teamId, rosterType, season, date, projection))
+
+    return _roster(r, projection)
+
+
+def _roster_params(
+    teamId, rosterType=None, season=datetime.now().year, date=None, projection=None
+):
+    """Build the team_roster endpoint parameters used by roster()."""
     if not rosterType:
         rosterType = "active"
 
     params = {"rosterType": rosterType, "season": season, "teamId": teamId}
     if date:
         params.update({"date": date})
+    if projection is not None:
+        params.update({"fields": projections.ROSTER.fields(projection)})
 
-    r = get("team_roster", params)
+    return params
+
+
+def _roster(r, projection=None):
+    """Format a team_roster endpoint response into the string returned by roster()."""
+    columns = [
+        ("jersey_number", "#{:<3}", lambda x: x["jerseyNumber"]),
+        ("position", "{:<3}", lambda x: x["position"]["abbreviation"]),
+        ("name", "{}", lambda x: x["person"]["fullName"]),
+    ]
+    if projection is not None:
+        columns = [c for c in columns if c[0] in projection]
+    line = " ".join(c[1] for c in columns) + "\n"
 
     roster = ""
     players = []
     for x in r["roster"]:
-        players.append(
-            [x["jerseyNumber"], x["position"]["abbreviation"], x["person"]["fullName"]]
-        )
+        players.append([c[2](x) for c in columns])
 
     for i in range(0, len(players)):
-        roster += ("#{:<3} {:<3} {}\n").format(*players[i])
+        roster += line.format(*players[i])
 
     return roster
 
@@ -1578,6 +1974,10 @@ def meta(type, fields=None):
 
     For example, to get a list of leader categories to use when calling team_leaders():
     statsapi.meta('leagueLeaderTypes')
+
+    Results are kept for META_TTL (a week) and, if configured, on disk (see
+    statsapi.configure_meta_cache()). Use statsapi.meta_name() to decode a
+    code, e.g. statsapi.meta_name('pitchTypes', 'FF').
     """
     types = [
         "awards",
@@ -1612,7 +2012,7 @@ def meta(type, fields=None):
     if type not in types:
         raise ValueError("Invalid meta type. Available meta types: %s." % types)
 
-    return get("meta", {"type": type})
+    return get_meta_cache().get(type)
 
 
 def notes(endpoint):
@@ -1653,139 +2053,275 @@ def notes(endpoint):
     return msg
 
 
-def get(endpoint, params={}, force=False, *, request_kwargs={}):
+def _build_url(endpoint, params={}, force=False):
+    """Validate params against the endpoint configuration and return the request URL."""
+    return urls.build_url(endpoint, params, force)
+
+
+def _raise_not_found(url):
+    response = requests.Response()
+    response.status_code = 404
+    response.reason = "Not Found (cached)"
+    response.url = url
+    raise requests.exceptions.HTTPError(
+        "404 Client Error: Not Found (cached) for url: {}".format(url),
+        response=response,
+    )
+
+
+def get(endpoint, params={}, force=False, *, request_kwargs={}, cache_ttl=None):
     """Call MLB StatsAPI and return JSON data.
 
     This function is for advanced querying of the MLB StatsAPI,
     and is used by the functions in this library.
+
+    Responses are cached by URL for the endpoint's default TTL (see
+    statsapi.cache.ENDPOINT_TTLS). Pass cache_ttl to override the TTL for
+    this call; cache_ttl=0 bypasses the cache. 404 responses are remembered
+    in the negative cache (see statsapi.get_negative_cache()) and raised again
+    without a request until they expire. Expired responses that came
+    with an ETag or Last-Modified header are revalidated with a conditional
+    request, and reused without decoding again if the server answers 304.
+
+    While a request for a URL is in flight, other threads requesting the same
+    URL wait for it and share its result instead of sending their own.
+
+    Requests are paced by the shared rate limiter, and 429 and 5xx responses
+    are retried with backoff (see statsapi.ratelimit).
+
+    If the API keeps failing, its circuit breaker opens and requests fail fast
+    with CircuitOpenError (see statsapi.breaker). When a request fails or is
+    refused this way, the last cached response for the URL is returned instead,
+    flagged so that statsapi.is_stale(result) is True.
+
+    Call counts, latency, response size, decode time and cache hits are
+    recorded per endpoint in statsapi.get_metrics().
     """
-    # Lookup endpoint from input parameter
-    ep = ENDPOINTS.get(endpoint)
-    if not ep:
-        raise ValueError("Invalid endpoint (" + str(endpoint) + ").")
-
-    url = ep["url"]
-    logger.debug("URL: {}".format(url))
-
-    path_params = {}
-    query_params = {}
-
-    # Parse parameters into path and query parameters, and discard invalid parameters
-    for p, pv in params.items():
-        if ep["path_params"].get(p):
-            logger.debug("Found path param: {}".format(p))
-            if ep["path_params"][p].get("type") == "bool":
-                if str(pv).lower() == "false":
-                    path_params.update({p: ep["path_params"][p].get("False", "")})
-                elif str(pv).lower() == "true":
-                    path_params.update({p: ep["path_params"][p].get("True", "")})
-            else:
-                path_params.update({p: str(pv)})
-        elif p in ep["query_params"]:
-            logger.debug("Found query param: {}".format(p))
-            query_params.update({p: str(pv)})
-        else:
-            if force:
-                logger.debug(
-                    "Found invalid param, forcing into query parameters per force flag: {}".format(
-                        p
-                    )
-                )
-                query_params.update({p: str(pv)})
-            else:
-                logger.debug("Found invalid param, ignoring: {}".format(p))
-
-    logger.debug("path_params: {}".format(path_params))
-    logger.debug("query_params: {}".format(query_params))
-
-    # Replace path parameters with their values
-    for k, v in path_params.items():
-        logger.debug("Replacing {%s}" % k)
-        url = url.replace(
-            "{" + k + "}",
-            ("/" if ep["path_params"][k]["leading_slash"] else "")
-            + v
-            + ("/" if ep["path_params"][k]["trailing_slash"] else ""),
+    url = _build_url(endpoint, params, force)
+
+    if len(request_kwargs):
+        logger.debug(
+            "Including request_kwargs in requests.get call: %s", request_kwargs
         )
-        logger.debug("URL: {}".format(url))
 
-    while url.find("{") != -1 and url.find("}") > url.find("{"):
-        param = url[url.find("{") + 1 : url.find("}")]
-        if ep.get("path_params", {}).get(param, {}).get("required"):
-            if (
-                ep["path_params"][param]["default"]
-                and ep["path_params"][param]["default"] != ""
-            ):
-                logger.debug(
-                    "Replacing {%s} with default: %s."
-                    % (param, ep["path_params"][param]["default"])
-                )
-                url = url.replace(
-                    "{" + param + "}",
-                    ("/" if ep["path_params"][param]["leading_slash"] else "")
-                    + ep["path_params"][param]["default"]
-                    + ("/" if ep["path_params"][param]["trailing_slash"] else ""),
-                )
+    ttl = endpoint_ttl(endpoint) if cache_ttl is None else cache_ttl
+    cache = get_cache() if ttl else None
+    expired = None
+    if cache is not None:
+        cached = cache.get(url)
+        get_metrics().record_cache(endpoint, cached is not None)
+        if cached is not None:
+            logger.debug("Returning cached response for %s", url)
+            return cached
+        expired = cache.lookup(url)
+
+    negative = get_negative_cache() if cache_ttl != 0 else None
+    if negative is not None and negative.check(url) == NOT_FOUND:
+        logger.debug("Returning cached 404 for %s", url)
+        _raise_not_found(url)
+
+    def fetch():
+        kwargs = request_kwargs
+        if expired is not None and (expired.etag or expired.last_modified):
+            # Ask the server to confirm the expired entry is still current
+            headers = dict(request_kwargs.get("headers") or {})
+            if expired.etag:
+                headers["If-None-Match"] = expired.etag
+            if expired.last_modified:
+                headers["If-Modified-Since"] = expired.last_modified
+            kwargs = dict(request_kwargs, headers=headers)
+
+        # Make the request using the shared pooled client, under the shared
+        # rate limiter and retrying throttled or failed requests
+        with get_metrics().timer(endpoint) as timing:
+            r = ratelimit.send(endpoint, lambda: get_client().get(url, **kwargs))
+            if r.status_code == 304 and expired is not None:
+                logger.debug("Revalidated cached response for %s", url)
+                cache.refresh(url, ttl)
+                return expired.data
+            elif r.status_code not in [200, 201]:
+                if r.status_code == 404 and negative is not None:
+                    negative.add(url, NOT_FOUND)
+                r.raise_for_status()
             else:
-                if force:
-                    logger.warning(
-                        "Missing required path parameter {%s}, proceeding anyway per force flag..."
-                        % param
+                timing["bytes"] = len(r.content)
+                decode_start = time.perf_counter()
+                data = decoder.loads(r.content)
+                timing["decode_time"] = time.perf_counter() - decode_start
+                if cache is not None:
+                    cache.set(
+                        url,
+                        data,
+                        len(r.content),
+                        ttl,
+                        etag=r.headers.get("ETag"),
+                        last_modified=r.headers.get("Last-Modified"),
+                        body=r.content,
                     )
+                return data
+
+        return None
+
+    # Concurrent callers for the same URL share a single request, and the
+    # host's circuit breaker falls back to the expired entry if the API is down.
+    # The breaker runs inside the flight so a shared request counts once.
+    return get_flight().do(
+        url,
+        lambda: breaker.guard(
+            urlsplit(url).netloc,
+            fetch,
+            stale=lambda: expired.data if expired is not None else None,
+        ),
+    )
+
+
+def get_paths(endpoint, params, paths, force=False, *, request_kwargs={}):
+    """Call MLB StatsAPI and return only the values at paths, as {path: value}.
+
+    paths are dotted object keys into the response, e.g.
+    "liveData.boxscore.teams.away.pitchers". The response is parsed as it
+    downloads (see statsapi.stream) and only the requested values are decoded,
+    so narrow lookups into large payloads such as the game feed use little
+    memory. Paths missing from the response are left out of the result.
+
+    Responses are not cached, but requests go through the shared client, rate
+    limiter, circuit breaker and metrics like statsapi.get().
+    """
+    url = _build_url(endpoint, params, force)
+    kwargs = dict(request_kwargs, stream=True)
+
+    def fetch():
+        with get_metrics().timer(endpoint) as timing:
+            r = ratelimit.send(endpoint, lambda: get_client().get(url, **kwargs))
+            try:
+                if r.status_code not in [200, 201]:
+                    r.raise_for_status()
+                    return {}
+                # Parse the body as it downloads, unless there is no stream to
+                # read, e.g. a cassette adapter has already read or replayed it
+                if (
+                    stream.ijson is not None
+                    and r.raw is not None
+                    and not r._content_consumed
+                ):
+                    r.raw.decode_content = True
+                    source = r.raw
                 else:
-                    raise ValueError("Missing required path parameter {%s}" % param)
-        else:
-            logger.debug("Removing optional param {%s}" % param)
-            url = url.replace("{" + param + "}", "")
-
-        logger.debug("URL: {}".format(url))
-    # Add query parameters to the URL
-    if len(query_params) > 0:
-        for k, v in query_params.items():
-            logger.debug("Adding query parameter {}={}".format(k, v))
-            sep = "?" if url.find("?") == -1 else "&"
-            url += sep + k + "=" + v
-            logger.debug("URL: {}".format(url))
-
-    # Make sure required parameters are present
-    satisfied = False
-    missing_params = []
-    for x in ep.get("required_params", []):
-        if len(x) == 0:
-            satisfied = True
-        else:
-            missing_params.extend([a for a in x if a not in query_params])
-            if len(missing_params) == 0:
-                satisfied = True
-                break
+                    source = r.content
+                    timing["bytes"] = len(source)
+                decode_start = time.perf_counter()
+                found = stream.extract_paths(source, paths)
+                timing["decode_time"] = time.perf_counter() - decode_start
+                return found
+            finally:
+                r.close()
+
+    return breaker.guard(urlsplit(url).netloc, fetch)
+
+
+class BatchResult(namedtuple("BatchResult", ["params", "data", "error"])):
+    """Result of one request made by get_many().
+
+    data holds the JSON data if the request succeeded, otherwise error holds
+    the exception that was raised.
+    """
+
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+DEFAULT_MAX_WORKERS = 8
+"""Default number of concurrent requests made by get_many()"""
+
+
+def get_many(
+    endpoint,
+    params_list,
+    force=False,
+    max_workers=DEFAULT_MAX_WORKERS,
+    *,
+    request_kwargs={},
+    cache_ttl=None
+):
+    """Call MLB StatsAPI once for each dict in params_list, concurrently.
+
+    Requests that resolve to the same URL are only sent once. Returns a list of
+    BatchResult in the same order as params_list. A failed request does not
+    affect the others; its exception is returned in the result's error field.
 
-    if not satisfied and not force:
-        if ep.get("note"):
-            note = "\n--Endpoint note: " + ep.get("note")
+    For example, to get the rosters for several teams:
+    statsapi.get_many('team_roster', [{'teamId': 143}, {'teamId': 121}])
+    """
+    params_list = list(params_list)
+    urls = []
+    errors = {}
+    unique = {}
+    for i, params in enumerate(params_list):
+        try:
+            url = _build_url(endpoint, params, force)
+        except ValueError as e:
+            urls.append(None)
+            errors[i] = e
+            continue
+        urls.append(url)
+        unique.setdefault(url, params)
+
+    logger.debug(
+        "get_many: %s requests for %s resolved to %s unique URLs",
+        len(params_list),
+        endpoint,
+        len(unique),
+    )
+
+    def fetch(url):
+        try:
+            return (
+                get(
+                    endpoint,
+                    unique[url],
+                    force,
+                    request_kwargs=request_kwargs,
+                    cache_ttl=cache_ttl,
+                ),
+                None,
+            )
+        except Exception as e:
+            logger.debug("get_many: request for %s failed: %s", url, e)
+            return None, e
+
+    responses = dict(zip(unique, _imap(fetch, unique, max_workers)))
+
+    results = []
+    for i, params in enumerate(params_list):
+        if i in errors:
+            results.append(BatchResult(params, None, errors[i]))
         else:
-            note = ""
+            data, error = responses[urls[i]]
+            results.append(BatchResult(params, data, error))
 
-        raise ValueError(
-            "Missing required parameter(s): "
-            + ", ".join(missing_params)
-            + ".\n--Required parameters for the "
-            + endpoint
-            + " endpoint: "
-            + str(ep.get("required_params", []))
-            + ". \n--Note: If there are multiple sets in the required parameter list, you can choose any of the sets."
-            + note
-        )
+    return results
 
-    if len(request_kwargs):
-        logger.debug(
-            "Including request_kwargs in requests.get call: {}".format(request_kwargs)
-        )
 
-    # Make the request
-    r = requests.get(url, **request_kwargs)
-    if r.status_code not in [200, 201]:
-        r.raise_for_status()
-    else:
-        return r.json()
+def _imap(fn, items, max_workers=DEFAULT_MAX_WORKERS):
+    """Yield fn(item) for each of items, in order, running up to max_workers at once.
 
-    return None
+    The calls run on the shared executor (see statsapi.get_executor()). Only
+    max_workers calls are submitted ahead of the one being yielded, and each
+    result is released once it has been yielded. Calls not yet started are
+    cancelled if the caller stops iterating.
+    """
+    executor = get_executor()
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= max(1, max_workers):
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
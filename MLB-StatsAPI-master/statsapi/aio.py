@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+"""Asyncio client for the MLB Stats API.
+
+Requires aiohttp, which can be installed with ``pip install MLB-StatsAPI[async]``.
+URLs are built and validated from the same ENDPOINTS configuration as
+statsapi.get(), and responses share the same response cache.
+
+Example, fetching the boxscores for a whole slate concurrently::
+
+    async with AsyncClient() as client:
+        games = await client.schedule(date="2025-04-01")
+        boxes = await asyncio.gather(
+            *(client.boxscore_data(g["game_id"]) for g in games)
+        )
+"""
+import asyncio
+import logging
+import time
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only without aiohttp
+    aiohttp = None
+
+from datetime import datetime
+
+from . import (
+    _build_url,
+    _schedule_params,
+    _schedule_games,
+    _boxscore_params,
+    _boxscore_data,
+    _player_stat_params,
+    _player_stat_data,
+    _roster_params,
+    _roster,
+)
+from . import decoder
+from .cache import get_cache, endpoint_ttl
+from .metrics import get_metrics
+from .ratelimit import get_rate_limiter, get_retry_policy
+
+logger = logging.getLogger("statsapi")
+
+DEFAULT_LIMIT = 20
+"""Default maximum number of simultaneous connections"""
+DEFAULT_TIMEOUT = 30
+"""Default total timeout in seconds for each request"""
+
+
+class AsyncClient(object):
+    """Asyncio counterpart to statsapi.get() and the main wrapper functions.
+
+    limit caps the number of simultaneous connections, timeout is the total
+    timeout in seconds for each request, and headers are added to every request.
+    Use as an async context manager, or call close() when finished.
+    """
+
+    def __init__(self, limit=DEFAULT_LIMIT, timeout=DEFAULT_TIMEOUT, headers=None):
+        if aiohttp is None:
+            raise ImportError(
+                "statsapi.aio requires aiohttp. Install it with: pip install aiohttp"
+            )
+        self.limit = limit
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self._session = None
+
+    @property
+    def session(self):
+        """The aiohttp.ClientSession, created on first use inside the running loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=self.headers,
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def get(
+        self, endpoint, params={}, force=False, *, request_kwargs={}, cache_ttl=None
+    ):
+        """Call MLB StatsAPI and return JSON data. See statsapi.get().
+
+        Non-200 responses raise aiohttp.ClientResponseError.
+        """
+        url = _build_url(endpoint, params, force)
+
+        ttl = endpoint_ttl(endpoint) if cache_ttl is None else cache_ttl
+        cache = get_cache() if ttl else None
+        if cache is not None:
+            cached = cache.get(url)
+            get_metrics().record_cache(endpoint, cached is not None)
+            if cached is not None:
+                logger.debug("Returning cached response for %s", url)
+                return cached
+
+        limiter = get_rate_limiter()
+        retry = get_retry_policy()
+        attempt = 0
+        with get_metrics().timer(endpoint) as timing:
+            while True:
+                wait = limiter.reserve(endpoint)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                async with self.session.get(url, **request_kwargs) as r:
+                    if not retry.should_retry(r.status, attempt):
+                        if r.status not in [200, 201]:
+                            r.raise_for_status()
+                        body = await r.read()
+                        break
+                    delay = retry.delay(attempt, r.headers.get("Retry-After"))
+                    if r.status == 429:
+                        limiter.throttled(endpoint, delay)
+                logger.warning(
+                    "{} returned {}, retrying in {:.2f}s (attempt {} of {})".format(
+                        endpoint, r.status, delay, attempt + 1, retry.max_retries
+                    )
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+            limiter.succeeded(endpoint)
+
+            timing["bytes"] = len(body)
+            decode_start = time.perf_counter()
+            data = decoder.loads(body)
+            timing["decode_time"] = time.perf_counter() - decode_start
+        if cache is not None:
+            cache.set(url, data, len(body), ttl, body=body)
+        return data
+
+    async def schedule(
+        self,
+        date=None,
+        start_date=None,
+        end_date=None,
+        team="",
+        opponent="",
+        sportId=1,
+        game_id=None,
+        leagueId=None,
+        season=None,
+        include_series_status=True,
+        projection=None,
+    ):
+        """Get list of games for a given date/range and/or team/opponent."""
+        params = _schedule_params(
+            date,
+            start_date,
+            end_date,
+            team,
+            opponent,
+            sportId,
+            game_id,
+            leagueId,
+            season,
+            include_series_status,
+            projection,
+        )
+        r = await self.get("schedule", params)
+
+        return _schedule_games(r, projection)
+
+    async def boxscore_data(self, gamePk, timecode=None):
+        """Returns a python dict containing boxscore data for a given game."""
+        r = await self.get("game", _boxscore_params(gamePk, timecode))
+
+        return _boxscore_data(r)
+
+    async def player_stat_data(
+        self,
+        personId,
+        group="[hitting,pitching,fielding]",
+        type="season",
+        sportId=1,
+        season=None,
+        projection=None,
+    ):
+        """Returns a list of current season or career stat data for a given player."""
+        params = _player_stat_params(personId, group, type, sportId, season, projection)
+        r = await self.get("person", params, cache_ttl=endpoint_ttl("person_stats"))
+
+        return _player_stat_data(r, projection)
+
+    async def roster(
+        self,
+        teamId,
+        rosterType=None,
+        season=datetime.now().year,
+        date=None,
+        projection=None,
+    ):
+        """Get the roster for a given team."""
+        r = await self.get(
+            "team_roster", _roster_params(teamId, rosterType, season, date, projection)
+        )
+
+        return _roster(r, projection)
@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+"""Lazy boxscore data returned by statsapi.boxscore_data().
+
+BoxscoreData is a dict-like view over a game endpoint response. The raw
+sections (gameId, teamInfo, playerInfo, away, home) are available immediately;
+the derived tables (awayBatters, homePitchingTotals, gameBoxInfo, ...) are
+built the first time they are read and then kept, so callers only pay for the
+tables they use.
+"""
+from collections.abc import MutableMapping
+
+SIDES = ("away", "home")
+
+_BATTER_STATS = (
+    ("ab", "atBats"),
+    ("r", "runs"),
+    ("h", "hits"),
+    ("doubles", "doubles"),
+    ("triples", "triples"),
+    ("hr", "homeRuns"),
+    ("rbi", "rbi"),
+    ("sb", "stolenBases"),
+    ("bb", "baseOnBalls"),
+    ("k", "strikeOuts"),
+    ("lob", "leftOnBase"),
+)
+_PITCHER_STATS = (
+    ("ip", "inningsPitched"),
+    ("h", "hits"),
+    ("r", "runs"),
+    ("er", "earnedRuns"),
+    ("bb", "baseOnBalls"),
+    ("k", "strikeOuts"),
+    ("hr", "homeRuns"),
+)
+
+
+def _batter_header(team_name):
+    return {
+        "namefield": team_name + " Batters",
+        "ab": "AB",
+        "r": "R",
+        "h": "H",
+        "doubles": "2B",
+        "triples": "3B",
+        "hr": "HR",
+        "rbi": "RBI",
+        "sb": "SB",
+        "bb": "BB",
+        "k": "K",
+        "lob": "LOB",
+        "avg": "AVG",
+        "ops": "OPS",
+        "personId": 0,
+        "substitution": False,
+        "note": "",
+        "name": team_name + " Batters",
+        "position": "",
+        "obp": "OBP",
+        "slg": "SLG",
+        "battingOrder": "",
+    }
+
+
+def _pitcher_header(team_name, name):
+    return {
+        "namefield": team_name + " Pitchers",
+        "ip": "IP",
+        "h": "H",
+        "r": "R",
+        "er": "ER",
+        "bb": "BB",
+        "k": "K",
+        "hr": "HR",
+        "era": "ERA",
+        "p": "P",
+        "s": "S",
+        "name": name + " Pitchers",
+        "personId": 0,
+        "note": "",
+    }
+
+
+def _batters(box, side):
+    team = box[side]
+    players = team["players"]
+    player_info = box["playerInfo"]
+    batters = [_batter_header(box["teamInfo"][side]["teamName"])]
+
+    for batter_id in team["batters"]:
+        player = players.get("ID" + str(batter_id), {})
+        if not player.get("battingOrder"):
+            continue
+        batting = player.get("stats", {}).get("batting", {})
+        if not len(batting):
+            # Protect against player with no batting data in the box score (#37)
+            continue
+
+        batting_order = str(player["battingOrder"])
+        season = player["seasonStats"]["batting"]
+        name = player_info["ID" + str(batter_id)]["boxscoreName"]
+        position = player["position"]["abbreviation"]
+        note = batting.get("note", "")
+        starter = batting_order[-1] == "0"
+
+        batter = {
+            "namefield": (batting_order[0] if starter else "   ")
+            + " "
+            + note
+            + name
+            + "  "
+            + position
+        }
+        for key, stat in _BATTER_STATS:
+            batter[key] = str(batting[stat])
+        batter.update(
+            {
+                "avg": str(season["avg"]),
+                "ops": str(season["ops"]),
+                "personId": batter_id,
+                "battingOrder": batting_order,
+                "substitution": not starter,
+                "note": note,
+                "name": name,
+                "position": position,
+                "obp": str(season["obp"]),
+                "slg": str(season["slg"]),
+            }
+        )
+        batters.append(batter)
+
+    return batters
+
+
+def _batting_totals(box, side):
+    batting = box[side]["teamStats"]["batting"]
+    return {
+        "namefield": "Totals",
+        "ab": str(batting["atBats"]),
+        "r": str(batting["runs"]),
+        "h": str(batting["hits"]),
+        "hr": str(batting["homeRuns"]),
+        "rbi": str(batting["rbi"]),
+        "bb": str(batting["baseOnBalls"]),
+        "k": str(batting["strikeOuts"]),
+        "lob": str(batting["leftOnBase"]),
+        "avg": "",
+        "ops": "",
+        "obp": "",
+        "slg": "",
+        "name": "Totals",
+        "position": "",
+        "note": "",
+        "substitution": False,
+        "battingOrder": "",
+        "personId": 0,
+    }
+
+
+def _batting_notes(box, side):
+    return {i: n["label"] + "-" + n["value"] for i, n in enumerate(box[side]["note"])}
+
+
+def _pitchers(box, side):
+    team = box[side]
+    players = team["players"]
+    player_info = box["playerInfo"]
+    # The home header row has always been named after the away team
+    pitchers = [
+        _pitcher_header(
+            box["teamInfo"][side]["teamName"], box["teamInfo"]["away"]["teamName"]
+        )
+    ]
+
+    for pitcher_id in team["pitchers"]:
+        player = players.get("ID" + str(pitcher_id))
+        if not player or not len(player.get("stats", {}).get("pitching", {})):
+            # Skip pitcher with no pitching data in the box score (#37)
+            # Or skip pitcher listed under the wrong team (from comments on #37)
+            continue
+
+        pitching = player["stats"]["pitching"]
+        name = player_info["ID" + str(pitcher_id)]["boxscoreName"]
+        note = pitching.get("note", "")
+
+        pitcher = {"namefield": name + ("  " + note if note else "")}
+        for key, stat in _PITCHER_STATS:
+            pitcher[key] = str(pitching[stat])
+        pitcher.update(
+            {
+                "p": str(
+                    pitching.get("pitchesThrown", pitching.get("numberOfPitches", 0))
+                ),
+                "s": str(pitching["strikes"]),
+                "era": str(player["seasonStats"]["pitching"]["era"]),
+                "name": name,
+                "personId": pitcher_id,
+                "note": note,
+            }
+        )
+        pitchers.append(pitcher)
+
+    return pitchers
+
+
+def _pitching_totals(box, side):
+    pitching = box[side]["teamStats"]["pitching"]
+    return {
+        "namefield": "Totals",
+        "ip": str(pitching["inningsPitched"]),
+        "h": str(pitching["hits"]),
+        "r": str(pitching["runs"]),
+        "er": str(pitching["earnedRuns"]),
+        "bb": str(pitching["baseOnBalls"]),
+        "k": str(pitching["strikeOuts"]),
+        "hr": str(pitching["homeRuns"]),
+        "p": "",
+        "s": "",
+        "era": "",
+        "name": "Totals",
+        "personId": 0,
+        "note": "",
+    }
+
+
+def _game_box_info(box, side):
+    return box.response["liveData"]["boxscore"].get("info", [])
+
+
+# Derived keys in the order boxscore_data() has always returned them
+_DERIVED = {}
+for _name, _builder in (
+    ("Batters", _batters),
+    ("BattingTotals", _batting_totals),
+    ("BattingNotes", _batting_notes),
+    ("Pitchers", _pitchers),
+    ("PitchingTotals", _pitching_totals),
+):
+    for _side in SIDES:
+        _DERIVED[_side + _name] = (_builder, _side)
+_DERIVED["gameBoxInfo"] = (_game_box_info, None)
+
+
+class BoxscoreData(MutableMapping):
+    """Dict-compatible boxscore data built lazily from a game endpoint response.
+
+    Supports everything a dict does (indexing, get, iteration, items, len,
+    assignment, deletion). Reading a derived table builds and caches it;
+    iterating over items() or calling to_dict() builds all of them. Use
+    to_dict() when a real dict is needed, e.g. for json.dumps().
+    """
+
+    def __init__(self, response):
+        self.response = response
+        boxscore = response["liveData"]["boxscore"]["teams"]
+        self._data = {
+            "gameId": response["gameData"]["game"]["id"],
+            "teamInfo": response["gameData"]["teams"],
+            "playerInfo": response["gameData"]["players"],
+            "away": boxscore["away"],
+            "home": boxscore["home"],
+        }
+        self._pending = set(_DERIVED)
+
+    def __getitem__(self, key):
+        try:
+            return self._data[key]
+        except KeyError:
+            if key not in self._pending:
+                raise
+        builder, side = _DERIVED[key]
+        value = builder(self, side)
+        self[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._pending.discard(key)
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        if key in self._pending:
+            self._pending.discard(key)
+        else:
+            del self._data[key]
+
+    def __iter__(self):
+        # Same order as the dict boxscore_data() used to build eagerly
+        for key in _ORDER:
+            if key in self._data or key in self._pending:
+                yield key
+        for key in list(self._data):
+            if key not in _ORDER:
+                yield key
+
+    def __len__(self):
+        return len(self._data) + len(self._pending)
+
+    def __contains__(self, key):
+        return key in self._data or key in self._pending
+
+    def __repr__(self):
+        return "BoxscoreData(gameId={!r}, built={})".format(
+            self._data.get("gameId"), [k for k in self._data if k in _DERIVED]
+        )
+
+    def is_built(self, key):
+        """Return True if the derived table key has already been built."""
+        return key in self._data
+
+    def to_dict(self):
+        """Build every table and return them as a plain dict."""
+        return {k: self[k] for k in self}
+
+
+_ORDER = ("gameId", "teamInfo", "playerInfo", "away", "home") + tuple(_DERIVED)
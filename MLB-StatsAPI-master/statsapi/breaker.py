@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+"""Per-host circuit breakers with stale-if-error fallback.
+
+After failure_threshold consecutive failed requests to a host, its breaker
+opens. While it is open, requests to the host fail immediately instead of
+waiting for a timeout, and the last good value is returned (marked stale)
+where one is available. A background probe retries the host at most once
+every probe_interval seconds and closes the breaker once it succeeds.
+"""
+import logging
+import threading
+import time
+
+import requests
+
+logger = logging.getLogger("statsapi")
+
+DEFAULT_FAILURE_THRESHOLD = 5
+"""Consecutive failures that open a host's breaker"""
+DEFAULT_PROBE_INTERVAL = 15.0
+"""Minimum seconds between background probes of an open host"""
+
+CLOSED = "closed"
+OPEN = "open"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to a host whose breaker is open."""
+
+
+class StaleDict(dict):
+    """A previously cached dict served in place of a failed request."""
+
+    stale = True
+
+
+class StaleList(list):
+    """A previously cached list served in place of a failed request."""
+
+    stale = True
+
+
+def mark_stale(data):
+    """Return a shallow copy of data flagged with stale = True."""
+    if isinstance(data, dict):
+        return StaleDict(data)
+    if isinstance(data, list):
+        return StaleList(data)
+    return data
+
+
+def is_stale(data):
+    """Return True if data was served from a stale cache entry."""
+    return getattr(data, "stale", False) is True
+
+
+def is_failure(error):
+    """Return True if error indicates an upstream problem that should trip a breaker."""
+    if isinstance(error, requests.exceptions.HTTPError):
+        response = error.response
+        return response is None or response.status_code >= 500
+    return isinstance(
+        error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    )
+
+
+class CircuitBreaker(object):
+    """Circuit breaker for a single host."""
+
+    def __init__(
+        self,
+        host,
+        failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+        probe_interval=DEFAULT_PROBE_INTERVAL,
+    ):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._last_probe = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Return True if a request to the host should be sent."""
+        return self.state == CLOSED
+
+    def record_success(self):
+        with self._lock:
+            if self.state == OPEN:
+                logger.warning("{} recovered, closing circuit".format(self.host))
+            self.state = CLOSED
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == CLOSED and self.failures >= self.failure_threshold:
+                logger.warning(
+                    "{} failed {} times in a row, opening circuit".format(
+                        self.host, self.failures
+                    )
+                )
+                self.state = OPEN
+                self.opened_at = time.time()
+                self._last_probe = time.monotonic()
+
+    def probe(self, request):
+        """Run request() in a background thread to test whether the host has recovered.
+
+        Does nothing if a probe is already running or the last one started less
+        than probe_interval seconds ago.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._probing or now - self._last_probe < self.probe_interval:
+                return False
+            self._probing = True
+            self._last_probe = now
+
+        def run():
+            try:
+                request()
+            except Exception as e:
+                logger.debug("Probe of %s failed: %s", self.host, e)
+                if is_failure(e):
+                    self.record_failure()
+                else:
+                    self.record_success()
+            else:
+                self.record_success()
+            finally:
+                self._probing = False
+
+        threading.Thread(
+            target=run, name="statsapi-probe-" + self.host, daemon=True
+        ).start()
+        return True
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+_settings = {
+    "failure_threshold": DEFAULT_FAILURE_THRESHOLD,
+    "probe_interval": DEFAULT_PROBE_INTERVAL,
+}
+
+
+def get_breaker(host):
+    """Return the shared CircuitBreaker for host, creating it on first use."""
+    breaker = _breakers.get(host)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(host)
+            if breaker is None:
+                breaker = _breakers[host] = CircuitBreaker(host, **_settings)
+    return breaker
+
+
+def configure_breakers(
+    failure_threshold=DEFAULT_FAILURE_THRESHOLD, probe_interval=DEFAULT_PROBE_INTERVAL
+):
+    """Set the options for circuit breakers and reset every host to closed."""
+    with _breakers_lock:
+        _settings.update(
+            {"failure_threshold": failure_threshold, "probe_interval": probe_interval}
+        )
+        _breakers.clear()
+
+
+def guard(host, request, stale=None):
+    """Call request() through host's circuit breaker and return its result.
+
+    stale is an optional function returning the last good value, or None if
+    there is none. If the breaker is open, or request() fails with an upstream
+    error, that value is returned marked stale (see is_stale()). Otherwise
+    CircuitOpenError or the original error is raised.
+    """
+    breaker = get_breaker(host)
+    if not breaker.allow():
+        breaker.probe(request)
+        data = stale() if stale is not None else None
+        if data is None:
+            raise CircuitOpenError("Circuit open for {}".format(host))
+        logger.debug("Circuit open for %s, serving stale data", host)
+        return mark_stale(data)
+
+    try:
+        data = request()
+    except Exception as e:
+        if not is_failure(e):
+            raise
+        breaker.record_failure()
+        data = stale() if stale is not None else None
+        if data is None:
+            raise
+        logger.warning("Request to {} failed ({}), serving stale data".format(host, e))
+        return mark_stale(data)
+
+    breaker.record_success()
+    return data
@@ -0,0 +1,447 @@
+#!/usr/bin/env python
+"""Response cache used by statsapi.get().
+
+Responses are keyed on the final request URL and kept for a TTL that depends on
+the endpoint. The in-memory tier is bounded by the size of the response bodies
+and evicts the least recently used entries first. An optional on-disk tier keeps
+entries across process restarts.
+
+Expired entries are kept along with their ETag and Last-Modified validators
+so they can be revalidated with a conditional request instead of downloaded
+again.
+
+Cached results are shared between callers, so treat them as read-only.
+
+A separate NegativeCache remembers lookups that found nothing (404 responses,
+unknown names, empty Statcast results) for a short TTL, so they are not
+repeated on every page rerun.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from . import decoder
+
+logger = logging.getLogger("statsapi")
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+DEFAULT_TTL = 0
+"""TTL in seconds for endpoints not listed in ENDPOINT_TTLS (0 disables caching)"""
+
+ENDPOINT_TTLS = {
+    # Reference data that practically never changes
+    "meta": 7 * DAY,
+    "awards": DAY,
+    "conferences": DAY,
+    "divisions": DAY,
+    "league": DAY,
+    "seasons": DAY,
+    "season": DAY,
+    "sports": DAY,
+    "venue": DAY,
+    "teams": DAY,
+    "teams_history": DAY,
+    "teams_affiliates": DAY,
+    "team": HOUR,  # last_game()/next_game() use the schedule TTL
+    "gamePace": DAY,
+    # People and rosters (requests for player stats use the person_stats TTL)
+    "person": DAY,
+    "people": HOUR,
+    "sports_players": DAY,
+    "team_roster": HOUR,
+    "team_coaches": DAY,
+    "team_personnel": DAY,
+    # Stats that move at most a few times a day
+    "person_stats": 10 * MINUTE,
+    "stats": 10 * MINUTE,
+    "stats_leaders": HOUR,
+    "team_leaders": HOUR,
+    "team_stats": 10 * MINUTE,
+    "teams_stats": 10 * MINUTE,
+    "standings": 10 * MINUTE,
+    # Schedule changes every few minutes on game days
+    "schedule": 5 * MINUTE,
+    "schedule_postseason": 5 * MINUTE,
+    "schedule_postseason_series": 5 * MINUTE,
+    # Live game data changes every pitch
+    "game": 5,
+    "game_boxscore": 5,
+    "game_linescore": 5,
+    "game_playByPlay": 5,
+    "game_winProbability": 5,
+    "game_contextMetrics": 5,
+    "game_content": MINUTE,
+}
+"""Default TTL in seconds for each endpoint name"""
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+"""Default size limit for the in-memory tier, measured in response body bytes"""
+
+DISK_FILE_PREFIX = "statsapi-"
+"""Prefix of the files DiskCache writes; clear() removes only files with it"""
+
+NOT_FOUND = "not_found"
+NO_DATA = "no_data"
+
+NEGATIVE_TTLS = {
+    NOT_FOUND: 10 * MINUTE,
+    NO_DATA: 5 * MINUTE,
+}
+"""Default TTL in seconds for each kind of negative result"""
+
+NEGATIVE_MAX_ENTRIES = 10000
+"""Default number of negative results remembered"""
+
+
+class CacheEntry(object):
+    """A cached response: decoded data plus the bookkeeping needed to expire it."""
+
+    __slots__ = ("data", "size", "expires", "etag", "last_modified")
+
+    def __init__(self, data, size, expires, etag=None, last_modified=None):
+        self.data = data
+        self.size = size
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def fresh(self):
+        return time.time() < self.expires
+
+
+class DiskCache(object):
+    """On-disk cache tier storing one file per URL under path.
+
+    Each file holds a JSON metadata line followed by the raw response body.
+    Files are named statsapi-<hash>.json; clear() removes only those, so path
+    may be shared with other files.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, url):
+        return os.path.join(
+            self.path,
+            DISK_FILE_PREFIX + hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json",
+        )
+
+    def get(self, url):
+        """Return (metadata, body) for url, or None if it is not stored."""
+        try:
+            with open(self._file(url), "rb") as f:
+                meta = json.loads(f.readline().decode("utf-8"))
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return meta, body
+
+    def set(self, url, body, expires, etag=None, last_modified=None):
+        meta = {
+            "url": url,
+            "expires": expires,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(meta).encode("utf-8") + b"\n")
+                f.write(body)
+            os.replace(tmp, self._file(url))
+        except OSError as e:
+            logger.warning("Unable to write disk cache entry for {}: {}".format(url, e))
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def touch(self, url, expires):
+        """Update the expiry time stored for url without changing its body."""
+        stored = self.get(url)
+        if stored is not None:
+            meta, body = stored
+            self.set(url, body, expires, meta.get("etag"), meta.get("last_modified"))
+
+    def delete(self, url):
+        try:
+            os.remove(self._file(url))
+        except OSError:
+            pass
+
+    def clear(self):
+        for name in os.listdir(self.path):
+            if name.startswith(DISK_FILE_PREFIX) and name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except OSError:
+                    pass
+
+
+class ResponseCache(object):
+    """Thread-safe LRU response cache bounded by total body size in bytes.
+
+    If disk_path is provided, entries are also written to a DiskCache there and
+    loaded from it on an in-memory miss.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, disk_path=None):
+        self.max_bytes = max_bytes
+        self.disk = DiskCache(disk_path) if disk_path else None
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """Total body bytes held in memory."""
+        return self._bytes
+
+    def lookup(self, url):
+        """Return the CacheEntry for url whether or not it has expired, or None."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+                return entry
+        if self.disk is not None:
+            stored = self.disk.get(url)
+            if stored is not None:
+                meta, body = stored
+                try:
+                    data = decoder.loads(body)
+                except ValueError:
+                    self.disk.delete(url)
+                    return None
+                entry = CacheEntry(
+                    data,
+                    len(body),
+                    meta.get("expires", 0),
+                    meta.get("etag"),
+                    meta.get("last_modified"),
+                )
+                self._store(url, entry)
+                return entry
+        return None
+
+    def get(self, url):
+        """Return the cached data for url if it has not expired, else None."""
+        entry = self.lookup(url)
+        if entry is not None and entry.fresh:
+            self.hits += 1
+            return entry.data
+        self.misses += 1
+        return None
+
+    def set(self, url, data, size, ttl, etag=None, last_modified=None, body=None):
+        """Cache decoded data for url for ttl seconds.
+
+        size is the response body length used for the memory bound. body is the
+        raw response content, required for the entry to be written to disk.
+        """
+        entry = CacheEntry(data, size, time.time() + ttl, etag, last_modified)
+        self._store(url, entry)
+        if self.disk is not None and body is not None:
+            self.disk.set(url, body, entry.expires, etag, last_modified)
+        return entry
+
+    def refresh(self, url, ttl):
+        """Mark the entry for url fresh for another ttl seconds.
+
+        Used after the server confirms with a 304 Not Modified response that
+        the cached data is still current.
+        """
+        entry = self.lookup(url)
+        if entry is None:
+            return None
+        entry.expires = time.time() + ttl
+        self.revalidations += 1
+        if self.disk is not None:
+            self.disk.touch(url, entry.expires)
+        return entry
+
+    def _store(self, url, entry):
+        if entry.size > self.max_bytes:
+            logger.debug(
+                "Not caching %s (%s bytes exceeds cache size)", url, entry.size
+            )
+            return
+        with self._lock:
+            old = self._entries.pop(url, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[url] = entry
+            self._bytes += entry.size
+            while self._bytes > self.max_bytes:
+                evicted_url, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+                logger.debug("Evicted %s from response cache", evicted_url)
+
+    def delete(self, url):
+        with self._lock:
+            old = self._entries.pop(url, None)
+            if old is not None:
+                self._bytes -= old.size
+        if self.disk is not None:
+            self.disk.delete(url)
+
+    def clear(self):
+        """Remove all entries from memory and disk and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = self.revalidations = 0
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "revalidations": self.revalidations,
+        }
+
+
+class NegativeCache(object):
+    """Thread-safe cache of lookups that found nothing, keyed on any string.
+
+    Each entry records the kind of result (NOT_FOUND or NO_DATA) and expires
+    after the TTL configured for that kind. The oldest entries are dropped once
+    there are more than max_entries.
+    """
+
+    def __init__(self, ttls=None, max_entries=NEGATIVE_MAX_ENTRIES):
+        self.ttls = dict(NEGATIVE_TTLS)
+        self.ttls.update(ttls or {})
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = dict.fromkeys(self.ttls, 0)
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, key, kind=NOT_FOUND, ttl=None):
+        """Remember that key produced a negative result of kind."""
+        if ttl is None:
+            ttl = self.ttls[kind]
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (kind, time.time() + ttl)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def check(self, key):
+        """Return the kind of negative result remembered for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                kind, expires = entry
+                if time.time() < expires:
+                    self.hits[kind] = self.hits.get(kind, 0) + 1
+                    return kind
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = dict.fromkeys(self.ttls, 0)
+            self.misses = 0
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "hits": dict(self.hits),
+            "misses": self.misses,
+            "ttls": dict(self.ttls),
+        }
+
+
+_cache = ResponseCache()
+_endpoint_ttls = dict(ENDPOINT_TTLS)
+_negative = NegativeCache()
+
+
+def get_cache():
+    """Return the shared ResponseCache, or None if caching is disabled."""
+    return _cache
+
+
+def configure_cache(max_bytes=DEFAULT_MAX_BYTES, disk_path=None, enabled=True):
+    """Replace the shared response cache, e.g.
+
+    statsapi.configure_cache(max_bytes=128 * 1024 * 1024, disk_path=".statsapi_cache")
+    """
+    global _cache
+    _cache = ResponseCache(max_bytes, disk_path) if enabled else None
+    return _cache
+
+
+def clear_cache():
+    """Remove every entry from the shared response and negative caches."""
+    if _cache is not None:
+        _cache.clear()
+    _negative.clear()
+
+
+def get_negative_cache():
+    """Return the shared NegativeCache."""
+    return _negative
+
+
+def configure_negative_cache(
+    not_found=NEGATIVE_TTLS[NOT_FOUND],
+    no_data=NEGATIVE_TTLS[NO_DATA],
+    max_entries=NEGATIVE_MAX_ENTRIES,
+):
+    """Replace the shared negative cache with one using the given TTLs in seconds.
+
+    A TTL of 0 disables negative caching for that kind of result.
+    """
+    global _negative
+    _negative = NegativeCache({NOT_FOUND: not_found, NO_DATA: no_data}, max_entries)
+    return _negative
+
+
+def endpoint_ttl(endpoint):
+    """Return the TTL in seconds used when caching responses from endpoint."""
+    return _endpoint_ttls.get(endpoint, DEFAULT_TTL)
+
+
+def set_endpoint_ttl(endpoint, ttl):
+    """Override the default TTL for endpoint. A TTL of 0 disables caching it."""
+    _endpoint_ttls[endpoint] = ttl
@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+"""Record and replay HTTP traffic for offline benchmarks and tests.
+
+In record mode, every response received through the shared Client is saved to
+a cassette file. In replay mode, the Client is served from the cassette instead
+of the network, with optional artificial latency, so a page or script can be
+timed repeatably against a fixed game day::
+
+    with statsapi.use_cassette("data/2025-04-01.cassette.json.gz", mode="record"):
+        run_page()
+
+    with statsapi.use_cassette("data/2025-04-01.cassette.json.gz", latency=0.05):
+        run_page()  # no network access
+
+Anything fetched through statsapi.get_client() is covered, including the
+Savant helpers. Cassettes whose path ends in .gz are gzip compressed.
+"""
+import base64
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from . import client
+
+logger = logging.getLogger("statsapi")
+
+CASSETTE_VERSION = 1
+"""Format version written to cassette files"""
+
+RECORD = "record"
+REPLAY = "replay"
+
+_DROPPED_HEADERS = frozenset(
+    ["content-encoding", "content-length", "transfer-encoding", "connection"]
+)
+_sleep = time.sleep
+
+
+class CassetteMissError(requests.exceptions.ConnectionError):
+    """Raised in replay mode for a request that is not in the cassette."""
+
+
+class Cassette(object):
+    """Recorded responses keyed on method and URL.
+
+    Each URL keeps every response recorded for it, in order. Replaying a URL
+    steps through them and then keeps returning the last one, so polled
+    endpoints (e.g. live game feeds) play back as they were recorded.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.interactions = {}
+        self._positions = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self.load()
+
+    def __len__(self):
+        return sum(len(v) for v in self.interactions.values())
+
+    @staticmethod
+    def key(method, url):
+        return "{} {}".format(method.upper(), url)
+
+    def add(self, method, url, status, headers, body, elapsed=0.0):
+        """Record a response for method and url."""
+        try:
+            text, encoding = body.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            text, encoding = base64.b64encode(body).decode("ascii"), "base64"
+        interaction = {
+            "status": status,
+            "headers": {
+                k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS
+            },
+            "body": text,
+            "encoding": encoding,
+            "elapsed": round(elapsed, 4),
+        }
+        with self._lock:
+            self.interactions.setdefault(self.key(method, url), []).append(interaction)
+
+    def next(self, method, url):
+        """Return the next recorded interaction for method and url, or None."""
+        key = self.key(method, url)
+        with self._lock:
+            recorded = self.interactions.get(key)
+            if not recorded:
+                return None
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            return recorded[min(position, len(recorded) - 1)]
+
+    def rewind(self):
+        """Start replaying every URL from its first recorded response again."""
+        with self._lock:
+            self._positions.clear()
+
+    def load(self, path=None):
+        path = path or self.path
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            contents = json.load(f)
+        if contents.get("version") != CASSETTE_VERSION:
+            raise ValueError(
+                "Unsupported cassette version {} in {}".format(
+                    contents.get("version"), path
+                )
+            )
+        with self._lock:
+            self.interactions = contents["interactions"]
+            self._positions.clear()
+
+    def save(self, path=None):
+        path = path or self.path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        opener = gzip.open if path.endswith(".gz") else open
+        with self._lock:
+            contents = {"version": CASSETTE_VERSION, "interactions": self.interactions}
+            with opener(path, "wt", encoding="utf-8") as f:
+                json.dump(contents, f, separators=(",", ":"))
+        logger.debug("Saved {} responses to cassette {}".format(len(self), path))
+
+
+class RecordingAdapter(HTTPAdapter):
+    """HTTPAdapter that saves every response it receives to a Cassette."""
+
+    def __init__(self, cassette, **kwargs):
+        super(RecordingAdapter, self).__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        r = super(RecordingAdapter, self).send(request, **kwargs)
+        self.cassette.add(
+            request.method,
+            request.url,
+            r.status_code,
+            r.headers,
+            r.content,
+            r.elapsed.total_seconds(),
+        )
+        return r
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter that serves responses from a Cassette.
+
+    latency is the delay in seconds added to every response; pass None to
+    replay the response times observed while recording.
+    """
+
+    def __init__(self, cassette, latency=0.0):
+        super(ReplayAdapter, self).__init__()
+        self.cassette = cassette
+        self.latency = latency
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):
+        interaction = self.cassette.next(request.method, request.url)
+        if interaction is None:
+            raise CassetteMissError(
+                "No recorded response for {} {}".format(request.method, request.url),
+                request=request,
+            )
+
+        delay = interaction["elapsed"] if self.latency is None else self.latency
+        if delay:
+            _sleep(delay)
+
+        r = requests.Response()
+        r.status_code = interaction["status"]
+        r.headers = CaseInsensitiveDict(interaction["headers"])
+        r.encoding = get_encoding_from_headers(r.headers)
+        if interaction["encoding"] == "base64":
+            r._content = base64.b64decode(interaction["body"])
+        else:
+            r._content = interaction["body"].encode("utf-8")
+        r.url = request.url
+        r.request = request
+        r.connection = self
+        return r
+
+    def close(self):
+        pass
+
+
+@contextmanager
+def use_cassette(path, mode=REPLAY, latency=0.0):
+    """Route the shared Client through a cassette for the duration of the block.
+
+    mode is "record" to save responses to path (written when the block exits),
+    or "replay" to serve them from path. latency applies to replay mode (see
+    ReplayAdapter). The previous shared Client is restored afterwards.
+    """
+    if mode == RECORD:
+        # Start empty, even if there is already a cassette at path
+        cassette = Cassette()
+        cassette.path = path
+        adapter = RecordingAdapter(
+            cassette,
+            pool_connections=client.DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=client.DEFAULT_POOL_MAXSIZE,
+        )
+    elif mode == REPLAY:
+        if not os.path.exists(path):
+            raise ValueError("Cassette {} does not exist".format(path))
+        cassette = Cassette(path)
+        adapter = ReplayAdapter(cassette, latency)
+    else:
+        raise ValueError("Invalid cassette mode ({}).".format(mode))
+
+    previous = client.get_client()
+    client.set_client(
+        client.Client(
+            timeout=previous.timeout, headers=previous.headers, adapter=adapter
+        )
+    )
+    try:
+        yield cassette
+    finally:
+        client.set_client(previous)
+        if mode == RECORD:
+            cassette.save()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+"""HTTP client used by MLB-StatsAPI to talk to the Stats API.
+
+Each thread gets its own ``requests.Session``, but every session is mounted
+with the same transport adapter, so all threads draw keep-alive connections
+from one thread-safe urllib3 pool. Sessions are only weakly tracked: when a
+thread exits (e.g. a Streamlit rerun), its session is released while the
+pooled connections stay open for the next thread.
+"""
+import logging
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger("statsapi")
+
+DEFAULT_POOL_CONNECTIONS = 10
+"""Number of host connection pools kept per session"""
+DEFAULT_POOL_MAXSIZE = 20
+"""Maximum number of connections kept alive per host"""
+DEFAULT_TIMEOUT = (3.05, 30)
+"""Default (connect, read) timeout in seconds for each request"""
+EXECUTOR_MAX_WORKERS = 32
+"""Number of threads in the shared executor that runs concurrent requests"""
+
+
+class Client(object):
+    """Thread-safe HTTP client with a session per thread over one shared pool.
+
+    pool_connections and pool_maxsize are passed to the requests HTTPAdapter
+    shared by every session. timeout is used for every request that does not
+    include its own timeout in request_kwargs. headers are added to every request.
+    adapter, if provided, is a requests transport adapter used in place of the
+    default HTTPAdapter (see statsapi.cassette).
+    """
+
+    def __init__(
+        self,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        timeout=DEFAULT_TIMEOUT,
+        headers=None,
+        adapter=None,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.adapter = adapter
+        if adapter is None:
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections, pool_maxsize=pool_maxsize
+            )
+        self._adapter = adapter
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions = weakref.WeakSet()
+
+    @property
+    def session(self):
+        """The requests.Session belonging to the calling thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._new_session()
+            self._local.session = session
+        return session
+
+    def _new_session(self):
+        session = requests.Session()
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        session.headers.update(self.headers)
+        with self._lock:
+            self._sessions.add(session)
+        logger.debug(
+            "Created session on the shared pool for thread %s",
+            threading.current_thread().name,
+        )
+        return session
+
+    def get(self, url, **request_kwargs):
+        """Send a GET request using the calling thread's session."""
+        if self.timeout is not None:
+            request_kwargs.setdefault("timeout", self.timeout)
+        return self.session.get(url, **request_kwargs)
+
+    def close(self):
+        """Close the shared pool and every live session created by this client."""
+        with self._lock:
+            sessions, self._sessions = list(self._sessions), weakref.WeakSet()
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
+        self._adapter.close()
+
+
+class _Call(object):
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Coalesce concurrent calls that share a key into a single call.
+
+    While a call for a key is running, other threads calling do() with the same
+    key wait for it and receive its result (or its exception) instead of
+    running fn themselves.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.shared = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            logger.debug("Waiting on in-flight request for %s", key)
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    def in_flight(self):
+        """Return the keys of the calls currently running."""
+        with self._lock:
+            return list(self._calls)
+
+
+_client = None
+_client_lock = threading.Lock()
+_flight = SingleFlight()
+_executor = None
+
+
+def get_client():
+    """Return the shared Client used by statsapi.get(), creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = Client()
+    return _client
+
+
+def get_executor():
+    """Return the shared ThreadPoolExecutor used for concurrent requests.
+
+    get_many() and the bulk wrappers run their requests on these threads, so
+    the threads (and the sessions they hold) are reused from call to call.
+    Work submitted to it must not wait on other work submitted to it.
+    """
+    global _executor
+    if _executor is None:
+        with _client_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=EXECUTOR_MAX_WORKERS, thread_name_prefix="statsapi"
+                )
+    return _executor
+
+
+def get_flight():
+    """Return the SingleFlight used by statsapi.get() to coalesce identical requests."""
+    return _flight
+
+
+def set_client(client):
+    """Replace the shared Client used by statsapi.get(). The previous client is closed."""
+    global _client
+    with _client_lock:
+        old, _client = _client, client
+    if old is not None and old is not client:
+        old.close()
+    return client
+
+
+def configure_client(**kwargs):
+    """Create a new shared Client with the given options, e.g.
+
+    statsapi.configure_client(pool_maxsize=50, timeout=(2, 10))
+    """
+    return set_client(Client(**kwargs))
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""JSON decoder used for StatsAPI response bodies.
+
+Full game feeds run to several megabytes, so response bodies are decoded with
+the fastest JSON library installed: orjson, then ujson, falling back to the
+standard library json module. Install one with ``pip install MLB-StatsAPI[fast]``,
+or choose explicitly with statsapi.set_decoder().
+
+Every decoder raises a ValueError subclass for invalid JSON.
+"""
+import json
+import logging
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed packages
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - depends on installed packages
+    ujson = None
+
+logger = logging.getLogger("statsapi")
+
+
+def _available():
+    decoders = []
+    if orjson is not None:
+        decoders.append(("orjson", orjson.loads))
+    if ujson is not None:
+        decoders.append(("ujson", ujson.loads))
+    decoders.append(("json", json.loads))
+    return decoders
+
+
+DECODERS = dict(_available())
+"""Installed decoders by name, in order of preference"""
+
+_name, _loads = next(iter(DECODERS.items()))
+
+
+def loads(body):
+    """Decode a JSON response body (bytes or str) with the selected decoder."""
+    return _loads(body)
+
+
+def get_decoder():
+    """Return the name of the decoder in use."""
+    return _name
+
+
+def set_decoder(decoder=None):
+    """Select the JSON decoder by name ("orjson", "ujson" or "json") or as a callable.
+
+    With no argument, the fastest installed decoder is selected. Raises
+    ValueError for a decoder that is not installed.
+    """
+    global _name, _loads
+    if decoder is None:
+        decoder = next(iter(DECODERS))
+    if callable(decoder):
+        _name, _loads = "custom", decoder
+    elif decoder in DECODERS:
+        _name, _loads = decoder, DECODERS[decoder]
+    else:
+        raise ValueError(
+            "JSON decoder {} is not installed. Available: {}".format(
+                decoder, ", ".join(DECODERS)
+            )
+        )
+    logger.debug("Using {} to decode JSON responses".format(_name))
+    return _name
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+"""Long-lived cache for statsapi.meta() reference data.
+
+Meta types such as pitchTypes, eventTypes, gameStatus and positions change
+about once a season, so each type is fetched once, kept in memory for the
+rest of the process and refreshed only after META_TTL or on request. With a
+directory configured (statsapi.configure_meta_cache()), each type is also
+stored on disk with a version stamp, so restarts load it without a request.
+
+Code-to-name lookups (e.g. pitch type "FF" -> "Four-Seam Fastball") are then
+dict lookups; see statsapi.meta_name().
+
+If a fetch fails, the expired copy (from memory or disk) is used if there is
+one, and the type is not fetched again for META_FAILURE_BACKOFF seconds.
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from .cache import DAY, MINUTE
+from .client import SingleFlight
+
+logger = logging.getLogger("statsapi")
+
+META_TTL = 7 * DAY
+"""Seconds a meta type is used before it is fetched again"""
+
+META_FAILURE_BACKOFF = MINUTE
+"""Seconds after a failed fetch before a meta type is requested again"""
+
+META_CACHE_VERSION = 1
+"""Version stamp of stored meta files; files with another version are ignored"""
+
+CODE_FIELDS = {
+    "gameStatus": ("statusCode", "detailedState"),
+    "gameTypes": ("id", "description"),
+    "positions": ("code", "fullName"),
+}
+"""(code field, name field) used by meta_name() for meta types that differ from
+DEFAULT_CODE_FIELDS"""
+
+DEFAULT_CODE_FIELDS = ("code", "description")
+
+
+class MetaCache(object):
+    """Meta data by type, kept in memory and optionally on disk under path.
+
+    Each type is fetched by one thread at a time, outside the cache's lock, so
+    a slow request does not hold up lookups of other types.
+    """
+
+    def __init__(self, path=None, ttl=META_TTL, failure_backoff=META_FAILURE_BACKOFF):
+        self.path = path
+        self.ttl = ttl
+        self.failure_backoff = failure_backoff
+        self._entries = {}
+        self._names = {}
+        self._failures = {}
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+
+    def _file(self, type):
+        return os.path.join(self.path, "meta-{}.json".format(type))
+
+    def get(self, type, refresh=False):
+        """Return the meta data for type, fetching it only if missing, expired or refresh.
+
+        If the fetch fails, the expired data is returned if there is any;
+        otherwise the error is raised. For META_FAILURE_BACKOFF seconds after
+        a failure, the type is not fetched again unless refresh is set.
+        """
+        with self._lock:
+            entry = self._entries.get(type)
+            if entry is None and self.path:
+                entry = self._load(type)
+            if not refresh and entry is not None and time.time() - entry[0] < self.ttl:
+                return entry[1]
+            failure = self._failures.get(type)
+
+        if (
+            not refresh
+            and failure is not None
+            and time.time() - failure[0] < self.failure_backoff
+        ):
+            if entry is None:
+                raise failure[1]
+            return entry[1]
+
+        try:
+            return self._flight.do(type, lambda: self._fetch(type))[1]
+        except Exception as e:
+            with self._lock:
+                self._failures[type] = (time.time(), e)
+            if entry is None:
+                logger.warning("Unable to fetch meta type {}: {}".format(type, e))
+                raise
+            logger.warning(
+                "Unable to fetch meta type {} ({}), using the expired copy".format(
+                    type, e
+                )
+            )
+            return entry[1]
+
+    def refresh(self, type=None):
+        """Fetch type again (or every type already loaded) and return the new data."""
+        types = [type] if type else list(self._entries)
+        data = None
+        for t in types:
+            data = self.get(t, refresh=True)
+        return data
+
+    def names(self, type):
+        """Return {code: name} for type, using the fields in CODE_FIELDS."""
+        data = self.get(type)
+        with self._lock:
+            cached = self._names.get(type)
+            if cached is not None and cached[0] is data:
+                return cached[1]
+            code_field, name_field = CODE_FIELDS.get(type, DEFAULT_CODE_FIELDS)
+            names = {
+                item[code_field]: item.get(name_field)
+                for item in data
+                if isinstance(item, dict) and item.get(code_field) is not None
+            }
+            self._names[type] = (data, names)
+            return names
+
+    def clear(self):
+        """Forget everything held in memory (files on disk are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._names.clear()
+            self._failures.clear()
+
+    def _fetch(self, type):
+        from . import get
+
+        data = get("meta", {"type": type}, cache_ttl=0)
+        entry = (time.time(), data)
+        with self._lock:
+            self._entries[type] = entry
+            self._failures.pop(type, None)
+        if self.path:
+            self._save(type, entry)
+        logger.debug("Fetched meta type {}".format(type))
+        return entry
+
+    def _load(self, type):
+        try:
+            with open(self._file(type)) as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if stored.get("version") != META_CACHE_VERSION or stored.get("type") != type:
+            return None
+        entry = (stored["fetched"], stored["data"])
+        self._entries[type] = entry
+        logger.debug("Loaded meta type {} from {}".format(type, self._file(type)))
+        return entry
+
+    def _save(self, type, entry):
+        stored = {
+            "version": META_CACHE_VERSION,
+            "type": type,
+            "fetched": entry[0],
+            "data": entry[1],
+        }
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(stored, f)
+            os.replace(tmp, self._file(type))
+        except OSError as e:
+            logger.warning("Unable to store meta type {}: {}".format(type, e))
+
+
+_meta_cache = MetaCache()
+
+
+def get_meta_cache():
+    """Return the shared MetaCache."""
+    return _meta_cache
+
+
+def configure_meta_cache(path=None, ttl=META_TTL, failure_backoff=META_FAILURE_BACKOFF):
+    """Replace the shared meta cache, e.g. to store meta data on disk:
+
+    statsapi.configure_meta_cache(".statsapi_meta")
+    """
+    global _meta_cache
+    _meta_cache = MetaCache(path, ttl, failure_backoff)
+    return _meta_cache
+
+
+def meta_name(type, code, default=None):
+    """Return the name for code in meta type, e.g. meta_name("pitchTypes", "FF").
+
+    Returns default if the code is unknown.
+    """
+    return _meta_cache.names(type).get(code, default)
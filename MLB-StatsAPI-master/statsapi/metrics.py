@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+"""In-process request metrics for MLB-StatsAPI.
+
+statsapi.get() records, per endpoint, the number of calls and errors, a
+latency histogram, response bytes, JSON decode time and cache hits and misses.
+Other fetchers (e.g. Savant or pybaseball helpers) can record into the same
+registry with MetricsRegistry.timer(). Read the numbers with
+statsapi.get_metrics().snapshot().
+"""
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger("statsapi")
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Upper bounds in seconds of the latency histogram buckets (plus one for slower)"""
+
+_perf_counter = time.perf_counter
+
+
+class EndpointMetrics(object):
+    """Counters for a single endpoint."""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.bytes = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.decode_total = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def quantile(self, q):
+        """Return the upper bound of the histogram bucket holding quantile q, or None."""
+        if not self.calls:
+            return None
+        rank = q * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.histogram):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.latency_max
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "bytes": self.bytes,
+            "latency_total": self.latency_total,
+            "latency_avg": self.latency_total / self.calls if self.calls else 0.0,
+            "latency_max": self.latency_max,
+            "latency_p50": self.quantile(0.5),
+            "latency_p95": self.quantile(0.95),
+            "decode_total": self.decode_total,
+            "histogram": dict(
+                zip([str(b) for b in LATENCY_BUCKETS] + ["+Inf"], self.histogram)
+            ),
+        }
+
+
+class MetricsRegistry(object):
+    """Thread-safe registry of EndpointMetrics keyed on endpoint name."""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def _get(self, endpoint):
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = EndpointMetrics(endpoint)
+        return metrics
+
+    def record_request(self, endpoint, latency, size=0, decode_time=0.0, error=False):
+        """Record one request to endpoint that took latency seconds."""
+        if not self.enabled:
+            return
+        with self._lock:
+            metrics = self._get(endpoint)
+            metrics.calls += 1
+            if error:
+                metrics.errors += 1
+            metrics.bytes += size
+            metrics.latency_total += latency
+            metrics.latency_max = max(metrics.latency_max, latency)
+            metrics.decode_total += decode_time
+            metrics.histogram[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def record_cache(self, endpoint, hit):
+        """Record a cache hit (hit=True) or miss for endpoint."""
+        if not self.enabled:
+            return
+        with self._lock:
+            metrics = self._get(endpoint)
+            if hit:
+                metrics.cache_hits += 1
+            else:
+                metrics.cache_misses += 1
+
+    @contextmanager
+    def timer(self, endpoint):
+        """Time the enclosed block as one request to endpoint, e.g.
+
+        with statsapi.get_metrics().timer("savant:arsenal") as m:
+            r = requests.get(url)
+            m["bytes"] = len(r.content)
+
+        Set "bytes" and "decode_time" on the yielded dict to record them too.
+        An exception raised in the block is recorded as an error.
+        """
+        extra = {"bytes": 0, "decode_time": 0.0}
+        start = _perf_counter()
+        try:
+            yield extra
+        except BaseException:
+            self.record_request(
+                endpoint,
+                _perf_counter() - start,
+                extra["bytes"],
+                extra["decode_time"],
+                error=True,
+            )
+            raise
+        self.record_request(
+            endpoint, _perf_counter() - start, extra["bytes"], extra["decode_time"]
+        )
+
+    def get(self, endpoint):
+        """Return the counters for endpoint as a dict, or None if nothing was recorded."""
+        with self._lock:
+            metrics = self._endpoints.get(endpoint)
+            return metrics.as_dict() if metrics is not None else None
+
+    def snapshot(self):
+        """Return {endpoint: counters} for every endpoint, busiest (by latency) first."""
+        with self._lock:
+            ordered = sorted(
+                self._endpoints.values(), key=lambda m: m.latency_total, reverse=True
+            )
+            return {m.name: m.as_dict() for m in ordered}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+_metrics = MetricsRegistry()
+
+
+def get_metrics():
+    """Return the MetricsRegistry shared by statsapi requests."""
+    return _metrics
+
+
+def reset_metrics():
+    """Clear every counter in the shared MetricsRegistry."""
+    _metrics.reset()
+
+
+def enable_metrics(enabled=True):
+    """Turn recording into the shared MetricsRegistry on or off."""
+    _metrics.enabled = enabled
@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+"""In-memory index of a season's players for name lookups without a request.
+
+PlayerIndex is built from one sports_players response and maps normalized
+names (full name, first/last, use name/last, last name, accents folded and
+punctuation dropped) to players, with exact and prefix lookups. Indexes are
+built once per season and kept in memory; with a snapshot directory
+configured (statsapi.configure_player_index()), they are also saved to disk
+and reused across restarts until they are SNAPSHOT_TTL old.
+"""
+import bisect
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import unicodedata
+
+from .cache import DAY
+
+logger = logging.getLogger("statsapi")
+
+PLAYER_FIELDS = "people,id,fullName,firstName,lastName,primaryNumber,currentTeam,id,primaryPosition,code,abbreviation,useName,boxscoreName,nickName,mlbDebutDate,nameFirstLast,firstLastName,lastFirstName,lastInitName,initLastName,fullFMLName,fullLFMName,nameSlug"
+"""Fields requested from sports_players for each player"""
+
+SNAPSHOT_TTL = DAY
+"""Seconds an index (in memory or on disk) is used before it is rebuilt"""
+
+SNAPSHOT_VERSION = 1
+
+_SUFFIXES = frozenset(["jr", "sr", "ii", "iii", "iv", "v"])
+_DROP = re.compile(r"[.']")
+_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(name):
+    """Return name lowercased, with accents folded and punctuation removed.
+
+    For example "José Ramírez" -> "jose ramirez", "J.D. Martinez" -> "jd martinez".
+    """
+    folded = unicodedata.normalize("NFKD", str(name))
+    folded = "".join(c for c in folded if not unicodedata.combining(c)).lower()
+    return " ".join(_SEPARATORS.split(_DROP.sub("", folded))).strip()
+
+
+def _name_keys(player):
+    first = player.get("firstName", "")
+    last = player.get("lastName", "")
+    names = [
+        player.get("fullName"),
+        player.get("nameFirstLast"),
+        player.get("fullFMLName"),
+        first + " " + last,
+        player.get("useName", "") + " " + last,
+        last,
+    ]
+    keys = []
+    for name in names:
+        key = normalize_name(name or "")
+        if not key:
+            continue
+        words = key.split()
+        variants = [key]
+        if len(words) > 1 and words[-1] in _SUFFIXES:
+            variants.append(" ".join(words[:-1]))
+        for variant in variants:
+            if variant not in keys:
+                keys.append(variant)
+    return keys
+
+
+class PlayerIndex(object):
+    """Name index over the players returned by the sports_players endpoint.
+
+    people is the list of player dicts from the response; lookups return
+    those dicts (shared, so treat them as read-only).
+    """
+
+    def __init__(self, people, season=None, sportId=1, gameType=None, built=None):
+        self.people = people
+        self.season = season
+        self.sportId = sportId
+        self.gameType = gameType
+        self.built = time.time() if built is None else built
+
+        self._by_id = {}
+        self._names = {}
+        for player in people:
+            self._by_id[player["id"]] = player
+            for key in _name_keys(player):
+                self._names.setdefault(key, []).append(player)
+        self._keys = sorted(self._names)
+        self._haystacks = [
+            (player, "\x00".join(str(v).lower() for v in player.values()))
+            for player in people
+        ]
+
+    def __repr__(self):
+        return "PlayerIndex(season={}, sportId={}, players={})".format(
+            self.season, self.sportId, len(self.people)
+        )
+
+    def __len__(self):
+        return len(self.people)
+
+    def __contains__(self, player_id):
+        return player_id in self._by_id
+
+    @property
+    def age(self):
+        return time.time() - self.built
+
+    def player(self, player_id):
+        """Return the player with the given id, or None."""
+        return self._by_id.get(player_id)
+
+    def _find(self, name):
+        key = normalize_name(name)
+        players = self._names.get(key)
+        if players is None:
+            words = key.split()
+            if len(words) > 1 and words[-1] in _SUFFIXES:
+                players = self._names.get(" ".join(words[:-1]))
+        return players or []
+
+    def lookup(self, name):
+        """Return the players whose normalized full, first/last or last name is name."""
+        return list(self._find(name))
+
+    def get_id(self, name):
+        """Return the id of the first player exactly matching name, or None."""
+        players = self._find(name)
+        return players[0]["id"] if players else None
+
+    def prefix(self, prefix, limit=None):
+        """Return players with a normalized name starting with prefix, in name order."""
+        prefix = normalize_name(prefix)
+        players = []
+        seen = set()
+        i = bisect.bisect_left(self._keys, prefix)
+        while i < len(self._keys) and self._keys[i].startswith(prefix):
+            for player in self._names[self._keys[i]]:
+                if player["id"] not in seen:
+                    seen.add(player["id"])
+                    players.append(player)
+                    if limit is not None and len(players) >= limit:
+                        return players
+            i += 1
+        return players
+
+    def search(self, lookup_value):
+        """Return players matching lookup_value the way lookup_player() does.
+
+        Every word of lookup_value must be contained in one of the player's
+        field values, case-insensitively.
+        """
+        words = str(lookup_value).lower().split()
+        return [
+            player
+            for player, haystack in self._haystacks
+            if all(word in haystack for word in words)
+        ]
+
+    @classmethod
+    def build(cls, season, sportId=1, gameType=None):
+        """Build the index for season from the sports_players endpoint."""
+        from . import get
+
+        params = {"sportId": sportId, "season": season, "fields": PLAYER_FIELDS}
+        if gameType:
+            params["gameType"] = gameType
+        r = get("sports_players", params)
+        return cls(r.get("people", []), season, sportId, gameType)
+
+    def save(self, path):
+        """Write the index to path as a JSON snapshot."""
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "season": self.season,
+            "sportId": self.sportId,
+            "gameType": self.gameType,
+            "built": self.built,
+            "people": self.people,
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("Unable to write player index to {}: {}".format(path, e))
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    @classmethod
+    def load(cls, path):
+        """Return the index saved at path, or None if it is missing or unreadable."""
+        try:
+            with open(path) as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            return None
+        return cls(
+            snapshot["people"],
+            snapshot["season"],
+            snapshot["sportId"],
+            snapshot.get("gameType"),
+            snapshot["built"],
+        )
+
+
+_indexes = {}
+_snapshot_path = None
+_ttl = SNAPSHOT_TTL
+_lock = threading.Lock()
+
+
+def _snapshot_file(season, sportId, gameType):
+    name = "players-{}-{}{}.json".format(
+        sportId, season, "-" + gameType if gameType else ""
+    )
+    return os.path.join(_snapshot_path, name)
+
+
+def get_player_index(season=None, sportId=1, gameType=None, refresh=False):
+    """Return the PlayerIndex for season (default: the current season).
+
+    The index is built on first use and then reused from memory, or from the
+    snapshot directory if one is configured, until it is older than the TTL
+    set by configure_player_index(). refresh=True rebuilds it.
+    """
+    if not season:
+        from . import latest_season
+
+        season = latest_season(sportId=sportId).get(
+            "seasonId", time.localtime().tm_year
+        )
+    key = (str(season), str(sportId), gameType)
+
+    with _lock:
+        index = _indexes.get(key)
+        if not refresh and index is not None and index.age < _ttl:
+            return index
+
+        path = _snapshot_file(*key) if _snapshot_path else None
+        if not refresh and path:
+            index = PlayerIndex.load(path)
+            if index is not None and index.age < _ttl:
+                logger.debug("Loaded player index from {}".format(path))
+                _indexes[key] = index
+                return index
+
+        index = PlayerIndex.build(season, sportId, gameType)
+        logger.debug("Built {}".format(index))
+        _indexes[key] = index
+        if path:
+            index.save(path)
+        return index
+
+
+def configure_player_index(path=None, ttl=SNAPSHOT_TTL):
+    """Set the snapshot directory (None keeps indexes in memory only) and TTL.
+
+    Indexes already held in memory are discarded.
+    """
+    global _snapshot_path, _ttl
+    with _lock:
+        _snapshot_path = path
+        _ttl = ttl
+        _indexes.clear()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+"""Field projections for the wrapper functions.
+
+Wrappers such as schedule() accept projection, a collection of the output keys
+the caller actually uses. Each wrapper has a Projection describing which
+StatsAPI fields and hydrations every output key depends on, so the request
+can be narrowed with the fields and hydrate query parameters and only the
+projected keys are returned.
+"""
+
+
+class Projection(object):
+    """Dependencies of a wrapper's output keys on StatsAPI fields and hydrations.
+
+    base_fields are always requested (the keys the wrapper needs to parse the
+    response at all). keys maps each output key to a tuple of (fields,
+    hydrations); fields of None means the key needs the unfiltered payload,
+    e.g. because it returns a stats object whose keys are not known up front.
+    hydrations lists every hydration the wrapper can use, in the order they
+    are sent.
+    """
+
+    def __init__(self, name, base_fields, keys, hydrations=()):
+        self.name = name
+        self.base_fields = frozenset(base_fields)
+        self.keys = keys
+        self.hydrations = list(hydrations)
+
+    def validate(self, projection):
+        unknown = set(projection) - set(self.keys)
+        if unknown:
+            raise ValueError(
+                "Invalid projection key(s) for {}: {}. Valid keys: {}".format(
+                    self.name, ", ".join(sorted(unknown)), ", ".join(self.keys)
+                )
+            )
+
+    def fields(self, projection):
+        """Return the fields query parameter for projection, or None if unrestricted."""
+        self.validate(projection)
+        fields = set(self.base_fields)
+        for key in projection:
+            key_fields = self.keys[key][0]
+            if key_fields is None:
+                return None
+            fields.update(key_fields)
+        return ",".join(sorted(fields))
+
+    def hydrate(self, projection, available=None):
+        """Return the hydrations needed for projection, in order, as a list.
+
+        available limits the result to hydrations the wrapper would send
+        without a projection (e.g. when one is disabled by an argument).
+        """
+        self.validate(projection)
+        needed = set()
+        for key in projection:
+            needed.update(self.keys[key][1])
+        return [
+            h
+            for h in (self.hydrations if available is None else available)
+            if h in needed
+        ]
+
+    def apply(self, record, projection):
+        """Return a copy of record with only the projected keys."""
+        return {k: v for k, v in record.items() if k in projection}
+
+
+_PROBABLE = (["probablePitcher", "fullName"], ["probablePitcher(note)"])
+_PITCHER_NOTE = (["probablePitcher", "note"], ["probablePitcher(note)"])
+_LINESCORE = ["linescore", "currentInning", "inningState", "currentInningOrdinal"]
+_DECISIONS = (["decisions", "winner", "loser", "save", "fullName"], ["decisions"])
+
+SCHEDULE = Projection(
+    "schedule",
+    base_fields=[
+        "totalItems",
+        "dates",
+        "date",
+        "games",
+        "gamePk",
+        "gameDate",
+        "gameType",
+        "status",
+        "detailedState",
+        "teams",
+        "away",
+        "home",
+        "team",
+        "id",
+        "name",
+        "doubleHeader",
+        "gameNumber",
+    ],
+    keys={
+        "game_id": ([], []),
+        "game_datetime": ([], []),
+        "game_date": ([], []),
+        "game_type": ([], []),
+        "status": ([], []),
+        "away_name": ([], []),
+        "home_name": ([], []),
+        "away_id": ([], []),
+        "home_id": ([], []),
+        "doubleheader": ([], []),
+        "game_num": ([], []),
+        "home_probable_pitcher": _PROBABLE,
+        "away_probable_pitcher": _PROBABLE,
+        "home_pitcher_note": _PITCHER_NOTE,
+        "away_pitcher_note": _PITCHER_NOTE,
+        "away_score": (["score"], []),
+        "home_score": (["score"], []),
+        "current_inning": (_LINESCORE, ["linescore"]),
+        "inning_state": (_LINESCORE, ["linescore"]),
+        "venue_id": (["venue"], []),
+        "venue_name": (["venue"], []),
+        "national_broadcasts": (
+            ["broadcasts", "isNational", "content", "media", "freeGame"],
+            ["broadcasts", "game(content(media(epg)))"],
+        ),
+        "series_status": (["seriesStatus", "result"], ["seriesStatus"]),
+        "winning_team": (["isWinner", "isTie"], []),
+        "losing_team": (["isWinner", "isTie"], []),
+        "winning_pitcher": _DECISIONS,
+        "losing_pitcher": _DECISIONS,
+        "save_pitcher": _DECISIONS,
+        "summary": (["score"] + _LINESCORE, ["linescore"]),
+    },
+    hydrations=[
+        "decisions",
+        "probablePitcher(note)",
+        "linescore",
+        "broadcasts",
+        "game(content(media(epg)))",
+        "seriesStatus",
+    ],
+)
+"""Projection for schedule(): one key per field of each returned game"""
+
+PLAYER_STATS = Projection(
+    "player_stat_data",
+    base_fields=[
+        "people",
+        "id",
+        "useName",
+        "lastName",
+        "active",
+        "primaryPosition",
+        "abbreviation",
+        "batSide",
+        "pitchHand",
+        "description",
+    ],
+    keys={
+        "id": ([], []),
+        "first_name": ([], []),
+        "last_name": ([], []),
+        "active": ([], []),
+        "current_team": (["currentTeam", "name"], ["currentTeam"]),
+        "position": ([], []),
+        "nickname": (["nickName"], []),
+        "last_played": (["lastPlayedDate"], []),
+        "mlb_debut": (["mlbDebutDate"], []),
+        "bat_side": ([], []),
+        "pitch_hand": ([], []),
+        "stats": (None, ["stats"]),
+    },
+    hydrations=["stats", "currentTeam"],
+)
+"""Projection for player_stat_data(): one key per field of the returned dict"""
+
+ROSTER = Projection(
+    "roster",
+    base_fields=["roster"],
+    keys={
+        "jersey_number": (["jerseyNumber"], []),
+        "position": (["position", "abbreviation"], []),
+        "name": (["person", "fullName"], []),
+    },
+)
+"""Projection for roster(): one key per column of the returned text"""
+
+STANDINGS = Projection(
+    "standings_data",
+    base_fields=[
+        "records",
+        "teamRecords",
+        "team",
+        "name",
+        "division",
+        "id",
+        "abbreviation",
+    ],
+    keys={
+        "name": ([], []),
+        "team_id": ([], []),
+        "div_rank": (["divisionRank"], []),
+        "w": (["wins"], []),
+        "l": (["losses"], []),
+        "gb": (["gamesBack"], []),
+        "wc_rank": (["wildCardRank"], []),
+        "wc_gb": (["wildCardGamesBack"], []),
+        "wc_elim_num": (["wildCardEliminationNumber"], []),
+        "elim_num": (["eliminationNumber"], []),
+        "league_rank": (["leagueRank"], []),
+        "sport_rank": (["sportRank"], []),
+    },
+)
+"""Projection for standings_data(): one key per field of each team"""
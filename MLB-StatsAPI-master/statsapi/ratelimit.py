@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+"""Client-side rate limiting and retry policy for MLB-StatsAPI.
+
+All requests made by statsapi.get() draw from a shared token bucket, plus an
+optional bucket per endpoint. When the API answers 429 Too Many Requests, the
+shared rate is halved and requests pause for the Retry-After period. Every
+successful response then raises the rate a little, back up to the configured
+ceiling. This keeps throughput near the highest rate the API accepts instead
+of bursting into throttling.
+
+Responses with a status in RetryPolicy.statuses are retried with jittered
+exponential backoff, or after the Retry-After period when the API sends one.
+"""
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger("statsapi")
+
+DEFAULT_RATE = 20.0
+"""Default sustained requests per second across all endpoints"""
+DEFAULT_BURST = 40
+"""Default number of requests that may be sent back to back"""
+MIN_RATE = 0.5
+"""Lowest rate the adaptive limiter will back off to"""
+RECOVERY_STEP = 0.02
+"""Fraction of the configured rate restored after each successful request"""
+
+_sleep = time.sleep
+_monotonic = time.monotonic
+
+
+class TokenBucket(object):
+    """Thread-safe token bucket refilled at rate tokens per second, up to burst."""
+
+    def __init__(self, rate, burst=None):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.tokens = float(self.burst)
+        self.blocked_until = 0.0
+        self._updated = _monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self):
+        """Take a token and return the number of seconds to wait before using it."""
+        with self._lock:
+            now = _monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.blocked_until - now)
+
+    def throttled(self, retry_after=None):
+        """Halve the rate and, if given, block new requests for retry_after seconds."""
+        with self._lock:
+            self.rate = max(MIN_RATE, self.rate / 2)
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, _monotonic() + retry_after)
+            logger.debug("Rate limited, reducing rate to %.2f/s", self.rate)
+
+    def succeeded(self):
+        """Raise the rate additively toward max_rate after a successful request."""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(
+                    self.max_rate, self.rate + RECOVERY_STEP * self.max_rate
+                )
+
+
+class RateLimiter(object):
+    """Shared limiter with one global bucket and optional per-endpoint buckets.
+
+    endpoint_rates maps endpoint names to a requests per second limit for that
+    endpoint, applied in addition to the global rate.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, endpoint_rates=None):
+        self.bucket = TokenBucket(rate, burst)
+        self.endpoint_buckets = {
+            k: TokenBucket(v) for k, v in (endpoint_rates or {}).items()
+        }
+
+    def reserve(self, endpoint):
+        """Take a token for endpoint and return the seconds to wait before sending."""
+        wait = self.bucket.reserve()
+        endpoint_bucket = self.endpoint_buckets.get(endpoint)
+        if endpoint_bucket is not None:
+            wait = max(wait, endpoint_bucket.reserve())
+        return wait
+
+    def acquire(self, endpoint):
+        """Block until a request to endpoint may be sent."""
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            logger.debug("Rate limiter delaying %s by %.3fs", endpoint, wait)
+            _sleep(wait)
+
+    def throttled(self, endpoint, retry_after=None):
+        self.bucket.throttled(retry_after)
+        endpoint_bucket = self.endpoint_buckets.get(endpoint)
+        if endpoint_bucket is not None:
+            endpoint_bucket.throttled(retry_after)
+
+    def succeeded(self, endpoint):
+        self.bucket.succeeded()
+        endpoint_bucket = self.endpoint_buckets.get(endpoint)
+        if endpoint_bucket is not None:
+            endpoint_bucket.succeeded()
+
+
+def parse_retry_after(value):
+    """Return the number of seconds in a Retry-After header value, or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy(object):
+    """Retry policy for responses with a status in statuses.
+
+    The delay before retry n (starting at 0) is a random value between 0 and
+    backoff * 2**n, capped at max_backoff, unless the response includes a
+    Retry-After header, which is honoured instead (also capped at max_backoff).
+    """
+
+    def __init__(
+        self,
+        max_retries=3,
+        backoff=0.5,
+        max_backoff=30.0,
+        statuses=(429, 500, 502, 503, 504),
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+
+    def should_retry(self, status_code, attempt):
+        return status_code in self.statuses and attempt < self.max_retries
+
+    def delay(self, attempt, retry_after=None):
+        seconds = parse_retry_after(retry_after)
+        if seconds is not None:
+            return min(seconds, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+
+_limiter = RateLimiter()
+_retry = RetryPolicy()
+
+
+def get_rate_limiter():
+    """Return the RateLimiter shared by all statsapi requests."""
+    return _limiter
+
+
+def configure_rate_limit(rate=DEFAULT_RATE, burst=DEFAULT_BURST, endpoint_rates=None):
+    """Replace the shared rate limiter, e.g.
+
+    statsapi.configure_rate_limit(rate=10, endpoint_rates={'game': 2})
+    """
+    global _limiter
+    _limiter = RateLimiter(rate, burst, endpoint_rates)
+    return _limiter
+
+
+def get_retry_policy():
+    """Return the RetryPolicy used by statsapi.get()."""
+    return _retry
+
+
+def configure_retries(
+    max_retries=3, backoff=0.5, max_backoff=30.0, statuses=(429, 500, 502, 503, 504)
+):
+    """Replace the retry policy used by statsapi.get(). max_retries=0 disables retries."""
+    global _retry
+    _retry = RetryPolicy(max_retries, backoff, max_backoff, statuses)
+    return _retry
+
+
+def send(endpoint, request):
+    """Call request() under the shared rate limiter, retrying per the retry policy.
+
+    request is a function that sends the HTTP request and returns the response.
+    The last response is returned once it succeeds or retries are exhausted.
+    """
+    limiter = get_rate_limiter()
+    retry = get_retry_policy()
+    attempt = 0
+    while True:
+        limiter.acquire(endpoint)
+        r = request()
+        if not retry.should_retry(r.status_code, attempt):
+            break
+        delay = retry.delay(attempt, r.headers.get("Retry-After"))
+        if r.status_code == 429:
+            limiter.throttled(endpoint, delay)
+        logger.warning(
+            "{} returned {}, retrying in {:.2f}s (attempt {} of {})".format(
+                endpoint, r.status_code, delay, attempt + 1, retry.max_retries
+            )
+        )
+        r.close()
+        _sleep(delay)
+        attempt += 1
+
+    if r.status_code in (200, 201, 304):
+        limiter.succeeded(endpoint)
+    return r
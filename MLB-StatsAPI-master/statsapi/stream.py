@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+"""Extract selected subtrees from a JSON document without decoding all of it.
+
+Paths are dotted object keys, e.g. "liveData.boxscore.teams.away.pitchers".
+Only the values at those paths are built into Python objects; everything else
+is skipped, and parsing stops as soon as every path has been found.
+
+With ijson installed (``pip install MLB-StatsAPI[stream]``) the document is
+parsed incrementally as it downloads, so peak memory stays close to the size
+of the requested values. Without it, the body is downloaded in full and
+scanned, which still avoids building objects for the parts that are skipped.
+"""
+import json
+import logging
+import re
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depends on installed packages
+    ijson = None
+
+logger = logging.getLogger("statsapi")
+
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.S)
+_SCALAR = re.compile(r"[^,}\]\s]*")
+_WHITESPACE = re.compile(r"\s*")
+_NESTING = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]]', re.S)
+_decode_value = json.JSONDecoder().raw_decode
+
+
+def _prefixes(paths):
+    prefixes = set()
+    for path in paths:
+        parts = path.split(".")
+        for i in range(len(parts)):
+            prefixes.add(".".join(parts[:i]))
+    return prefixes
+
+
+def extract_paths(source, paths, use_ijson=None):
+    """Return {path: value} for each of paths found in the JSON document source.
+
+    source is bytes, str or a binary file-like object. Paths that are not in
+    the document are left out of the result. use_ijson forces the ijson (True)
+    or built-in (False) parser; by default ijson is used when it is installed.
+    """
+    paths = set(paths)
+    if use_ijson is None:
+        use_ijson = ijson is not None
+    if use_ijson:
+        if ijson is None:
+            raise ImportError(
+                "ijson is required for incremental parsing. "
+                "Install it with `pip install MLB-StatsAPI[stream]`."
+            )
+        return _extract_ijson(source, paths)
+
+    if hasattr(source, "read"):
+        source = source.read()
+    if isinstance(source, bytes):
+        source = source.decode("utf-8")
+    return _extract_scan(source, paths)
+
+
+def _extract_ijson(source, paths):
+    found = {}
+    builder = current = None
+    for prefix, event, value in ijson.parse(source, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == current and event in ("end_map", "end_array"):
+                found[current] = builder.value
+                builder = current = None
+                if len(found) == len(paths):
+                    break
+        elif prefix in paths and event != "map_key" and prefix not in found:
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                current = prefix
+            else:
+                found[prefix] = value
+                if len(found) == len(paths):
+                    break
+    return found
+
+
+def _extract_scan(text, paths):
+    found = {}
+    pos = _WHITESPACE.match(text, 0).end()
+    if text.startswith("{", pos):
+        _scan_object(text, pos, "", paths, _prefixes(paths), found)
+    return found
+
+
+def _scan_object(text, pos, prefix, paths, prefixes, found):
+    """Scan the object starting at text[pos] and return the position after it."""
+    pos = _WHITESPACE.match(text, pos + 1).end()
+    while text[pos] != "}":
+        match = _STRING.match(text, pos)
+        key = json.loads(match.group())
+        pos = _WHITESPACE.match(text, match.end()).end() + 1  # skip the colon
+        pos = _WHITESPACE.match(text, pos).end()
+
+        path = prefix + "." + key if prefix else key
+        if path in paths:
+            found[path], pos = _decode_value(text, pos)
+        elif path in prefixes and text[pos] == "{":
+            pos = _scan_object(text, pos, path, paths, prefixes, found)
+        else:
+            pos = _skip_value(text, pos)
+        if len(found) == len(paths):
+            return pos
+
+        pos = _WHITESPACE.match(text, pos).end()
+        if text[pos] == ",":
+            pos = _WHITESPACE.match(text, pos + 1).end()
+    return pos + 1
+
+
+def _skip_value(text, pos):
+    """Return the position after the JSON value starting at text[pos]."""
+    char = text[pos]
+    if char == '"':
+        return _STRING.match(text, pos).end()
+    if char not in "{[":
+        return _SCALAR.match(text, pos).end()
+    depth = 0
+    for match in _NESTING.finditer(text, pos):
+        token = match.group()
+        if token == "{" or token == "[":
+            depth += 1
+        elif token == "}" or token == "]":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    raise ValueError("Unterminated JSON value at position {}".format(pos))
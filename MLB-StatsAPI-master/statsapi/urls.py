@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+"""Compiled endpoint configuration used to build request URLs.
+
+Each ENDPOINTS entry is compiled once into a CompiledEndpoint holding set-based
+parameter lookups and a pre-split URL template, so building a URL is a single
+pass over the params and one string join.
+"""
+import logging
+import re
+from urllib.parse import quote
+
+from . import endpoints
+
+logger = logging.getLogger("statsapi")
+
+SAFE_CHARS = "/,:;()[]{}*!'$@="
+"""Characters left unencoded in query parameter values (hydrate and fields syntax)"""
+
+_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+_MISSING = object()
+
+
+class _PathParam(object):
+    __slots__ = ("name", "type", "prefix", "suffix", "true", "false", "default")
+
+    def __init__(self, name, config):
+        self.name = name
+        self.type = config.get("type")
+        self.prefix = "/" if config.get("leading_slash") else ""
+        self.suffix = "/" if config.get("trailing_slash") else ""
+        self.true = config.get("True", "")
+        self.false = config.get("False", "")
+        # Required params with a default are filled in when not provided;
+        # optional params that are not provided are dropped from the URL
+        if config.get("required"):
+            if config.get("default") and config.get("default") != "":
+                self.default = self.prefix + config["default"] + self.suffix
+            else:
+                self.default = _MISSING
+        else:
+            self.default = ""
+
+    def render(self, value):
+        """Return the URL segment for value, or None if a bool param gets a non-bool value."""
+        if self.type == "bool":
+            value = str(value).lower()
+            if value == "false":
+                return self.prefix + self.false + self.suffix
+            elif value == "true":
+                return self.prefix + self.true + self.suffix
+            return None
+        return self.prefix + str(value) + self.suffix
+
+
+class CompiledEndpoint(object):
+    """An ENDPOINTS entry compiled for fast URL building."""
+
+    def __init__(self, name, config):
+        self.name = name
+        self.config = config
+        self.note = config.get("note")
+        self.path_params = {
+            k: _PathParam(k, v) for k, v in config.get("path_params", {}).items() if v
+        }
+        # Some entries use [[]] to mean "no query parameters"
+        self.query_params = frozenset(
+            p for p in config.get("query_params", []) if isinstance(p, str)
+        )
+        self.required_params = [frozenset(x) for x in config.get("required_params", [])]
+        # Split the URL into literal text (even indexes) and placeholders (odd indexes)
+        self.template = _PLACEHOLDER.split(config["url"])
+
+    def build_url(self, params={}, force=False):
+        """Validate params and return the request URL.
+
+        Invalid params are ignored unless force is True, in which case they are
+        added to the query string. Raises ValueError if a required path or query
+        parameter is missing and force is False.
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        path_values = {}
+        query = []
+        query_keys = set()
+
+        # Parse parameters into path and query parameters, and discard invalid parameters
+        for p, pv in params.items():
+            path_param = self.path_params.get(p)
+            if path_param is not None:
+                segment = path_param.render(pv)
+                if segment is not None:
+                    path_values[p] = segment
+            elif p in self.query_params:
+                query.append((p, str(pv)))
+                query_keys.add(p)
+            elif force:
+                if debug:
+                    logger.debug(
+                        "Found invalid param, forcing into query parameters per force flag: %s",
+                        p,
+                    )
+                query.append((p, str(pv)))
+                query_keys.add(p)
+            elif debug:
+                logger.debug("Found invalid param, ignoring: %s", p)
+
+        # Fill in the URL template
+        parts = self.template[:]
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            segment = path_values.get(name)
+            if segment is None:
+                path_param = self.path_params.get(name)
+                segment = path_param.default if path_param is not None else ""
+                if segment is _MISSING:
+                    if not force:
+                        raise ValueError("Missing required path parameter {%s}" % name)
+                    logger.warning(
+                        "Missing required path parameter {%s}, proceeding anyway per force flag..."
+                        % name
+                    )
+                    segment = "{" + name + "}"
+            parts[i] = segment
+        url = "".join(parts)
+
+        # Add query parameters to the URL
+        if query:
+            url += ("&" if "?" in url else "?") + "&".join(
+                quote(k, safe=SAFE_CHARS) + "=" + quote(v, safe=SAFE_CHARS)
+                for k, v in query
+            )
+
+        # Make sure one of the sets of required parameters is present
+        if not force and self.required_params:
+            missing_params = []
+            for required in self.required_params:
+                missing = required - query_keys
+                if not missing:
+                    break
+                missing_params.extend(sorted(missing))
+            else:
+                self._missing(missing_params)
+
+        if debug:
+            logger.debug("URL: %s", url)
+
+        return url
+
+    def _missing(self, missing_params):
+        if self.note:
+            note = "\n--Endpoint note: " + self.note
+        else:
+            note = ""
+
+        raise ValueError(
+            "Missing required parameter(s): "
+            + ", ".join(missing_params)
+            + ".\n--Required parameters for the "
+            + self.name
+            + " endpoint: "
+            + str(self.config.get("required_params", []))
+            + ". \n--Note: If there are multiple sets in the required parameter list, you can choose any of the sets."
+            + note
+        )
+
+
+_compiled = {}
+
+
+def compile_endpoint(name):
+    """Return the CompiledEndpoint for the named ENDPOINTS entry.
+
+    Entries are compiled on first use and recompiled if the ENDPOINTS entry
+    is replaced.
+    """
+    config = endpoints.ENDPOINTS.get(name)
+    if not config:
+        raise ValueError("Invalid endpoint (" + str(name) + ").")
+    compiled = _compiled.get(name)
+    if compiled is None or compiled.config is not config:
+        compiled = _compiled[name] = CompiledEndpoint(name, config)
+    return compiled
+
+
+def build_url(endpoint, params={}, force=False):
+    """Validate params against the endpoint configuration and return the request URL."""
+    return compile_endpoint(endpoint).build_url(params, force)
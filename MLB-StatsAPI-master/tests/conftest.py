@@ -0,0 +1,21 @@
+import pytest
+import statsapi
+
+
+@pytest.fixture(autouse=True)
+def empty_response_cache():
+    statsapi.clear_cache()
+    yield
+    statsapi.clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def no_backoff_sleep(monkeypatch):
+    monkeypatch.setattr("statsapi.ratelimit._sleep", lambda seconds: None)
+
+
+@pytest.fixture(autouse=True)
+def closed_breakers():
+    statsapi.configure_breakers()
+    yield
+    statsapi.configure_breakers()
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+import statsapi
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+from statsapi.aio import AsyncClient  # noqa: E402
+
+
+def fake_dict(port):
+    return {
+        "foo": {
+            "url": "http://127.0.0.1:%s/foo{id}" % port,
+            "path_params": {
+                "id": {
+                    "type": "str",
+                    "default": None,
+                    "leading_slash": True,
+                    "trailing_slash": False,
+                    "required": True,
+                }
+            },
+            "query_params": ["bar"],
+            "required_params": [["bar"]],
+        }
+    }
+
+
+async def serve(handler):
+    app = web.Application()
+    app.router.add_get("/foo/{id}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, port
+
+
+def test_async_get_uses_endpoint_config(mocker):
+    seen = []
+
+    async def handler(request):
+        seen.append(request.path_qs)
+        await asyncio.sleep(0.05)
+        return web.json_response({"id": request.match_info["id"]})
+
+    async def main():
+        runner, port = await serve(handler)
+        mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(port), clear=True)
+        try:
+            async with AsyncClient() as client:
+                return await asyncio.gather(
+                    *(client.get("foo", {"id": i, "bar": "baz"}) for i in range(5))
+                )
+        finally:
+            await runner.cleanup()
+
+    results = asyncio.run(main())
+    assert [r["id"] for r in results] == ["0", "1", "2", "3", "4"]
+    assert sorted(seen) == ["/foo/%s?bar=baz" % i for i in range(5)]
+
+
+def test_async_get_validates_params(mocker):
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(1), clear=True)
+
+    async def main():
+        async with AsyncClient() as client:
+            await client.get("foo", {"id": 1})
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
@@ -0,0 +1,52 @@
+import json
+import os
+import sys
+
+import pytest
+import statsapi
+from statsapi import boxdata
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+from bench_boxscore import synthetic_game  # noqa: E402
+
+
+def test_raw_sections_do_not_build_tables():
+    box = statsapi._boxscore_data(synthetic_game(batters=10, pitchers=2))
+    assert isinstance(box, boxdata.BoxscoreData)
+    assert box["home"]["battingOrder"]
+    assert box.get("playerInfo")
+    assert not any(box.is_built(k) for k in boxdata._DERIVED)
+
+
+def test_table_is_built_once_on_first_read():
+    box = statsapi._boxscore_data(synthetic_game(batters=10, pitchers=2))
+    batters = box["awayBatters"]
+    assert box.is_built("awayBatters") and not box.is_built("homeBatters")
+    assert box["awayBatters"] is batters
+    # header row plus one row per batter
+    assert len(batters) == 11
+    assert batters[0]["namefield"] == "Yankees Batters"
+    assert batters[1]["namefield"].startswith("1 ")
+    assert batters[10]["substitution"] is True
+    assert len(box["homePitchers"]) == 3
+
+
+def test_behaves_like_the_dict_it_replaces():
+    box = statsapi._boxscore_data(synthetic_game(batters=9, pitchers=1))
+    keys = list(box)
+    assert keys[:5] == ["gameId", "teamInfo", "playerInfo", "away", "home"]
+    assert keys[-1] == "gameBoxInfo"
+    assert len(box) == len(keys) == 16
+    assert "homePitchingTotals" in box and "missing" not in box
+    assert box.get("missing") is None
+    with pytest.raises(KeyError):
+        box["missing"]
+
+    box["extra"] = 1
+    del box["awayBattingNotes"]
+    assert list(box)[-1] == "extra"
+    assert "awayBattingNotes" not in box and len(box) == 16
+
+    result = box.to_dict()
+    assert type(result) is dict and list(result) == list(box)
+    assert json.loads(json.dumps(result))["homeBattingTotals"]["ab"] == "5"
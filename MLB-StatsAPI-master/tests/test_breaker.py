@@ -0,0 +1,122 @@
+import threading
+import time
+
+import pytest
+import requests
+import responses
+import statsapi
+from statsapi import breaker
+
+
+def fake_dict():
+    return {
+        "foo": {
+            "url": "http://www.foo.com",
+            "path_params": {},
+            "query_params": ["bar"],
+            "required_params": [[]],
+        }
+    }
+
+
+def test_breaker_opens_after_threshold_and_fails_fast(mocker):
+    statsapi.configure_breakers(failure_threshold=2)
+    request = mocker.Mock(side_effect=requests.exceptions.ConnectTimeout())
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.ConnectTimeout):
+            breaker.guard("api.test", request)
+    assert statsapi.get_breaker("api.test").state == breaker.OPEN
+
+    mocker.patch.object(breaker.CircuitBreaker, "probe")
+    with pytest.raises(statsapi.CircuitOpenError):
+        breaker.guard("api.test", request)
+    assert request.call_count == 2
+
+
+def test_client_errors_do_not_trip_breaker():
+    statsapi.configure_breakers(failure_threshold=1)
+    response = requests.Response()
+    response.status_code = 404
+
+    def not_found():
+        raise requests.exceptions.HTTPError(response=response)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        breaker.guard("api.test", not_found)
+    assert statsapi.get_breaker("api.test").state == breaker.CLOSED
+
+
+def test_background_probe_closes_breaker():
+    statsapi.configure_breakers(failure_threshold=1, probe_interval=0)
+    b = statsapi.get_breaker("api.test")
+    b.record_failure()
+    assert b.state == breaker.OPEN
+
+    done = []
+    assert b.probe(lambda: done.append(1))
+    for _ in range(100):
+        if b.state == breaker.CLOSED:
+            break
+        time.sleep(0.01)
+    assert done == [1]
+    assert b.state == breaker.CLOSED
+
+
+@responses.activate
+def test_get_serves_stale_cache_when_api_fails(mocker):
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
+    statsapi.configure_retries(max_retries=0)
+    try:
+        responses.add(responses.GET, "http://www.foo.com?bar=1", json={"a": 1})
+        responses.add(responses.GET, "http://www.foo.com?bar=1", status=503)
+        first = statsapi.get("foo", {"bar": 1}, cache_ttl=60)
+        statsapi.get_cache().lookup("http://www.foo.com?bar=1").expires = 0
+
+        second = statsapi.get("foo", {"bar": 1}, cache_ttl=60)
+    finally:
+        statsapi.configure_retries()
+
+    assert second == first
+    assert statsapi.is_stale(second)
+    assert not statsapi.is_stale(first)
+
+
+@responses.activate
+def test_coalesced_callers_record_one_failure(mocker):
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
+    statsapi.configure_retries(max_retries=0)
+    statsapi.configure_breakers(failure_threshold=5)
+    flight = statsapi.get_flight()
+    shared = flight.shared
+
+    def unavailable(request):
+        # Hold the request until the other callers are waiting on it
+        for _ in range(200):
+            if flight.shared - shared >= 4:
+                break
+            time.sleep(0.01)
+        return (503, {}, "")
+
+    responses.add_callback(responses.GET, "http://www.foo.com?bar=1", unavailable)
+    errors = []
+
+    def call():
+        try:
+            statsapi.get("foo", {"bar": 1})
+        except requests.exceptions.HTTPError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(5)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        statsapi.configure_retries()
+
+    assert len(errors) == 5
+    assert len(responses.calls) == 1
+    b = statsapi.get_breaker("www.foo.com")
+    assert b.failures == 1
+    assert b.state == breaker.CLOSED
@@ -0,0 +1,184 @@
+import http.server
+import threading
+
+import pytest
+import requests
+import responses
+import statsapi
+from statsapi import cache
+from statsapi.cache import ResponseCache
+
+
+def fake_dict():
+    return {
+        "foo": {
+            "url": "http://www.foo.com",
+            "path_params": {},
+            "query_params": ["bar"],
+            "required_params": [[]],
+        }
+    }
+
+
+@responses.activate
+def test_get_serves_repeat_calls_from_cache(mocker):
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
+    responses.add(responses.GET, "http://www.foo.com?bar=baz", json={"a": 1})
+
+    assert statsapi.get("foo", {"bar": "baz"}, cache_ttl=60) == {"a": 1}
+    assert statsapi.get("foo", {"bar": "baz"}, cache_ttl=60) == {"a": 1}
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_endpoint_without_ttl_is_not_cached(mocker):
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
+    responses.add(responses.GET, "http://www.foo.com?bar=baz", json={"a": 1})
+
+    statsapi.get("foo", {"bar": "baz"})
+    statsapi.get("foo", {"bar": "baz"})
+    assert len(responses.calls) == 2
+
+
+def test_endpoint_ttl_override(mocker):
+    mocker.patch.dict("statsapi.cache._endpoint_ttls", {}, clear=True)
+    assert statsapi.endpoint_ttl("foo") == 0
+    statsapi.set_endpoint_ttl("foo", 30)
+    assert statsapi.endpoint_ttl("foo") == 30
+
+
+def test_expired_entry_is_a_miss():
+    cache = ResponseCache()
+    cache.set("u", {"a": 1}, 10, ttl=-1)
+    assert cache.get("u") is None
+    assert cache.lookup("u").data == {"a": 1}
+
+
+def test_lru_eviction_by_bytes():
+    cache = ResponseCache(max_bytes=25)
+    cache.set("a", 1, 10, ttl=60)
+    cache.set("b", 2, 10, ttl=60)
+    cache.get("a")  # a becomes most recently used
+    cache.set("c", 3, 10, ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.size == 20
+
+
+def test_disk_tier_survives_new_cache(tmp_path):
+    ResponseCache(disk_path=str(tmp_path)).set(
+        "u", {"a": 1}, 7, ttl=60, body=b'{"a": 1}'
+    )
+    assert ResponseCache(disk_path=str(tmp_path)).get("u") == {"a": 1}
+
+
+def test_disk_clear_keeps_other_files(tmp_path):
+    other = tmp_path / "schedule.json"
+    other.write_text("{}")
+    disk = ResponseCache(disk_path=str(tmp_path))
+    disk.set("u", {"a": 1}, 7, ttl=60, body=b'{"a": 1}')
+    disk.clear()
+    assert ResponseCache(disk_path=str(tmp_path)).get("u") is None
+    assert other.exists()
+
+
+class ETagHandler(http.server.BaseHTTPRequestHandler):
+    body = b'{"feed": "large"}'
+    etag = '"v1"'
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def etag_server():
+    ETagHandler.requests = []
+    server = http.server.HTTPServer(("127.0.0.1", 0), ETagHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%s/feed" % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def test_expired_entry_is_revalidated_with_etag(mocker, etag_server):
+    mocker.patch.dict(
+        "statsapi.ENDPOINTS",
+        {
+            "feed": {
+                "url": etag_server,
+                "path_params": {},
+                "query_params": [],
+                "required_params": [[]],
+            }
+        },
+        clear=True,
+    )
+    first = statsapi.get("feed", cache_ttl=60)
+    entry = statsapi.get_cache().lookup(etag_server)
+    entry.expires = 0  # expire it without waiting
+
+    decode = mocker.spy(requests.Response, "json")
+    second = statsapi.get("feed", cache_ttl=60)
+
+    assert ETagHandler.requests == [None, '"v1"']
+    assert second is first
+    assert decode.call_count == 0
+    assert entry.fresh
+    assert statsapi.get_cache().revalidations == 1
+
+
+def test_negative_cache_ttls_and_stats(mocker):
+    now = mocker.patch("statsapi.cache.time.time", return_value=1000.0)
+    negative = cache.NegativeCache({cache.NO_DATA: 30})
+    negative.add("statcast:1", cache.NO_DATA)
+    negative.add("people:nobody")
+
+    assert negative.check("statcast:1") == cache.NO_DATA
+    assert negative.check("people:nobody") == cache.NOT_FOUND
+    assert negative.check("other") is None
+    now.return_value = 1031.0
+    assert negative.check("statcast:1") is None
+    assert negative.check("people:nobody") == cache.NOT_FOUND
+
+    stats = negative.stats()
+    assert stats["hits"] == {cache.NOT_FOUND: 2, cache.NO_DATA: 1}
+    assert stats["misses"] == 2
+    assert stats["entries"] == 1
+
+
+def test_negative_cache_zero_ttl_disables():
+    negative = cache.NegativeCache({cache.NOT_FOUND: 0})
+    negative.add("x")
+    assert negative.check("x") is None
+
+
+@responses.activate
+def test_get_remembers_404(mocker):
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
+    responses.add(responses.GET, "http://www.foo.com?bar=1", status=404)
+
+    for _ in range(3):
+        with pytest.raises(requests.exceptions.HTTPError) as e:
+            statsapi.get("foo", {"bar": 1})
+        assert e.value.response.status_code == 404
+
+    assert len(responses.calls) == 1
+    assert statsapi.get_negative_cache().stats()["hits"][statsapi.NOT_FOUND] == 2
+    assert statsapi.get_breaker("www.foo.com").failures == 0
@@ -0,0 +1,92 @@
+import pytest
+import requests
+import responses
+import statsapi
+from statsapi import cassette
+
+
+def fake_dict():
+    return {
+        "foo": {
+            "url": "http://www.foo.com",
+            "path_params": {},
+            "query_params": ["bar"],
+            "required_params": [[]],
+        }
+    }
+
+
+@responses.activate
+def test_record_then_replay_offline(mocker, tmp_path):
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
+    path = str(tmp_path / "day.cassette.json.gz")
+    responses.add(
+        responses.GET,
+        "http://www.foo.com?bar=1",
+        json={"a": 1},
+        headers={"ETag": '"v1"'},
+    )
+    responses.add(responses.GET, "http://www.foo.com?bar=2", json={"b": 2})
+
+    with statsapi.use_cassette(path, mode="record") as recorded:
+        statsapi.get("foo", {"bar": 1}, cache_ttl=0)
+        statsapi.get("foo", {"bar": 2}, cache_ttl=0)
+    assert len(recorded) == 2
+
+    responses.reset()
+    sleep = mocker.patch("statsapi.cassette._sleep")
+    with statsapi.use_cassette(path, latency=0.25):
+        assert statsapi.get("foo", {"bar": 1}, cache_ttl=0) == {"a": 1}
+        assert statsapi.get("foo", {"bar": 2}, cache_ttl=0) == {"b": 2}
+        r = statsapi.get_client().get("http://www.foo.com?bar=1")
+        assert r.headers["ETag"] == '"v1"'
+        with pytest.raises(statsapi.CassetteMissError):
+            statsapi.get_client().get("http://www.foo.com?bar=3")
+    sleep.assert_called_with(0.25)
+    assert len(responses.calls) == 0
+
+
+def test_replay_steps_through_repeated_responses():
+    c = cassette.Cassette()
+    c.add("GET", "http://x", 200, {}, b"1")
+    c.add("GET", "http://x", 200, {}, b"2")
+
+    bodies = [c.next("get", "http://x")["body"] for _ in range(3)]
+    assert bodies == ["1", "2", "2"]
+    c.rewind()
+    assert c.next("GET", "http://x")["body"] == "1"
+    assert c.next("GET", "http://y") is None
+
+
+def test_binary_bodies_round_trip(tmp_path):
+    path = str(tmp_path / "c.json")
+    c = cassette.Cassette(path)
+    c.add("GET", "http://x/", 200, {"Content-Encoding": "gzip"}, b"\xff\x00")
+    c.save()
+
+    adapter = cassette.ReplayAdapter(cassette.Cassette(path))
+    request = statsapi.Client().session.prepare_request(
+        requests.Request("GET", "http://x/")
+    )
+    r = adapter.send(request)
+    assert r.content == b"\xff\x00"
+    assert "Content-Encoding" not in r.headers
+
+
+@responses.activate
+def test_get_paths_records_and_replays(tmp_path):
+    path = str(tmp_path / "game.cassette.json")
+    feed = {"gamePk": 1, "liveData": {"boxscore": {"pitchers": [10, 11]}}}
+    responses.add(
+        responses.GET, "https://statsapi.mlb.com/api/v1.1/game/1/feed/live", json=feed
+    )
+    paths = ["liveData.boxscore.pitchers"]
+    expected = {"liveData.boxscore.pitchers": [10, 11]}
+
+    with statsapi.use_cassette(path, mode="record"):
+        assert statsapi.get_paths("game", {"gamePk": 1}, paths) == expected
+
+    responses.reset()
+    with statsapi.use_cassette(path):
+        assert statsapi.get_paths("game", {"gamePk": 1}, paths) == expected
+    assert len(responses.calls) == 0
@@ -0,0 +1,119 @@
+import gc
+import threading
+
+import pytest
+import responses
+import statsapi
+from statsapi.client import Client, SingleFlight
+
+
+def test_session_is_reused_within_a_thread():
+    client = Client()
+    assert client.session is client.session
+
+
+def test_each_thread_gets_its_own_session():
+    client = Client()
+    sessions = []
+
+    def grab():
+        sessions.append(client.session)
+
+    threads = [threading.Thread(target=grab) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(set(id(s) for s in sessions)) == 3
+    assert client.session not in sessions
+
+
+def test_threads_share_one_pool_and_release_their_sessions():
+    client = Client()
+    adapters = []
+
+    def grab():
+        adapters.append(client.session.get_adapter("https://statsapi.mlb.com"))
+
+    for _ in range(50):
+        t = threading.Thread(target=grab)
+        t.start()
+        t.join()
+    gc.collect()
+
+    assert len(set(id(a) for a in adapters)) == 1
+    assert len(client._sessions) <= 1
+
+
+def test_pool_size_is_applied_to_mounted_adapter():
+    client = Client(pool_connections=3, pool_maxsize=7)
+    adapter = client.session.get_adapter("https://statsapi.mlb.com/api/v1/sports")
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+
+
+@responses.activate
+def test_default_timeout_is_used_unless_overridden():
+    responses.add(responses.GET, "http://www.foo.com", json={})
+    client = Client(timeout=4)
+    client.get("http://www.foo.com")
+    client.get("http://www.foo.com", timeout=9)
+    assert responses.calls[0].request.req_kwargs["timeout"] == 4
+    assert responses.calls[1].request.req_kwargs["timeout"] == 9
+
+
+def test_configure_client_replaces_shared_client():
+    old = statsapi.get_client()
+    try:
+        new = statsapi.configure_client(pool_maxsize=5)
+        assert statsapi.get_client() is new
+        assert new.pool_maxsize == 5
+    finally:
+        statsapi.set_client(old)
+
+
+def test_single_flight_shares_concurrent_calls():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return {"shared": True}
+
+    results = []
+
+    def worker():
+        results.append(flight.do("url", slow))
+
+    leader = threading.Thread(target=worker)
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=worker) for _ in range(4)]
+    for t in followers:
+        t.start()
+    while flight.shared < 4:
+        pass
+    release.set()
+    for t in [leader] + followers:
+        t.join()
+
+    assert len(calls) == 1
+    assert results == [{"shared": True}] * 5
+    assert flight.in_flight() == []
+
+
+def test_single_flight_shares_errors():
+    flight = SingleFlight()
+
+    def boom():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("url", boom)
+    # the failed call is not remembered
+    assert flight.do("url", lambda: 1) == 1
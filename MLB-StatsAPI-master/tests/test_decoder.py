@@ -0,0 +1,57 @@
+import json
+
+import pytest
+import responses
+import statsapi
+from statsapi import decoder
+
+
+def fake_dict():
+    return {
+        "foo": {
+            "url": "http://www.foo.com",
+            "path_params": {},
+            "query_params": ["bar"],
+            "required_params": [[]],
+        }
+    }
+
+
+@pytest.fixture
+def restore_decoder():
+    yield
+    statsapi.set_decoder()
+
+
+def test_stdlib_decoder_is_always_available(restore_decoder):
+    assert "json" in decoder.DECODERS
+    assert statsapi.set_decoder("json") == "json"
+    assert decoder.loads(b'{"a": [1, "\\u00e9"]}') == {"a": [1, "é"]}
+
+
+def test_default_prefers_fast_decoder():
+    assert statsapi.get_decoder() == list(decoder.DECODERS)[0]
+
+
+def test_unknown_decoder_raises(restore_decoder):
+    with pytest.raises(ValueError):
+        statsapi.set_decoder("simdjson-not-installed")
+
+
+@pytest.mark.parametrize("name", list(decoder.DECODERS))
+def test_invalid_json_raises_value_error(name, restore_decoder):
+    statsapi.set_decoder(name)
+    with pytest.raises(ValueError):
+        decoder.loads(b"{not json")
+
+
+@responses.activate
+def test_get_uses_selected_decoder(mocker, restore_decoder):
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
+    responses.add(responses.GET, "http://www.foo.com?bar=1", body='{"a": 1}')
+    custom = mocker.Mock(side_effect=json.loads)
+    statsapi.set_decoder(custom)
+
+    assert statsapi.get("foo", {"bar": 1}) == {"a": 1}
+    assert statsapi.get_decoder() == "custom"
+    custom.assert_called_once_with(b'{"a": 1}')
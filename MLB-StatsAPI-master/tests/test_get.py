@@ -26,24 +26,25 @@ def fake_dict():
 def test_get_returns_dictionary(mocker):
     # mock the ENDPOINTS dictionary
     mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
-    # mock the requests object
-    mock_req = mocker.patch("statsapi.requests", autospec=True)
+    # mock the shared client
+    mock_get = mocker.patch.object(statsapi.Client, "get", autospec=True)
     # mock the status code to always be 200
-    mock_req.get.return_value.status_code = 200
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.content = b'{"baz": [1, 2]}'
 
     result = statsapi.get("foo", {"bar": "baz"})
-    # assert that result is the same as the return value from calling the json method of a response object
-    assert result == mock_req.get.return_value.json.return_value
+    # assert that result is the decoded body of the response object
+    assert result == {"baz": [1, 2]}
 
 
 def test_get_calls_correct_url(mocker):
     # mock the ENDPOINTS dictionary
     mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
-    # mock the requests object
-    mock_req = mocker.patch("statsapi.requests", autospec=True)
+    # mock the shared client
+    mock_get = mocker.patch.object(statsapi.Client, "get", autospec=True)
 
     statsapi.get("foo", {"bar": "baz"})
-    mock_req.get.assert_called_with("http://www.foo.com?bar=baz")
+    mock_get.assert_called_with(statsapi.get_client(), "http://www.foo.com?bar=baz")
 
 
 @responses.activate
@@ -59,8 +60,8 @@ def test_get_server_error(mocker):
 def test_get_invalid_endpoint(mocker):
     # mock the ENDPOINTS dictionary
     mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
-    # mock the requests object
-    mock_req = mocker.patch("statsapi.requests", autospec=True)
+    # mock the shared client
+    mocker.patch.object(statsapi.Client, "get", autospec=True)
     # invalid endpoint
     with pytest.raises(ValueError):
         statsapi.get("bar", {"foo": "baz"})
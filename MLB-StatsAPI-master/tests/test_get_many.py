@@ -0,0 +1,76 @@
+import threading
+import time
+
+import statsapi
+import requests.exceptions
+import responses
+
+
+def fake_dict():
+    return {
+        "foo": {
+            "url": "http://www.foo.com",
+            "path_params": {},
+            "query_params": ["bar"],
+            "required_params": [["bar"]],
+        }
+    }
+
+
+@responses.activate
+def test_get_many_returns_results_in_input_order(mocker):
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
+    for i in range(5):
+        responses.add(responses.GET, "http://www.foo.com?bar=%s" % i, json={"n": i})
+
+    results = statsapi.get_many("foo", [{"bar": i} for i in (3, 1, 4, 0, 2)])
+    assert [r.data["n"] for r in results] == [3, 1, 4, 0, 2]
+    assert all(r.ok for r in results)
+
+
+@responses.activate
+def test_get_many_collapses_identical_requests(mocker):
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
+    responses.add(responses.GET, "http://www.foo.com?bar=1", json={"n": 1})
+
+    results = statsapi.get_many("foo", [{"bar": 1}, {"bar": "1"}, {"bar": 1}])
+    assert [r.data for r in results] == [{"n": 1}] * 3
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_get_many_reports_errors_per_item(mocker):
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
+    responses.add(responses.GET, "http://www.foo.com?bar=1", json={"n": 1})
+    responses.add(responses.GET, "http://www.foo.com?bar=2", status=500)
+
+    ok, failed, invalid = statsapi.get_many("foo", [{"bar": 1}, {"bar": 2}, {}])
+    assert ok.data == {"n": 1} and ok.error is None
+    assert isinstance(failed.error, requests.exceptions.HTTPError)
+    assert isinstance(invalid.error, ValueError)
+    assert invalid.params == {}
+
+
+def test_get_many_reuses_shared_worker_threads(mocker):
+    lock = threading.Lock()
+    running = []
+    peak = []
+    threads = set()
+
+    def fake_get(endpoint, params, *args, **kwargs):
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+            threads.add(threading.current_thread().name)
+        time.sleep(0.01)
+        with lock:
+            running.pop()
+        return params
+
+    mocker.patch("statsapi.get", side_effect=fake_get)
+    for _ in range(5):
+        statsapi.get_many("sports", [{"sportId": i} for i in range(6)], max_workers=2)
+
+    assert max(peak) <= 2
+    assert all(name.startswith("statsapi") for name in threads)
+    assert len(threads) <= statsapi.client.EXECUTOR_MAX_WORKERS
@@ -0,0 +1,66 @@
+import statsapi
+
+
+def block(category, group, *names):
+    return {
+        "leaderCategory": category,
+        "statGroup": group,
+        "leaders": [
+            {
+                "rank": i + 1,
+                "value": str(50 - i),
+                "team": {"name": "Team {}".format(i)},
+                "person": {"fullName": name},
+            }
+            for i, name in enumerate(names)
+        ],
+    }
+
+
+def test_league_leaders_many_parses_every_category(mocker):
+    mock_get = mocker.patch(
+        "statsapi.get",
+        return_value={
+            "leagueLeaders": [
+                block("homeRuns", "hitting", "Aaron Judge", "Cal Raleigh"),
+                block("strikeouts", "hitting", "Kyle Schwarber"),
+                block("strikeouts", "pitching", "Garrett Crochet"),
+                block("earnedRunAverage", "pitching"),
+            ]
+        },
+    )
+    leaders = statsapi.league_leaders_many(
+        ["homeRuns", "strikeouts", "earnedRunAverage"], season=2025, limit=2
+    )
+
+    assert leaders == {
+        "homeRuns": [
+            [1, "Aaron Judge", "Team 0", "50"],
+            [2, "Cal Raleigh", "Team 1", "49"],
+        ],
+        "strikeouts:hitting": [[1, "Kyle Schwarber", "Team 0", "50"]],
+        "strikeouts:pitching": [[1, "Garrett Crochet", "Team 0", "50"]],
+        "earnedRunAverage": [],
+    }
+    assert mock_get.call_count == 1
+    params = mock_get.call_args.args[1]
+    assert params["leaderCategories"] == "homeRuns,strikeouts,earnedRunAverage"
+    assert "leaderCategory" in params["fields"].split(",")
+    assert 60 <= mock_get.call_args.kwargs["cache_ttl"] <= 24 * 60 * 60
+
+
+def test_league_leader_data_is_unchanged(mocker):
+    mock_get = mocker.patch(
+        "statsapi.get",
+        return_value={"leagueLeaders": [block("homeRuns", "hitting", "Aaron Judge")]},
+    )
+    assert statsapi.league_leader_data("homeRuns", season=2025) == [
+        [1, "Aaron Judge", "Team 0", "50"]
+    ]
+    assert mock_get.call_args.args[1] == {
+        "leaderCategories": "homeRuns",
+        "sportId": 1,
+        "limit": 10,
+        "season": 2025,
+        "fields": "leagueLeaders,leaders,rank,value,team,name,league,name,person,fullName",
+    }
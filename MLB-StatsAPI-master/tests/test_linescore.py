@@ -0,0 +1,110 @@
+import statsapi
+
+
+def linescore(inning=None, half="Top", outs=0, away=0, home=0, **extra):
+    r = {
+        "teams": {
+            "away": {"runs": away, "hits": away + 2, "errors": 0},
+            "home": {"runs": home, "hits": home + 1, "errors": 1},
+        },
+        "balls": 2,
+        "strikes": 1,
+        "outs": outs,
+    }
+    if inning:
+        r.update(
+            {
+                "currentInning": inning,
+                "currentInningOrdinal": "{}th".format(inning),
+                "inningHalf": half,
+                "inningState": half,
+                "scheduledInnings": 9,
+            }
+        )
+    r.update(extra)
+    return r
+
+
+def test_linescore_state_reads_status_and_linescore_from_game(mocker):
+    mock_get = mocker.patch(
+        "statsapi.get",
+        return_value={
+            "gameData": {
+                "status": {"abstractGameState": "Live", "detailedState": "Delayed"}
+            },
+            "liveData": {"linescore": linescore(5, "Bottom", outs=1, away=2, home=3)},
+        },
+    )
+    state = statsapi.linescore_state(745000)
+
+    endpoint, params = mock_get.call_args.args
+    assert endpoint == "game" and params["gamePk"] == 745000
+    assert params["fields"].startswith("gameData,status,")
+    assert state == statsapi.LinescoreState(
+        gamePk=745000,
+        status="Delayed",
+        inning=5,
+        inning_ordinal="5th",
+        half="Bottom",
+        inning_state="Bottom",
+        balls=2,
+        strikes=1,
+        outs=1,
+        away_runs=2,
+        away_hits=4,
+        away_errors=0,
+        home_runs=3,
+        home_hits=4,
+        home_errors=1,
+    )
+    assert state.count == "2-1" and not state.is_final
+
+
+def test_linescore_state_before_first_pitch(mocker):
+    mocker.patch(
+        "statsapi.get",
+        return_value={"gameData": {"status": {"detailedState": "Postponed"}}},
+    )
+    state = statsapi.linescore_state(1)
+    assert state.status == "Postponed" and state.inning == 0 and state.half == ""
+
+
+def test_slate_state_is_one_request(mocker):
+    def game(game_pk, status, ls):
+        return {
+            "gamePk": game_pk,
+            "gameDate": "2025-04-01T23:05:00Z",
+            "status": {"detailedState": status},
+            "teams": {
+                "away": {"team": {"id": 147, "name": "Yankees"}},
+                "home": {"team": {"id": 111, "name": "Red Sox"}},
+            },
+            "linescore": ls,
+        }
+
+    mock_get = mocker.patch(
+        "statsapi.get",
+        return_value={
+            "dates": [
+                {
+                    "games": [
+                        game(1, "Warmup", {}),
+                        game(2, "In Progress", linescore(3, outs=2, away=1)),
+                        game(3, "Final", linescore(9, "Top", 3, away=0, home=4)),
+                    ]
+                }
+            ]
+        },
+    )
+    games = statsapi.slate_state("2025-04-01")
+
+    assert mock_get.call_count == 1
+    endpoint, params = mock_get.call_args.args
+    assert endpoint == "schedule" and params["hydrate"] == "linescore"
+    assert mock_get.call_args.kwargs["cache_ttl"] == statsapi.endpoint_ttl(
+        "game_linescore"
+    )
+    assert [g["game_id"] for g in games] == [1, 2, 3]
+    assert games[0]["state"].status == "Warmup" and games[0]["state"].inning == 0
+    assert games[1]["state"].inning == 3 and games[1]["state"].away_runs == 1
+    assert games[2]["state"].is_final and games[2]["home_name"] == "Red Sox"
@@ -0,0 +1,120 @@
+import pytest
+import statsapi
+from statsapi import live
+
+
+def feed(timecode, balls=0, state="Live"):
+    return {
+        "metaData": {"timeStamp": timecode},
+        "gameData": {"status": {"abstractGameState": state}},
+        "liveData": {
+            "plays": {"allPlays": [{"about": {"atBatIndex": 0}}]},
+            "linescore": {"balls": balls, "outs": 0},
+        },
+    }
+
+
+def test_apply_patch_operations():
+    doc = {"a": {"b": 1, "c/d": [1, 2]}, "e": [{"f": 1}]}
+    result = live.apply_patch(
+        doc,
+        [
+            {"op": "replace", "path": "/a/b", "value": 2},
+            {"op": "add", "path": "/a/c~1d/-", "value": 3},
+            {"op": "add", "path": "/e/0/g", "value": "x"},
+            {"op": "remove", "path": "/a/c~1d/0"},
+            {"op": "copy", "from": "/a/b", "path": "/h"},
+            {"op": "move", "from": "/h", "path": "/e/1"},
+            {"op": "test", "path": "/e/1", "value": 2},
+        ],
+    )
+    assert result is doc
+    assert doc == {"a": {"b": 2, "c/d": [2, 3]}, "e": [{"f": 1, "g": "x"}, 2]}
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        {"op": "replace", "path": "/missing/x", "value": 1},
+        {"op": "remove", "path": "/a/5"},
+        {"op": "test", "path": "/a/0", "value": 2},
+        {"op": "bogus", "path": "/a"},
+    ],
+)
+def test_apply_patch_errors(operation):
+    with pytest.raises(live.PatchError):
+        live.apply_patch({"a": [1]}, [operation])
+
+
+def test_tracker_applies_diffs_since_last_timecode(mocker):
+    diff = [
+        {
+            "diff": [
+                {"op": "replace", "path": "/metaData/timeStamp", "value": "t2"},
+                {"op": "replace", "path": "/liveData/linescore/balls", "value": 1},
+            ]
+        }
+    ]
+    mock_get = mocker.patch("statsapi.get", side_effect=[feed("t1"), diff, []])
+    tracker = statsapi.LiveGameTracker(745000)
+
+    assert tracker.update()["liveData"]["linescore"]["balls"] == 0
+    assert tracker.update()["liveData"]["linescore"]["balls"] == 1
+    assert tracker.timecode == "t2"
+    assert tracker.update()["liveData"]["linescore"]["balls"] == 1
+
+    assert mock_get.call_args_list[1] == mocker.call(
+        "game_diff", {"gamePk": 745000, "startTimecode": "t1"}, cache_ttl=0
+    )
+    assert mock_get.call_args_list[2][0][1]["startTimecode"] == "t2"
+    assert (tracker.full_fetches, tracker.diff_fetches) == (1, 2)
+    assert tracker.operations_applied == 2
+
+
+def test_tracker_replaces_state_with_full_feed(mocker):
+    bad_diff = [{"diff": [{"op": "replace", "path": "/nope/x", "value": 1}]}]
+    mocker.patch(
+        "statsapi.get",
+        side_effect=[feed("t1"), feed("t5", balls=3), bad_diff, feed("t6", balls=2)],
+    )
+    tracker = statsapi.LiveGameTracker(745000)
+    tracker.update()
+
+    # The API answers with a full feed when the gap is too large
+    assert tracker.update()["liveData"]["linescore"]["balls"] == 3
+    assert tracker.timecode == "t5"
+    # A diff that does not apply triggers a full fetch
+    assert tracker.update()["liveData"]["linescore"]["balls"] == 2
+    assert tracker.timecode == "t6" and tracker.full_fetches == 2
+
+
+def test_tracker_stops_polling_final_game(mocker):
+    mock_get = mocker.patch("statsapi.get", return_value=feed("t1", state="Final"))
+    tracker = statsapi.LiveGameTracker(745000)
+    tracker.update()
+    tracker.update()
+    assert tracker.is_final and mock_get.call_count == 1
+
+
+def test_trackers_on_one_game_do_not_share_state(mocker):
+    shared = feed("t1")
+    diff = [
+        {
+            "diff": [
+                {"op": "replace", "path": "/metaData/timeStamp", "value": "t2"},
+                {"op": "add", "path": "/liveData/plays/allPlays/-", "value": {}},
+            ]
+        }
+    ]
+    mocker.patch("statsapi.get", side_effect=[shared, shared, diff, diff])
+    a = statsapi.LiveGameTracker(745000)
+    b = statsapi.LiveGameTracker(745000)
+    a.update()
+    b.update()
+    assert a.state is not b.state
+
+    a.update()
+    b.update()
+    assert len(a.state["liveData"]["plays"]["allPlays"]) == 2
+    assert len(b.state["liveData"]["plays"]["allPlays"]) == 2
+    assert len(shared["liveData"]["plays"]["allPlays"]) == 1
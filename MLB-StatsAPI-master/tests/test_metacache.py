@@ -0,0 +1,116 @@
+import json
+import threading
+
+import pytest
+import statsapi
+from statsapi import metacache
+
+PITCH_TYPES = [
+    {"code": "FF", "description": "Four-Seam Fastball"},
+    {"code": "SL", "description": "Slider"},
+]
+
+
+@pytest.fixture(autouse=True)
+def memory_meta_cache():
+    statsapi.configure_meta_cache()
+    yield
+    statsapi.configure_meta_cache()
+
+
+@pytest.fixture
+def mock_get(mocker):
+    return mocker.patch("statsapi.get", return_value=PITCH_TYPES)
+
+
+def test_meta_is_fetched_once_per_process(mock_get):
+    assert statsapi.meta("pitchTypes") == PITCH_TYPES
+    assert statsapi.meta("pitchTypes") == PITCH_TYPES
+    assert statsapi.meta_name("pitchTypes", "SL") == "Slider"
+    assert statsapi.meta_name("pitchTypes", "XX", "XX") == "XX"
+    mock_get.assert_called_once_with("meta", {"type": "pitchTypes"}, cache_ttl=0)
+
+    statsapi.get_meta_cache().refresh()
+    assert mock_get.call_count == 2
+
+
+def test_meta_is_stored_on_disk_with_version(mock_get, tmp_path):
+    statsapi.configure_meta_cache(str(tmp_path))
+    statsapi.meta("pitchTypes")
+    stored = json.loads((tmp_path / "meta-pitchTypes.json").read_text())
+    assert stored["version"] == metacache.META_CACHE_VERSION
+    assert stored["data"] == PITCH_TYPES
+
+    # A new process loads it from disk
+    statsapi.configure_meta_cache(str(tmp_path))
+    assert statsapi.meta_name("pitchTypes", "FF") == "Four-Seam Fastball"
+    assert mock_get.call_count == 1
+
+    # Files from another version are ignored
+    stored["version"] = -1
+    (tmp_path / "meta-pitchTypes.json").write_text(json.dumps(stored))
+    statsapi.configure_meta_cache(str(tmp_path))
+    statsapi.meta("pitchTypes")
+    assert mock_get.call_count == 2
+
+
+def test_meta_expires_after_ttl(mock_get, tmp_path):
+    statsapi.configure_meta_cache(str(tmp_path), ttl=0)
+    statsapi.meta("pitchTypes")
+    statsapi.meta("pitchTypes")
+    assert mock_get.call_count == 2
+
+
+def test_meta_name_uses_type_code_fields(mocker):
+    mocker.patch(
+        "statsapi.get",
+        return_value=[{"statusCode": "F", "detailedState": "Final"}],
+    )
+    assert statsapi.meta_name("gameStatus", "F") == "Final"
+
+
+def test_failed_fetch_serves_expired_disk_copy_and_backs_off(mocker, tmp_path):
+    mock_get = mocker.patch("statsapi.get", return_value=PITCH_TYPES)
+    statsapi.configure_meta_cache(str(tmp_path), ttl=0)
+    statsapi.meta("pitchTypes")
+
+    # A new process finds the expired file, and the API is down
+    mock_get.side_effect = ConnectionError("down")
+    statsapi.configure_meta_cache(str(tmp_path), ttl=0)
+    assert statsapi.meta_name("pitchTypes", "SL") == "Slider"
+    assert statsapi.meta_name("pitchTypes", "FF") == "Four-Seam Fastball"
+    assert mock_get.call_count == 2
+
+
+def test_failed_fetch_without_copy_raises_until_backoff_ends(mocker):
+    mock_get = mocker.patch("statsapi.get", side_effect=ConnectionError("down"))
+    for _ in range(3):
+        with pytest.raises(ConnectionError):
+            statsapi.meta("pitchTypes")
+    assert mock_get.call_count == 1
+
+    statsapi.configure_meta_cache(failure_backoff=0)
+    mock_get.side_effect = None
+    mock_get.return_value = PITCH_TYPES
+    assert statsapi.meta("pitchTypes") == PITCH_TYPES
+
+
+def test_slow_fetch_does_not_block_other_types(mocker):
+    release = threading.Event()
+
+    def fetch(endpoint, params, **kwargs):
+        if params["type"] == "pitchTypes":
+            release.wait(5)
+            return PITCH_TYPES
+        return [{"code": "1", "fullName": "Pitcher"}]
+
+    mocker.patch("statsapi.get", side_effect=fetch)
+    slow = threading.Thread(target=statsapi.meta, args=("pitchTypes",))
+    slow.start()
+    try:
+        assert statsapi.meta_name("positions", "1") == "Pitcher"
+        assert slow.is_alive()
+    finally:
+        release.set()
+        slow.join()
+    assert statsapi.meta_name("pitchTypes", "SL") == "Slider"
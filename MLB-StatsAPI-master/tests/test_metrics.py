@@ -0,0 +1,68 @@
+import pytest
+import responses
+import statsapi
+from statsapi import metrics
+
+
+def fake_dict():
+    return {
+        "foo": {
+            "url": "http://www.foo.com",
+            "path_params": {},
+            "query_params": ["bar"],
+            "required_params": [[]],
+        }
+    }
+
+
+def test_histogram_and_quantiles():
+    registry = metrics.MetricsRegistry()
+    for latency in (0.005, 0.02, 0.02, 0.3, 12):
+        registry.record_request("foo", latency, size=10, decode_time=0.001)
+
+    m = registry.get("foo")
+    assert m["calls"] == 5
+    assert m["bytes"] == 50
+    assert m["histogram"]["0.01"] == 1
+    assert m["histogram"]["0.025"] == 2
+    assert m["histogram"]["0.5"] == 1
+    assert m["histogram"]["+Inf"] == 1
+    assert m["latency_p50"] == 0.025
+    assert m["latency_max"] == 12
+    assert registry.get("bar") is None
+
+
+def test_timer_records_errors():
+    registry = metrics.MetricsRegistry()
+    with registry.timer("savant") as timing:
+        timing["bytes"] = 100
+    with pytest.raises(ValueError):
+        with registry.timer("savant"):
+            raise ValueError()
+
+    m = registry.get("savant")
+    assert (m["calls"], m["errors"], m["bytes"]) == (2, 1, 100)
+
+
+def test_disabled_registry_records_nothing():
+    registry = metrics.MetricsRegistry(enabled=False)
+    registry.record_request("foo", 0.1)
+    registry.record_cache("foo", True)
+    assert registry.snapshot() == {}
+
+
+@responses.activate
+def test_get_records_requests_and_cache_hits(mocker):
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
+    statsapi.reset_metrics()
+    responses.add(responses.GET, "http://www.foo.com?bar=1", body='{"a": 1}')
+
+    statsapi.get("foo", {"bar": 1}, cache_ttl=60)
+    statsapi.get("foo", {"bar": 1}, cache_ttl=60)
+
+    m = statsapi.get_metrics().get("foo")
+    assert m["calls"] == 1
+    assert m["bytes"] == len('{"a": 1}')
+    assert m["cache_hits"] == 1
+    assert m["cache_misses"] == 1
+    assert list(statsapi.get_metrics().snapshot()) == ["foo"]
@@ -0,0 +1,79 @@
+import pytest
+import statsapi
+
+
+def person(person_id):
+    return {
+        "id": person_id,
+        "useName": "First{}".format(person_id),
+        "lastName": "Last{}".format(person_id),
+        "active": True,
+        "primaryPosition": {"abbreviation": "SS"},
+        "batSide": {"description": "Right"},
+        "pitchHand": {"description": "Right"},
+        "stats": [
+            {
+                "type": {"displayName": "season"},
+                "group": {"displayName": "hitting"},
+                "splits": [{"season": "2025", "stat": {"hits": person_id % 100}}],
+            }
+        ],
+    }
+
+
+def people_response(endpoint, params, *args, **kwargs):
+    # The API leaves out unknown ids
+    ids = [int(i) for i in params["personIds"].split(",") if i != "999"]
+    return {"people": [person(i) for i in reversed(ids)]}
+
+
+@pytest.fixture
+def mock_get(mocker):
+    return mocker.patch("statsapi.get", side_effect=people_response)
+
+
+def test_bulk_matches_single_player_structure(mock_get):
+    players = statsapi.player_stat_data_many(
+        [660271, "665742", 999, 660271], group="hitting"
+    )
+    assert list(players) == [660271, 665742]
+    assert players[665742] == statsapi._player_stat_data({"people": [person(665742)]})
+    assert mock_get.call_count == 1
+    assert mock_get.call_args.kwargs["cache_ttl"] == statsapi.endpoint_ttl(
+        "person_stats"
+    )
+    params = mock_get.call_args.args[1]
+    assert params["personIds"] == "660271,665742,999"
+    assert params["hydrate"] == (
+        "stats(group=hitting,type=season,sportId=1),currentTeam"
+    )
+
+
+def test_bulk_chunks_by_url_length(mock_get, monkeypatch):
+    monkeypatch.setattr(statsapi, "MAX_URL_LENGTH", 190)
+    ids = list(range(100000, 100026))
+    players = statsapi.player_stat_data_many(ids, projection=["id", "stats"])
+    assert list(players) == ids
+    assert players[100001] == {
+        "id": 100001,
+        "stats": [
+            {
+                "type": "season",
+                "group": "hitting",
+                "season": "2025",
+                "stats": {"hits": 1},
+            }
+        ],
+    }
+
+    chunks = [c.args[1]["personIds"].split(",") for c in mock_get.call_args_list]
+    assert len(chunks) > 1
+    assert sorted(int(i) for chunk in chunks for i in chunk) == ids
+    for call in mock_get.call_args_list:
+        assert len(statsapi._build_url("people", call.args[1])) <= 190
+
+
+def test_bulk_raises_failed_chunk(mocker):
+    mocker.patch("statsapi.get", side_effect=ValueError("boom"))
+    with pytest.raises(ValueError):
+        statsapi.player_stat_data_many([1, 2])
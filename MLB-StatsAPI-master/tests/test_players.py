@@ -0,0 +1,95 @@
+import pytest
+import statsapi
+from statsapi import players
+
+PEOPLE = [
+    {
+        "id": 660271,
+        "fullName": "Shohei Ohtani",
+        "firstName": "Shohei",
+        "lastName": "Ohtani",
+        "useName": "Shohei",
+        "currentTeam": {"id": 119},
+    },
+    {
+        "id": 608070,
+        "fullName": "José Ramírez",
+        "firstName": "José",
+        "lastName": "Ramírez",
+        "useName": "José",
+        "currentTeam": {"id": 114},
+    },
+    {
+        "id": 665742,
+        "fullName": "Juan Soto",
+        "firstName": "Juan",
+        "lastName": "Soto",
+        "useName": "Juan",
+        "currentTeam": {"id": 121},
+    },
+    {
+        "id": 677951,
+        "fullName": "Bobby Witt Jr.",
+        "firstName": "Robert",
+        "lastName": "Witt",
+        "useName": "Bobby",
+        "currentTeam": {"id": 118},
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def reset_indexes():
+    statsapi.configure_player_index()
+    yield
+    statsapi.configure_player_index()
+
+
+@pytest.fixture
+def mock_get(mocker):
+    return mocker.patch("statsapi.get", return_value={"people": PEOPLE})
+
+
+def test_normalize_name():
+    assert players.normalize_name("  José  Ramírez ") == "jose ramirez"
+    assert players.normalize_name("J.D. Martinez") == "jd martinez"
+    assert players.normalize_name("Ke'Bryan Hayes") == "kebryan hayes"
+    assert players.normalize_name("Jung-Hoo Lee") == "jung hoo lee"
+
+
+def test_exact_and_prefix_lookups():
+    index = players.PlayerIndex(PEOPLE, 2025)
+    assert index.get_id("jose ramirez") == 608070
+    assert index.get_id("JOSÉ RAMÍREZ") == 608070
+    assert index.get_id("Bobby Witt") == index.get_id("Robert Witt Jr") == 677951
+    assert [p["id"] for p in index.lookup("soto")] == [665742]
+    assert index.get_id("Nobody") is None
+    assert [p["id"] for p in index.prefix("jo")] == [608070]
+    assert [p["id"] for p in index.prefix("s", limit=1)] == [660271]
+    assert 660271 in index and index.player(665742)["fullName"] == "Juan Soto"
+
+
+def test_lookup_player_searches_index_once(mock_get):
+    assert [p["id"] for p in statsapi.lookup_player("juan", season=2025)] == [665742]
+    assert [p["id"] for p in statsapi.lookup_player("o 11", season=2025)] == [
+        660271,
+        608070,
+        677951,
+    ]
+    assert mock_get.call_count == 1
+    params = mock_get.call_args.args[1]
+    assert params["season"] == 2025 and params["fields"] == players.PLAYER_FIELDS
+
+
+def test_snapshot_is_reused_until_ttl(mock_get, tmp_path):
+    statsapi.configure_player_index(str(tmp_path))
+    statsapi.get_player_index(2025)
+    assert (tmp_path / "players-1-2025.json").exists()
+
+    statsapi.configure_player_index(str(tmp_path))
+    index = statsapi.get_player_index(2025)
+    assert mock_get.call_count == 1 and index.get_id("Shohei Ohtani") == 660271
+
+    statsapi.configure_player_index(str(tmp_path), ttl=0)
+    statsapi.get_player_index(2025)
+    assert mock_get.call_count == 2
@@ -0,0 +1,104 @@
+import pytest
+import statsapi
+from statsapi import projection
+
+
+def test_default_schedule_params_are_unchanged():
+    params = statsapi._schedule_params(date="2025-04-01")
+    assert "fields" not in params
+    assert params["hydrate"] == (
+        "decisions,probablePitcher(note),linescore,broadcasts,"
+        "game(content(media(epg))),seriesStatus"
+    )
+
+
+def test_schedule_projection_narrows_fields_and_hydrate():
+    params = statsapi._schedule_params(
+        date="2025-04-01", projection=["game_id", "away_probable_pitcher"]
+    )
+    assert params["hydrate"] == "probablePitcher(note)"
+    fields = params["fields"].split(",")
+    assert "probablePitcher" in fields and "gamePk" in fields
+    assert "broadcasts" not in fields
+
+    params = statsapi._schedule_params(date="2025-04-01", projection=["game_id"])
+    assert "hydrate" not in params
+
+
+def test_projection_respects_disabled_hydrations():
+    params = statsapi._schedule_params(
+        date="2025-04-01",
+        include_series_status=False,
+        projection=["series_status"],
+    )
+    assert "hydrate" not in params
+
+
+def test_invalid_projection_key():
+    with pytest.raises(ValueError):
+        statsapi._schedule_params(date="2025-04-01", projection=["nope"])
+
+
+def test_player_stats_projection_without_stats_uses_fields():
+    params = statsapi._player_stat_params(592450, projection=["id", "current_team"])
+    assert params["hydrate"] == "currentTeam"
+    assert "currentTeam" in params["fields"].split(",")
+
+    params = statsapi._player_stat_params(592450, projection=["id", "stats"])
+    assert params["hydrate"].startswith("stats(group=")
+    assert "fields" not in params
+
+
+def test_schedule_games_are_projected():
+    r = {
+        "totalItems": 1,
+        "dates": [
+            {
+                "date": "2025-04-01",
+                "games": [
+                    {
+                        "gamePk": 1,
+                        "gameDate": "2025-04-01T23:05:00Z",
+                        "gameType": "R",
+                        "status": {"detailedState": "In Progress"},
+                        "teams": {
+                            "away": {"team": {"id": 1, "name": "A"}, "score": 2},
+                            "home": {"team": {"id": 2, "name": "B"}, "score": 1},
+                        },
+                        "doubleHeader": "N",
+                        "gameNumber": 1,
+                    }
+                ],
+            }
+        ],
+    }
+    games = statsapi._schedule_games(r, ["game_id", "away_score", "summary"])
+    assert games == [
+        {
+            "game_id": 1,
+            "away_score": 2,
+            "summary": "2025-04-01 - A (2) @ B (1) ( of the )",
+        }
+    ]
+
+
+def test_roster_projection_selects_columns():
+    r = {
+        "roster": [
+            {
+                "jerseyNumber": "99",
+                "position": {"abbreviation": "RF"},
+                "person": {"fullName": "Aaron Judge"},
+            }
+        ]
+    }
+    assert statsapi._roster(r) == "#99  RF  Aaron Judge\n"
+    assert statsapi._roster(r, ["name", "jersey_number"]) == "#99  Aaron Judge\n"
+    assert statsapi._roster_params(147, projection=["name"])["fields"] == (
+        "fullName,person,roster"
+    )
+
+
+def test_standings_fields_cover_division_filter():
+    fields = projection.STANDINGS.fields(["w", "l"]).split(",")
+    assert {"abbreviation", "division", "wins", "losses"} <= set(fields)
@@ -0,0 +1,67 @@
+import responses
+import statsapi
+from statsapi import ratelimit
+
+
+def fake_dict():
+    return {
+        "foo": {
+            "url": "http://www.foo.com",
+            "path_params": {},
+            "query_params": ["bar"],
+            "required_params": [[]],
+        }
+    }
+
+
+def test_token_bucket_allows_burst_then_waits(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ratelimit, "_monotonic", lambda: now[0])
+    bucket = ratelimit.TokenBucket(rate=2, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() == 0.5
+    now[0] += 1.0
+    assert bucket.reserve() == 0.0
+
+
+def test_throttle_halves_rate_and_success_recovers(monkeypatch):
+    monkeypatch.setattr(ratelimit, "_monotonic", lambda: 100.0)
+    bucket = ratelimit.TokenBucket(rate=10, burst=10)
+    bucket.throttled(retry_after=3)
+    assert bucket.rate == 5
+    assert bucket.reserve() == 3
+    for _ in range(100):
+        bucket.succeeded()
+    assert bucket.rate == 10
+
+
+def test_retry_after_is_honoured():
+    policy = ratelimit.RetryPolicy(max_backoff=30)
+    assert policy.delay(0, "7") == 7
+    assert policy.delay(0, "120") == 30
+    assert 0 <= policy.delay(3) <= 4
+
+
+@responses.activate
+def test_get_retries_throttled_requests(mocker):
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
+    sleeps = []
+    mocker.patch.object(ratelimit, "_sleep", sleeps.append)
+    limiter = statsapi.configure_rate_limit(rate=100, burst=100)
+    responses.add(
+        responses.GET,
+        "http://www.foo.com?bar=1",
+        status=429,
+        headers={"Retry-After": "2"},
+    )
+    responses.add(responses.GET, "http://www.foo.com?bar=1", status=503)
+    responses.add(responses.GET, "http://www.foo.com?bar=1", json={"ok": True})
+
+    try:
+        assert statsapi.get("foo", {"bar": 1}) == {"ok": True}
+    finally:
+        statsapi.configure_rate_limit()
+
+    assert len(responses.calls) == 3
+    assert sleeps[0] == 2
+    assert limiter.bucket.rate < 100
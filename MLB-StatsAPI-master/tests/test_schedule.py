@@ -0,0 +1,96 @@
+import datetime
+
+import pytest
+import statsapi
+
+
+def schedule_response(params):
+    """A schedule response with one game on the first day of the chunk."""
+    day = params["startDate"]
+    game = {
+        "gamePk": int(day.replace("-", "")),
+        "gameDate": day + "T23:05:00Z",
+        "gameType": "R",
+        "status": {"detailedState": "Final"},
+        "teams": {
+            "away": {"team": {"id": 147, "name": "Yankees"}, "score": 3},
+            "home": {"team": {"id": 111, "name": "Red Sox"}, "score": 5},
+        },
+        "doubleHeader": "N",
+        "gameNumber": 1,
+    }
+    return {"totalItems": 1, "dates": [{"date": day, "games": [game]}]}
+
+
+@pytest.fixture
+def mock_get(mocker):
+    return mocker.patch(
+        "statsapi.get",
+        side_effect=lambda endpoint, params, **kwargs: schedule_response(params),
+    )
+
+
+def test_month_ranges():
+    assert statsapi._month_ranges("2024-11-15", "02/03/2025") == [
+        ("2024-11-15", "2024-11-30"),
+        ("2024-12-01", "2024-12-31"),
+        ("2025-01-01", "2025-01-31"),
+        ("2025-02-01", "2025-02-03"),
+    ]
+    assert statsapi._month_ranges(datetime.date(2025, 4, 1), "2025-04-01") == [
+        ("2025-04-01", "2025-04-01")
+    ]
+    with pytest.raises(ValueError):
+        statsapi._month_ranges("2025-05-01", "2025-04-01")
+
+
+def test_iter_schedule_yields_games_in_date_order(mock_get):
+    games = statsapi.iter_schedule("2025-03-27", "2025-06-10", max_workers=3)
+    assert next(games)["game_id"] == 20250327
+    assert [g["game_id"] for g in games] == [20250401, 20250501, 20250601]
+    assert mock_get.call_count == 4
+    assert all(c.kwargs["cache_ttl"] == 0 for c in mock_get.call_args_list)
+    params = [c.args[1] for c in mock_get.call_args_list]
+    assert sorted((p["startDate"], p["endDate"]) for p in params)[-1] == (
+        "2025-06-01",
+        "2025-06-10",
+    )
+
+
+def test_iter_schedule_projection(mock_get):
+    games = list(
+        statsapi.iter_schedule("2025-04-01", "2025-04-30", projection=["game_id"])
+    )
+    assert games == [{"game_id": 20250401}]
+    assert "fields" in mock_get.call_args.args[1]
+
+
+def test_schedule_table_is_columnar_and_typed(mock_get):
+    table = statsapi.schedule_table(
+        "2025-04-01", "2025-05-31", columns=["game_id", "game_date", "game_datetime"]
+    )
+    assert table == {
+        "game_id": [20250401, 20250501],
+        "game_date": [datetime.date(2025, 4, 1), datetime.date(2025, 5, 1)],
+        "game_datetime": [
+            datetime.datetime(2025, 4, 1, 23, 5, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2025, 5, 1, 23, 5, tzinfo=datetime.timezone.utc),
+        ],
+    }
+    params = mock_get.call_args.args[1]
+    assert "hydrate" not in params and "gamePk" in params["fields"]
+
+    table = statsapi.schedule_table("2025-04-01", "2025-04-30")
+    assert list(table) == list(statsapi.SCHEDULE_COLUMNS)
+    assert table["home_score"] == [5] and table["venue_id"] == [None]
+
+    with pytest.raises(ValueError):
+        statsapi.schedule_table("2025-04-01", "2025-04-30", columns=["summary"])
+
+
+def test_iter_schedule_requests_at_most_max_workers_months_ahead(mock_get):
+    games = statsapi.iter_schedule("2025-01-01", "2025-12-31", max_workers=2)
+    next(games)
+    assert mock_get.call_count <= 3
+    assert len(list(games)) == 11
+    assert mock_get.call_count == 12
@@ -0,0 +1,64 @@
+import io
+import json
+
+import pytest
+import responses
+import statsapi
+from statsapi import stream
+
+FEED = {
+    "gamePk": 1,
+    "gameData": {"teams": {"away": {"name": 'A, "B" {C}'}}, "list": [[1], {}]},
+    "liveData": {
+        "plays": {"allPlays": [{"about": {"inning": 1}}, {"text": "}]"}]},
+        "boxscore": {
+            "teams": {
+                "away": {"pitchers": [10, 11], "note": None},
+                "home": {"pitchers": [20]},
+            },
+            "awayPitcher": {"id": 11, "era": 2.5},
+        },
+    },
+}
+PATHS = [
+    "liveData.boxscore.teams.away.pitchers",
+    "liveData.boxscore.awayPitcher",
+    "gamePk",
+    "liveData.missing",
+]
+EXPECTED = {
+    "liveData.boxscore.teams.away.pitchers": [10, 11],
+    "liveData.boxscore.awayPitcher": {"id": 11, "era": 2.5},
+    "gamePk": 1,
+}
+
+
+@pytest.mark.parametrize("use_ijson", [False, True])
+def test_extract_paths(use_ijson):
+    if use_ijson and stream.ijson is None:
+        pytest.skip("ijson is not installed")
+    body = json.dumps(FEED, indent=1).encode("utf-8")
+
+    assert stream.extract_paths(body, PATHS, use_ijson=use_ijson) == EXPECTED
+    assert (
+        stream.extract_paths(io.BytesIO(body), PATHS, use_ijson=use_ijson) == EXPECTED
+    )
+
+
+def test_scan_stops_once_all_paths_found():
+    # The document is truncated after the requested value
+    assert stream.extract_paths('{"a": {"b": [1, 2]}, "c": {', ["a.b"], False) == {
+        "a.b": [1, 2]
+    }
+
+
+@responses.activate
+def test_get_paths(mocker):
+    responses.add(
+        responses.GET,
+        "https://statsapi.mlb.com/api/v1.1/game/1/feed/live",
+        json=FEED,
+    )
+    result = statsapi.get_paths("game", {"gamePk": 1}, PATHS)
+    assert result == EXPECTED
+    assert statsapi.get_metrics().get("game")["calls"] >= 1
@@ -0,0 +1,70 @@
+import pytest
+import statsapi
+
+
+def schedule(*games):
+    return {
+        "dates": [
+            {"date": "2025-04-0{}".format(i + 1), "games": [g]}
+            for i, g in enumerate(games)
+        ]
+    }
+
+
+def game(game_pk, code):
+    return {"gamePk": game_pk, "status": {"abstractGameCode": code}}
+
+
+TEAMS = {
+    "teams": [
+        {
+            "id": 114,
+            "previousGameSchedule": schedule(game(1, "F"), game(2, "F"), game(3, "L")),
+            "nextGameSchedule": schedule(game(3, "L"), game(4, "P")),
+        },
+        {"id": 147, "previousGameSchedule": schedule(game(2, "F"))},
+        {"id": 111},
+    ]
+}
+
+
+@pytest.fixture
+def mock_get(mocker):
+    return mocker.patch("statsapi.get", return_value=TEAMS)
+
+
+def test_last_and_next_games_in_one_request(mock_get):
+    assert statsapi.last_games() == {114: 2, 147: 2, 111: None}
+    endpoint, params = mock_get.call_args.args
+    assert endpoint == "teams" and params["hydrate"] == "previousSchedule"
+    assert mock_get.call_args.kwargs["cache_ttl"] == statsapi.endpoint_ttl("schedule")
+
+    assert statsapi.next_games(["114", 111, 999]) == {114: 4, 111: None}
+    assert mock_get.call_count == 2
+
+
+def test_single_team_games_use_schedule_ttl(mock_get):
+    assert statsapi.last_game(114) == 2
+    assert statsapi.next_game(114) == 4
+    for call in mock_get.call_args_list:
+        assert call.args[0] == "team"
+        assert call.kwargs["cache_ttl"] == statsapi.endpoint_ttl("schedule")
+
+
+def test_batting_orders_fetches_each_game_once(mocker):
+    def boxscore(endpoint, params, *args, **kwargs):
+        if params["gamePk"] == 3:
+            raise ValueError("boom")
+        return {
+            "teams": {
+                "away": {"team": {"id": 147}, "battingOrder": [10, 11]},
+                "home": {"team": {"id": 114}, "battingOrder": [20, 21]},
+            }
+        }
+
+    mock_get = mocker.patch("statsapi.get", side_effect=boxscore)
+    orders = statsapi.batting_orders({114: 2, 147: 2, 111: 3, 121: None})
+
+    assert orders == {114: [20, 21], 147: [10, 11], 111: [], 121: []}
+    assert sorted(c.args[1]["gamePk"] for c in mock_get.call_args_list) == [2, 3]
+    assert mock_get.call_args.args[0] == "game_boxscore"
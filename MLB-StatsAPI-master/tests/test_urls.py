@@ -0,0 +1,105 @@
+import pytest
+from statsapi import urls
+
+
+def fake_dict():
+    return {
+        "foo": {
+            "url": "http://www.foo.com/{ver}/foo{fooId}{extra}",
+            "path_params": {
+                "ver": {
+                    "type": "str",
+                    "default": "v1",
+                    "leading_slash": False,
+                    "trailing_slash": False,
+                    "required": True,
+                },
+                "fooId": {
+                    "type": "str",
+                    "default": None,
+                    "leading_slash": True,
+                    "trailing_slash": False,
+                    "required": False,
+                },
+                "extra": {
+                    "type": "bool",
+                    "default": True,
+                    "True": "/extra",
+                    "False": "",
+                    "leading_slash": False,
+                    "trailing_slash": False,
+                    "required": False,
+                },
+            },
+            "query_params": ["bar", "baz", "hydrate"],
+            "required_params": [["bar"], ["baz"]],
+        },
+        "needs_id": {
+            "url": "http://www.foo.com/{id}",
+            "path_params": {
+                "id": {
+                    "type": "str",
+                    "default": "",
+                    "leading_slash": False,
+                    "trailing_slash": False,
+                    "required": True,
+                }
+            },
+            "query_params": [[]],
+            "required_params": [[]],
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def fake_endpoints(mocker):
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict(), clear=True)
+
+
+def test_path_params_defaults_and_optional_segments():
+    assert urls.build_url("foo", {"bar": 1}) == "http://www.foo.com/v1/foo?bar=1"
+    assert (
+        urls.build_url("foo", {"bar": 1, "fooId": 5, "extra": True, "ver": "v2"})
+        == "http://www.foo.com/v2/foo/5/extra?bar=1"
+    )
+
+
+def test_any_required_param_set_is_accepted():
+    assert urls.build_url("foo", {"baz": 2}) == "http://www.foo.com/v1/foo?baz=2"
+    with pytest.raises(ValueError) as e:
+        urls.build_url("foo", {"hydrate": "x"})
+    assert "bar, baz" in str(e.value)
+
+
+def test_missing_required_path_param():
+    with pytest.raises(ValueError):
+        urls.build_url("needs_id", {})
+    assert urls.build_url("needs_id", {"id": 7}) == "http://www.foo.com/7"
+
+
+def test_invalid_params_are_dropped_unless_forced():
+    assert (
+        urls.build_url("foo", {"bar": 1, "nope": 2})
+        == "http://www.foo.com/v1/foo?bar=1"
+    )
+    assert (
+        urls.build_url("foo", {"bar": 1, "nope": 2}, force=True)
+        == "http://www.foo.com/v1/foo?bar=1&nope=2"
+    )
+
+
+def test_query_values_are_encoded():
+    url = urls.build_url(
+        "foo", {"bar": "Aaron Judge&x", "hydrate": "stats(group=[hitting],type=season)"}
+    )
+    assert url == (
+        "http://www.foo.com/v1/foo?bar=Aaron%20Judge%26x"
+        "&hydrate=stats(group=[hitting],type=season)"
+    )
+
+
+def test_endpoint_is_recompiled_when_config_changes(mocker):
+    first = urls.compile_endpoint("needs_id")
+    assert urls.compile_endpoint("needs_id") is first
+    mocker.patch.dict("statsapi.ENDPOINTS", fake_dict())
+    assert urls.compile_endpoint("needs_id") is not first
@@ -0,0 +1,58 @@
+import sys
+import os
+
+# Add the parent directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+import statsapi
+import streamlit as st
+
+st.set_page_config(page_title="API Metrics", layout="wide")
+
+st.title("📈 API Request Metrics")
+st.caption("Per-endpoint counters recorded in this process since startup (or the last reset).")
+
+metrics = statsapi.get_metrics()
+
+if st.button("Reset metrics"):
+    statsapi.reset_metrics()
+
+snapshot = metrics.snapshot()
+
+if not snapshot:
+    st.info("No requests recorded yet. Open another page, then come back here.")
+else:
+    rows = []
+    for endpoint, m in snapshot.items():
+        lookups = m["cache_hits"] + m["cache_misses"]
+        rows.append({
+            "Endpoint": endpoint,
+            "Calls": m["calls"],
+            "Errors": m["errors"],
+            "Cache Hit %": round(m["cache_hits"] / lookups * 100, 1) if lookups else None,
+            "Total Time (s)": round(m["latency_total"], 3),
+            "Avg (ms)": round(m["latency_avg"] * 1000, 1),
+            "p50 (ms)": m["latency_p50"] * 1000 if m["latency_p50"] is not None else None,
+            "p95 (ms)": m["latency_p95"] * 1000 if m["latency_p95"] is not None else None,
+            "Max (ms)": round(m["latency_max"] * 1000, 1),
+            "Decode (s)": round(m["decode_total"], 3),
+            "KB": round(m["bytes"] / 1024, 1),
+        })
+
+    # Sorted by total time, so the endpoint dominating render time is on top
+    st.dataframe(pd.DataFrame(rows), use_container_width=True)
+
+    endpoint = st.selectbox("Latency histogram", list(snapshot))
+    if endpoint:
+        histogram = snapshot[endpoint]["histogram"]
+        st.bar_chart(pd.Series(histogram, name="requests"))
+
+cache = statsapi.get_cache()
+if cache is not None:
+    st.subheader("Response Cache")
+    st.json(cache.stats())
+
+st.subheader("Negative Cache")
+st.caption("Lookups that found nothing (404s, unknown names, empty Statcast results).")
+st.json(statsapi.get_negative_cache().stats())
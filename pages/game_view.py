@@ -12,7 +12,7 @@ import statsapi
 from utils.metrics_table_util import generate_player_metrics_table  # Assuming you have a utility to generate the tables
 #from utils.stat_utils import get_pitcher_stats
 from utils.calculate_util import calculate_metrics
-import utils.last_lineup
+from utils.last_lineup import get_last_batting_order
 from datetime import datetime
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
@@ -124,7 +124,11 @@ def fetch_game_data(game_id):
                 if home_pitcher == 'Unknown' or away_pitcher == 'Unknown':
                     
                     # Fetch the schedule for the given game date and game_id
-                    schedule = statsapi.schedule('2025-04-06', game_id=game_id)
+                    schedule = statsapi.schedule(
+                        '2025-04-06',
+                        game_id=game_id,
+                        projection=["home_probable_pitcher", "away_probable_pitcher"],
+                    )
                     
                     for game in schedule:
                         home_pitcher = game.get('home_probable_pitcher', 'Unknown')
@@ -3,11 +3,16 @@ import pandas as pd
 from datetime import datetime
 import pytz
 import streamlit as st
+from utils.scoreboard_utils import render_slate_scoreboard
 
 def fetch_schedule_for_date(selected_date):
     """Fetches the MLB schedule for the selected date."""
     try:
-        schedule = statsapi.schedule(date=selected_date)
+        # Only request the fields process_schedule_data uses
+        schedule = statsapi.schedule(
+            date=selected_date,
+            projection=["game_id", "game_datetime", "home_name", "away_name"],
+        )
         if not schedule:
             st.warning(f"No games found for {selected_date.strftime('%B %d, %Y')}.")
             return None
@@ -85,6 +90,10 @@ st.title("📅 MLB Schedule")
 # --- Date Selector ---
 selected_date = st.date_input("Select a date", value=datetime.today())
 
+# --- Live Scoreboard for the Whole Slate (one request per refresh) ---
+if selected_date and st.checkbox("Show live scoreboard"):
+    render_slate_scoreboard(selected_date.strftime("%Y-%m-%d"))
+
 # --- Fetch Schedule for the Selected Date ---
 if selected_date:
     # Fetch the schedule for the selected date
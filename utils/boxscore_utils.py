@@ -1,30 +1,26 @@
-import requests
+import statsapi
 import streamlit as st
 
 def get_active_pitchers(game_pk):
-    # MLB Stats API URL to fetch game data
-    url = f"https://statsapi.mlb.com/api/v1.1/game/{game_pk}/feed/live"
-    response = requests.get(url)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Debugging: Print the raw response to inspect its structure
-        #print("Full Game Data: ", data)
+    # Stream the live feed and decode only the two pitcher entries we need,
+    # instead of materializing the whole (multi-megabyte) feed
+    paths = ["liveData.boxscore.awayPitcher", "liveData.boxscore.homePitcher"]
+    try:
+        data = statsapi.get_paths("game", {"gamePk": game_pk}, paths)
+    except Exception as e:
+        print(f"Failed to fetch game data: {e}")
+        return None, None
 
-        # Check if the away and home pitcher data exists in the response
-        away_pitcher = data['liveData']['boxscore'].get('awayPitcher', {})
-        home_pitcher = data['liveData']['boxscore'].get('homePitcher', {})
+    # Check if the away and home pitcher data exists in the response
+    away_pitcher = data.get("liveData.boxscore.awayPitcher") or {}
+    home_pitcher = data.get("liveData.boxscore.homePitcher") or {}
 
-        # Debugging: Print the away and home pitcher data
-        #print("Away Pitcher Data:", away_pitcher)
-        #print("Home Pitcher Data:", home_pitcher)
+    # Debugging: Print the away and home pitcher data
+    #print("Away Pitcher Data:", away_pitcher)
+    #print("Home Pitcher Data:", home_pitcher)
 
-        if away_pitcher and home_pitcher:
-            return away_pitcher.get('id', None), home_pitcher.get('id', None)
-        else:
-            print("Pitcher data missing or invalid.")
-            return None, None
+    if away_pitcher and home_pitcher:
+        return away_pitcher.get('id', None), home_pitcher.get('id', None)
     else:
-        print("Failed to fetch game data")
+        print("Pitcher data missing or invalid.")
         return None, None
@@ -31,16 +31,25 @@ def calculate_metrics(player_id, start_date='2024-01-01', end_date=None, player_
     #player_info = game_data.get("playerInfo", {})
     #player_name = player_info.get(f"ID{player_id}", {}).get("fullName", "Unknown")
 
+    # Players with no Statcast rows (e.g. relievers who haven't pitched) are
+    # remembered for a few minutes instead of being refetched on every rerun
+    negative_key = f"statcast:{player_type}:{player_id}:{start_date}:{end_date}"
+    negative = statsapi.get_negative_cache()
+    if negative.check(negative_key):
+        return None
+
     # Fetch Statcast data for the given player ID and date range
     try:
         if player_type == 'batter':
             #print('batter statcast for')
             #print(player_id)
-            stats = pybaseball.statcast_batter(start_date, end_date, player_id)
+            with statsapi.get_metrics().timer("pybaseball:statcast_batter"):
+                stats = pybaseball.statcast_batter(start_date, end_date, player_id)
         elif player_type == 'pitcher':
             #print('pitcher statcast for')
             #print(player_id)
-            stats = pybaseball.statcast_pitcher(start_date, end_date, player_id)
+            with statsapi.get_metrics().timer("pybaseball:statcast_pitcher"):
+                stats = pybaseball.statcast_pitcher(start_date, end_date, player_id)
         else:
             #logging.error("Invalid player_type. Should be 'batter' or 'pitcher'.")
             return {}
@@ -48,6 +57,7 @@ def calculate_metrics(player_id, start_date='2024-01-01', end_date=None, player_
         # If no data is found, return empty metrics with default values
         if stats.empty:
             logging.warning(f"No Statcast data found for player {player_id} ({player_type}) in the specified date range.")
+            negative.add(negative_key, statsapi.NO_DATA)
             return
         
         # Handle missing or empty data
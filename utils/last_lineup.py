@@ -1,43 +1,22 @@
 import statsapi
 
 
+def get_last_batting_orders(team_ids=None):
+    """Batting orders from each team's last completed game (default: all teams).
 
-
-#def teamid_from_boxscore(gameid)
-#statsapi.boxscore_data(gameid)
-def get_last_game(team_id):
-    last_game = statsapi.last_game(team_id)
-    
-    last_game_data = statsapi.boxscore_data(last_game)
-    
-
-    #print(last_game_data)
+    One teams request resolves every team's last game, then the boxscores
+    are fetched concurrently, so the whole league costs 2 round trips.
+    """
+    return statsapi.batting_orders(statsapi.last_games(team_ids))
 
 
-    home_team_id = last_game_data['teamInfo']['home']['id']
-    away_team_id = last_game_data['teamInfo']['away']['id']
+def get_last_batting_order(team_id):
+    return get_last_batting_orders([team_id]).get(int(team_id), [])
 
-    # Now check which team the input team_id corresponds to
-    if team_id == home_team_id:
-        team_data = last_game_data.get("home", {})
-    elif team_id == away_team_id:
-        team_data = last_game_data.get("away", {})
-    else:
-        raise ValueError("Invalid team ID provided.")
-    
-    # Continue with processing the team data
-    print(team_data)
 
-    batting_order = list(team_data.get("battingOrder", []))
+def get_last_game(team_id):
+    batting_order = get_last_batting_order(team_id)
 
     print(batting_order)
 
     return batting_order
-
-    
-
-
-
-
-get_last_game(114)
-
@@ -8,14 +8,55 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 '''
 
+import os
 import requests
 import pandas as pd
 from datetime import datetime
 import json
+import time
 import statsapi
 import pytz
 
 
+SAVANT_HOST = "baseballsavant.mlb.com"
+
+# Season player index snapshots are kept on disk so restarts skip the rebuild
+statsapi.configure_player_index(os.environ.get("PLAYER_INDEX_DIR", "data/player_index"))
+# Meta reference data (pitch types, event types, ...) is refreshed weekly
+statsapi.configure_meta_cache(os.environ.get("META_CACHE_DIR", "data/meta"))
+
+
+def _savant_json(url):
+    """
+    Fetches a Savant JSON response through the shared pooled client and circuit breaker.
+    While Savant is failing, the last good response for the URL is returned instead
+    (statsapi.is_stale(data) is True), or the error is raised if there is none.
+    Last good responses are kept in the shared statsapi response cache, so its
+    size limit applies to them.
+    """
+    def fetch():
+        # Recorded alongside the StatsAPI endpoints in statsapi.get_metrics()
+        with statsapi.get_metrics().timer("savant:career") as timing:
+            response = statsapi.get_client().get(url, timeout=5)  # 5 seconds timeout
+            response.raise_for_status()
+            timing["bytes"] = len(response.content)
+            decode_start = time.perf_counter()
+            data = response.json()
+            timing["decode_time"] = time.perf_counter() - decode_start
+        cache = statsapi.get_cache()
+        if cache is not None:
+            # Stored already expired: only ever read back as the stale fallback
+            cache.set(url, data, len(response.content), 0)
+        return data
+
+    def last_good():
+        cache = statsapi.get_cache()
+        entry = cache.lookup(url) if cache is not None else None
+        return entry.data if entry is not None else None
+
+    return statsapi.breaker.guard(SAVANT_HOST, fetch, stale=last_good)
+
+
 # --- Fetch Pitcher Stats from Statcast API ---
 # --- Fetch Batter Stats for Specific Pitch ---
 def get_batter_performance_by_pitch(batter_name, pitcher_name, season="2025"):
@@ -26,18 +67,12 @@ def get_batter_performance_by_pitch(batter_name, pitcher_name, season="2025"):
     url = f"https://baseballsavant.mlb.com/stats/career?batter_name={batter_name}&pitcher_name={pitcher_name}&season={season}&type=batting"
     
     try:
-        response = requests.get(url, timeout=5)  # 5 seconds timeout
-        
-        if response.status_code != 200:
-            print(f"[ERROR] Failed to fetch batter performance for {batter_name} against {pitcher_name}. Status code: {response.status_code}")
-            print(f"Response: {response.text}")
-            return pd.DataFrame()  # Return empty DataFrame in case of error
-        
-        data = response.json()
+        data = _savant_json(url)
         
         if data:
             df = pd.DataFrame(data['performance_by_pitch'])
             df['pitch_type'] = df['pitch_type'].apply(lambda x: x.strip())
+            df.attrs["stale"] = statsapi.is_stale(data)
             return df
         else:
             print(f"[ERROR] Empty response for batter performance of {batter_name} against {pitcher_name}.")
@@ -55,18 +90,12 @@ def get_pitcher_arsenal_from_statcast(pitcher_name, season="2025"):
     url = f"https://baseballsavant.mlb.com/stats/career?player_name={pitcher_name}&season={season}&type=pitching"
     
     try:
-        response = requests.get(url, timeout=5)  # 5 seconds timeout
-        
-        if response.status_code != 200:
-            print(f"[ERROR] Failed to fetch pitch arsenal for {pitcher_name}. Status code: {response.status_code}")
-            print(f"Response: {response.text}")
-            return pd.DataFrame()  # Return empty DataFrame in case of error
-        
-        data = response.json()
+        data = _savant_json(url)
         
         if 'arsenal' in data:
             df = pd.DataFrame(data['arsenal'])
             df['pitch_type'] = df['pitch_type'].apply(lambda x: x.strip())
+            df.attrs["stale"] = statsapi.is_stale(data)
             return df
         else:
             print(f"[ERROR] Arsenal data missing from Statcast response for {pitcher_name}.")
@@ -79,12 +108,29 @@ def get_pitcher_arsenal_from_statcast(pitcher_name, season="2025"):
 
 # --- Get Player ID using the Stats API ---
 def get_player_id(first_name, last_name):
+    # Resolved in memory from this season's player index; the people search
+    # below is only needed for players who are not on the season's list
+    try:
+        player_id = statsapi.get_player_index().get_id(f"{first_name} {last_name}")
+    except Exception as e:
+        print(f"[ERROR] Player index unavailable: {e}")
+        player_id = None
+    if player_id:
+        return player_id
+
+    # Unknown (e.g. misspelled) names are remembered for a few minutes
+    negative_key = f"people_search:{first_name} {last_name}".lower()
+    negative = statsapi.get_negative_cache()
+    if negative.check(negative_key):
+        return None
+
     search_url = f"https://statsapi.mlb.com/api/v1/people/search?names={first_name}%20{last_name}"
-    response = requests.get(search_url)
+    response = requests.get(search_url, timeout=5)  # 5 seconds timeout
     if response.status_code == 200:
         data = response.json()
         if data.get("people"):
             return data["people"][0]["id"]
+        negative.add(negative_key, statsapi.NOT_FOUND)
     return None
 
 # --- Calculate Advanced Pitching Metrics from Statcast Data ---
@@ -231,44 +277,30 @@ def parse_boxscore(lines):
 
 
 def get_game_state(game_pk):
+    """Live scoreboard state for a game, from its status and linescore."""
     try:
-        game_data = statsapi.boxscore(game_pk)
-        
-        # Debug: Check if the API returned valid data
-        print("Game Data:", game_data)
-
-        if not game_data:
-            print(f"[ERROR] No data returned for gamePk {game_pk}")
-            return None
-
-        inning = game_data.get("inning", "N/A")
-        half = game_data.get("halfInning", "N/A")
-        away_score = game_data["result"]["awayScore"]
-        home_score = game_data["result"]["homeScore"]
-        
-        # Check if we got valid scores
-        if home_score is None or away_score is None:
-            print(f"[ERROR] Invalid scores: Home: {home_score}, Away: {away_score}")
-            return None
-        
-        # Extract win probabilities
-        home_win_probability = game_data["homeTeamWinProbability"]
-        away_win_probability = game_data["awayTeamWinProbability"]
-        
-        game_state = {
-            "inning": inning,
-            "half": half,
-            "away_score": away_score,
-            "home_score": home_score,
-            "home_win_probability": home_win_probability,
-            "away_win_probability": away_win_probability
-        }
-        
-        return game_state
-
+        state = statsapi.linescore_state(game_pk)
     except Exception as e:
-        print(f"[ERROR] Failed to fetch or parse game state for gamePk {game_pk}: {e}")
+        print(f"[ERROR] Failed to fetch game state for gamePk {game_pk}: {e}")
         return None
+    return _scoreboard_state(state)
+
+
+def _scoreboard_state(state):
+    """Convert a statsapi.LinescoreState into the dict render_scoreboard reads."""
+    return {
+        "away_score": state.away_runs,
+        "home_score": state.home_runs,
+        "inning": state.inning,
+        "half": state.half,
+        "count": state.count,
+        "outs": state.outs,
+        "linescore": {
+            "away": {"runs": state.away_runs, "hits": state.away_hits},
+            "home": {"runs": state.home_runs, "hits": state.home_hits},
+        },
+        "status": {"detailedState": state.status},
+    }
 
 def render_scoreboard(game_pk):
     game_state = get_game_state(game_pk)
@@ -340,20 +372,20 @@ def get_pitcher_arsenal_from_statcast(pitcher_name, season="2025"):
     url = f"https://baseballsavant.mlb.com/stats/career?player_name={pitcher_name}&season={season}&type=pitching"
 
     try:
-        response = requests.get(url)
-        data = response.json()
+        data = _savant_json(url)
 
-        if response.status_code == 200 and data:
+        if data:
             if 'arsenal' in data:
                 df = pd.DataFrame(data['arsenal'])
                 # Clean up data, ensure it's in proper format
                 df['pitch_type'] = df['pitch_type'].apply(lambda x: x.strip())
+                df.attrs["stale"] = statsapi.is_stale(data)
                 return df
             else:
                 print("[ERROR] Arsenal data missing from Statcast response.")
                 return pd.DataFrame()
         else:
-            print(f"[ERROR] Statcast response for {pitcher_name} failed with status {response.status_code}")
+            print(f"[ERROR] Empty Statcast response for {pitcher_name}")
             return pd.DataFrame()
     
     except Exception as e:
@@ -368,19 +400,19 @@ def get_batter_performance_by_pitch(batter_name, pitcher_name, season="2025"):
     url = f"https://baseballsavant.mlb.com/stats/career?batter_name={batter_name}&pitcher_name={pitcher_name}&season={season}&type=batting"
 
     try:
-        response = requests.get(url)
-        data = response.json()
+        data = _savant_json(url)
 
-        if response.status_code == 200 and data:
+        if data:
             if 'performance_by_pitch' in data:
                 df = pd.DataFrame(data['performance_by_pitch'])
                 df['pitch_type'] = df['pitch_type'].apply(lambda x: x.strip())
+                df.attrs["stale"] = statsapi.is_stale(data)
                 return df
             else:
                 print("[ERROR] Performance data missing from Statcast response.")
                 return pd.DataFrame()
         else:
-            print(f"[ERROR] Statcast response for {batter_name} vs {pitcher_name} failed with status {response.status_code}")
+            print(f"[ERROR] Empty Statcast response for {batter_name} vs {pitcher_name}")
             return pd.DataFrame()
     
     except Exception as e:
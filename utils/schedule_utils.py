@@ -10,7 +10,10 @@ def fetch_schedule_for_date(date_str):
     """Fetches the MLB schedule for a given date."""
     try:
         # Use statsapi to fetch the schedule for the specific date
-        schedule = statsapi.schedule(date=date_str)
+        schedule = statsapi.schedule(
+            date=date_str,
+            projection=["game_id", "game_date", "home_name", "away_name"],
+        )
         if not schedule:
             print(f"[ERROR] No games found for {date_str}.")
             return None
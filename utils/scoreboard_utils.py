@@ -9,6 +9,7 @@ from utils.mlb_api import get_game_state
 from utils.schedule_utils import fetch_and_return_schedule
 from streamlit_autorefresh import st_autorefresh
 import streamlit as st
+import statsapi
 import pytz
 import pandas as pd
 import textwrap
@@ -135,3 +136,40 @@ def render_scoreboard(game_pk, home_team="Home", away_team="Away", autorefresh=T
     st.markdown(f'<div style="border:1px solid #444;border-radius:8px;padding:16px;margin:0.5rem 0 1.5rem 0;"><h4 style="margin-bottom:0.5rem;text-align:center;">{display_title}</h4><div style="display:flex;justify-content:center;"><div style="display:flex;flex-direction:row;align-items:center;gap:36px;flex-wrap:wrap;max-width:800px;"><div style="min-width:240px;">{count_html}<p style="margin:0.25rem 0;"><strong>{away_team}</strong>: {away_score} R / {away.get("hits", 0)} H / {away.get("xba", ".000")}</p><p style="margin:0.25rem 0;"><strong>{home_team}</strong>: {home_score} R / {home.get("hits", 0)} H / {home.get("xba", ".000")}</p></div></div></div></div>', unsafe_allow_html=True)
 
 
+
+
+def render_slate_scoreboard(date_str=None, autorefresh=True, columns=3):
+    """Scoreboard grid for every game on a date, from one schedule request per refresh."""
+    if autorefresh:
+        st_autorefresh(interval=15 * 1000, key=f"autorefresh-slate-{date_str}")
+
+    try:
+        games = statsapi.slate_state(date_str)
+    except Exception as e:
+        st.error(f"[ERROR] Failed to fetch scoreboard: {e}")
+        return
+    if not games:
+        st.info("No games on this date.")
+        return
+
+    est = pytz.timezone("US/Eastern")
+    for row_start in range(0, len(games), columns):
+        cols = st.columns(columns)
+        for col, game in zip(cols, games[row_start:row_start + columns]):
+            state = game["state"]
+            if state.is_final:
+                title = f"F/{state.inning}" if state.inning > 9 else "Final"
+            elif state.inning and state.status == "In Progress":
+                title = f"{state.half} {state.inning_ordinal}"
+            else:
+                try:
+                    start = pd.to_datetime(game["game_datetime"]).tz_convert(est)
+                    title = f"{state.status}: {start.strftime('%I:%M %p EST')}"
+                except Exception:
+                    title = state.status
+
+            count_html = ""
+            if state.status == "In Progress":
+                count_html = f'<p style="margin:0.25rem 0;color:#aaa;">{state.count}, {state.outs} out</p>'
+
+            col.markdown(f'<div style="border:1px solid #444;border-radius:8px;padding:12px;margin:0.25rem 0 1rem 0;"><h5 style="margin-bottom:0.5rem;text-align:center;">{title}</h5><p style="margin:0.25rem 0;"><strong>{game["away_name"]}</strong>: {state.away_runs} R / {state.away_hits} H</p><p style="margin:0.25rem 0;"><strong>{game["home_name"]}</strong>: {state.home_runs} R / {state.home_hits} H</p>{count_html}</div>', unsafe_allow_html=True)
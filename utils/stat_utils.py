@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import statsapi
 from datetime import datetime
 from utils.mlb_api import (
     get_pitcher_arsenal_from_statcast,
@@ -13,6 +14,22 @@ PITCH_TYPE_MAP = {
     "KC": "Knuckle Curve", "ST": "Sweeper", "SV": "Slurve"
 }
 
+
+def pitch_type_name(code):
+    """Display name for a Statcast pitch type code.
+
+    Codes missing from PITCH_TYPE_MAP are decoded from the pitchTypes meta
+    data, which statsapi keeps in memory and on disk. If it is unavailable,
+    the code itself is returned.
+    """
+    if code in PITCH_TYPE_MAP:
+        return PITCH_TYPE_MAP[code]
+    try:
+        return statsapi.meta_name("pitchTypes", code, code)
+    except Exception:
+        # No meta data yet and the API is down; statsapi backs off retrying
+        return code
+
 @st.cache_data(ttl=600)
 def get_pitcher_stats(pitcher_id: int, start_date="2024-03-01", end_date=None) -> pd.DataFrame:
     """
@@ -48,7 +65,7 @@ def get_batter_k_rate_by_pitch(batter_id: int, start_date="2024-03-01", end_date
     k_rate = grouped.apply(lambda x: (x["events"] == "strikeout").sum() / len(x) * 100).round(2)
 
     return {
-        PITCH_TYPE_MAP.get(pitch, pitch): f"{k_rate.get(pitch, 0.0):.2f}%"
+        pitch_type_name(pitch): f"{k_rate.get(pitch, 0.0):.2f}%"
         for pitch in df["pitch_type"].unique()
     }
 
@@ -78,7 +95,7 @@ def get_batter_metrics_by_pitch(batter_id: int, start_date="2024-03-01", end_dat
         "K_rate": "K%", "Whiff_rate": "Whiff%", "PutAway_rate": "PutAway%"
     })
 
-    summary.index = summary.index.map(lambda code: PITCH_TYPE_MAP.get(code, code))
+    summary.index = summary.index.map(pitch_type_name)
     return summary.reset_index().rename(columns={"index": "pitch_type"})
 
 